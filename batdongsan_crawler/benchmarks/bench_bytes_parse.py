@@ -0,0 +1,71 @@
+"""
+Benchmark: str vs bytes hand-off from the HTTP client to the parser.
+
+Text mode reproduces the old pipeline (decode the response body to str,
+then BeautifulSoup/lxml re-encodes it). Bytes mode passes the raw body
+and charset straight through, as SpiderService does now.
+
+Usage:
+    python benchmarks/bench_bytes_parse.py [--pages 20] [--padding-kb 400]
+"""
+import argparse
+import time
+import tracemalloc
+
+from batdongsan.infrastructure.parsers import BatDongSanParser
+
+from pages import listing_page
+
+
+def parse(parser: BatDongSanParser, body: bytes, as_text: bool):
+    """Hand one response body to the parser the old or the new way"""
+    if as_text:
+        return parser.parse_listing_page(body.decode("utf-8"), {})
+    return parser.parse_listing_page(body, {}, encoding="utf-8")
+
+
+def measure(parser: BatDongSanParser, bodies, as_text: bool):
+    """
+    Return (mean peak bytes, mean seconds, listings) per page.
+    
+    Timing is taken in a separate pass, since tracemalloc slows
+    allocation-heavy code down unevenly.
+    """
+    started = time.perf_counter()
+    listings = sum(len(parse(parser, body, as_text)) for body in bodies)
+    seconds = (time.perf_counter() - started) / len(bodies)
+    
+    peaks = []
+    for body in bodies:
+        tracemalloc.start()
+        parse(parser, body, as_text)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        peaks.append(peak)
+    return sum(peaks) / len(peaks), seconds, listings
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--pages", type=int, default=20)
+    arg_parser.add_argument("--padding-kb", type=int, default=400)
+    args = arg_parser.parse_args()
+    
+    bodies = [listing_page(p, padding_kb=args.padding_kb) for p in range(1, args.pages + 1)]
+    size_kb = sum(len(b) for b in bodies) / len(bodies) / 1024
+    parser = BatDongSanParser()
+    parser.parse_listing_page(bodies[0], {}, encoding="utf-8")  # warm up imports
+    
+    print(f"{args.pages} pages, {size_kb:.0f} KB each")
+    print(f"{'mode':<8}{'peak alloc/page':>18}{'time/page':>14}{'listings':>10}")
+    results = {}
+    for mode, as_text in (("text", True), ("bytes", False)):
+        peak, seconds, listings = measure(parser, bodies, as_text)
+        results[mode] = peak
+        print(f"{mode:<8}{peak / 1024 / 1024:>15.2f} MB{seconds * 1000:>11.1f} ms{listings:>10}")
+    saved = 1 - results["bytes"] / results["text"]
+    print(f"bytes mode peak allocation: {saved:.0%} lower")
+
+
+if __name__ == "__main__":
+    main()
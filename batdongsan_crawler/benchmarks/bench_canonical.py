@@ -0,0 +1,87 @@
+"""
+Benchmark: URL canonicalization and hashing throughput.
+
+Builds N URLs the way a crawl sees them: listing pages with shuffled
+query parameters and tracking tags, detail URLs under several slugs,
+and a share of exact repeats (the same URL hashed again by the cache,
+coalescer and frontier). Each key function hashes all of them; the
+report shows URLs per second and how many distinct pages it found.
+
+Usage:
+    python benchmarks/bench_canonical.py [--urls 1000000] [--repeat 0.5]
+"""
+import argparse
+import hashlib
+import random
+import time
+from urllib.parse import urlparse
+
+from batdongsan.infrastructure.storage.canonical import UrlCanonicalizer
+
+
+IGNORED = ["utm_*", "fbclid", "gclid", "ref", "sessionid"]
+CATEGORIES = ["ban-can-ho-chung-cu", "ban-nha-rieng", "cho-thue-nha-tro-phong-tro", "ban-dat"]
+CITIES = ["ha-noi", "tp-hcm", "da-nang", "hai-phong"]
+
+
+def old_fingerprint(url: str) -> str:
+    """The previous key: scheme/netloc/path/query as-is, MD5"""
+    parsed = urlparse(url)
+    normalized = f"{parsed.scheme}://{parsed.netloc}{parsed.path.rstrip('/')}"
+    if parsed.query:
+        normalized += f"?{parsed.query}"
+    return hashlib.md5(normalized.encode()).hexdigest()
+
+
+def crawl_urls(count: int, repeat: float, seed: int):
+    rng = random.Random(seed)
+    urls = []
+    for _ in range(count):
+        if urls and rng.random() < repeat:
+            urls.append(urls[rng.randrange(max(0, len(urls) - 5000), len(urls))])
+            continue
+        host = rng.choice(["batdongsan.com.vn", "BatDongSan.com.vn", "batdongsan.com.vn:443"])
+        if rng.random() < 0.3:
+            params = [("gia", str(rng.randrange(1, 20))), ("dt", str(rng.randrange(30, 120)))]
+            rng.shuffle(params)
+            if rng.random() < 0.5:
+                params.append(("utm_source", rng.choice(["fb", "zalo", "google"])))
+            query = "&".join(f"{name}={value}" for name, value in params)
+            urls.append(f"https://{host}/{rng.choice(CATEGORIES)}/p{rng.randrange(1, 50)}?{query}")
+        else:
+            listing_id = rng.randrange(1, 200_000)
+            slug = f"{rng.choice(CATEGORIES)}-{rng.choice(CITIES)}"
+            tail = rng.choice(["", "/", "?fbclid=x" + str(rng.randrange(1000))])
+            urls.append(f"https://{host}/{slug}-pr{listing_id}{tail}")
+    return urls
+
+
+def run(name, key, urls):
+    started = time.perf_counter()
+    keys = set(map(key, urls))
+    elapsed = time.perf_counter() - started
+    print(f"{name:<26}{len(urls) / elapsed:>12,.0f}{len(keys):>12,}")
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--urls", type=int, default=1_000_000)
+    arg_parser.add_argument("--repeat", type=float, default=0.5,
+                            help="Share of URLs that repeat a recent one")
+    arg_parser.add_argument("--cache-size", type=int, default=65536)
+    args = arg_parser.parse_args()
+    
+    print(f"Generating {args.urls:,} URLs ({args.repeat:.0%} repeats)...")
+    urls = crawl_urls(args.urls, args.repeat, seed=1)
+    print()
+    
+    print(f"{'key':<26}{'URLs/s':>12}{'pages':>12}")
+    run("md5 (old)", old_fingerprint, urls)
+    run("canonical", UrlCanonicalizer(IGNORED, cache_size=0).digest, urls)
+    memoized = UrlCanonicalizer(IGNORED, cache_size=args.cache_size)
+    run(f"canonical + LRU {args.cache_size}", memoized.digest, urls)
+    print(f"\n{memoized.cache_info()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+Benchmark: HTTP/1.1 vs multiplexed HTTP/2 in CurlCffiClient.
+
+Starts a local HTTP/2-capable server (hypercorn, cleartext h2 with prior
+knowledge) in a separate process serving generated listing pages with a
+fixed server-side latency, then fetches the same URLs with
+- http_version=1.1 (one connection per in-flight request), and
+- http_version=2-prior-knowledge with multiplexing over a few connections,
+reporting throughput, p50/p95 latency and connections opened.
+
+Requires hypercorn (not a crawler dependency), from the bench extra:
+    pip install -e ".[bench]"
+
+Usage:
+    python benchmarks/bench_http2.py [--requests 400] [--concurrent 32]
+        [--connections 2] [--latency-ms 50] [--padding-kb 100]
+"""
+import argparse
+import asyncio
+import multiprocessing
+import socket
+import statistics
+import time
+from typing import List
+
+from batdongsan.infrastructure.http import CurlCffiClient
+
+from pages import listing_page
+
+
+def serve(port: int, latency_ms: float, padding_kb: int) -> None:
+    """Run the hypercorn server (child process)"""
+    from hypercorn.asyncio import serve as hypercorn_serve
+    from hypercorn.config import Config
+    
+    pages = [listing_page(p, padding_kb=padding_kb) for p in range(1, 21)]
+    
+    async def app(scope, receive, send):
+        if scope["type"] != "http":
+            return
+        page = int(scope["path"].rsplit("p", 1)[-1] or 1)
+        body = pages[page % len(pages)]
+        await asyncio.sleep(latency_ms / 1000)
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [
+                (b"content-type", b"text/html; charset=utf-8"),
+                (b"content-length", str(len(body)).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
+        
+    config = Config()
+    config.bind = [f"127.0.0.1:{port}"]
+    config.loglevel = "WARNING"
+    config.h2_max_concurrent_streams = 256
+    asyncio.run(hypercorn_serve(app, config))
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def wait_for_port(port: int, timeout: float = 10.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError("Benchmark server did not start")
+
+
+async def run(client: CurlCffiClient, urls: List[str], concurrent: int):
+    """Fetch every URL, returning (seconds, latencies, failures)"""
+    latencies, failures = [], 0
+    started = time.perf_counter()
+    async for result in client.get_many(urls, limit=concurrent):
+        if result.ok:
+            latencies.append(result.timings.total)
+        else:
+            failures += 1
+    seconds = time.perf_counter() - started
+    await client.close()
+    return seconds, latencies, failures
+
+
+def percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] if ordered else 0.0
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--requests", type=int, default=400)
+    arg_parser.add_argument("--concurrent", type=int, default=32)
+    arg_parser.add_argument("--connections", type=int, default=2,
+                            help="Connections HTTP/2 requests are multiplexed over")
+    arg_parser.add_argument("--latency-ms", type=float, default=50.0)
+    arg_parser.add_argument("--padding-kb", type=int, default=100)
+    args = arg_parser.parse_args()
+    
+    try:
+        import hypercorn  # noqa: F401
+    except ImportError:
+        raise SystemExit('bench_http2 needs hypercorn: pip install -e ".[bench]"')
+        
+    port = free_port()
+    server = multiprocessing.Process(
+        target=serve, args=(port, args.latency_ms, args.padding_kb), daemon=True
+    )
+    server.start()
+    try:
+        wait_for_port(port)
+        urls = [f"http://127.0.0.1:{port}/ban-can-ho-chung-cu/p{i}"
+                for i in range(1, args.requests + 1)]
+        modes = (
+            ("HTTP/1.1", dict(http_version="1.1", multiplex_connections=0)),
+            ("HTTP/2", dict(http_version="2-prior-knowledge",
+                            multiplex_connections=args.connections)),
+        )
+        print(f"{args.requests} requests, {args.concurrent} in flight, "
+              f"{args.latency_ms:.0f} ms server latency")
+        print(f"{'mode':<10}{'req/s':>9}{'p50':>10}{'p95':>10}{'conns':>8}{'failed':>8}")
+        for name, options in modes:
+            client = CurlCffiClient(max_clients=args.concurrent, **options)
+            seconds, latencies, failures = asyncio.run(run(client, urls, args.concurrent))
+            print(f"{name:<10}{len(latencies) / seconds:>9.1f}"
+                  f"{statistics.median(latencies) * 1000 if latencies else 0:>8.1f}ms"
+                  f"{percentile(latencies, 0.95) * 1000:>8.1f}ms"
+                  f"{client.stats()['connections_opened']:>8}{failures:>8}")
+    finally:
+        server.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Benchmark: CPU per page of the parser backends.
+
+Parses every page of a corpus (see benchmarks/corpus.py) with each
+backend the way SpiderService does: listing pages through
+parse_listing_page and parse_last_page, detail pages through
+parse_detail_page. Reports mean time per page by page type.
+
+Usage:
+    python benchmarks/bench_parsers.py [--archive DIR | --pages-dir DIR]
+        [--rounds 3] [--backends bs4,lxml]
+"""
+import argparse
+import time
+
+from batdongsan.domain.interfaces import UrlType
+from batdongsan.infrastructure.parsers import BatDongSanParser, LxmlBatDongSanParser
+
+from corpus import load_corpus
+
+
+BACKENDS = {
+    "bs4": BatDongSanParser,
+    "lxml": LxmlBatDongSanParser,
+}
+
+
+def parse(parser, page) -> int:
+    """Parse one page as the spider would; returns listings found"""
+    if page.url_type is UrlType.LISTING_PAGE:
+        listings = parser.parse_listing_page(page.body, {}, encoding=page.encoding)
+        parser.parse_last_page(page.body, encoding=page.encoding)
+        return len(listings)
+    return 1 if parser.parse_detail_page(page.body, page.url, encoding=page.encoding) else 0
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--archive", help="Archive recorded with `crawl --record`")
+    arg_parser.add_argument("--pages-dir", help="Directory of saved .html pages")
+    arg_parser.add_argument(
+        "--rounds", type=int, default=3, help="Passes over the corpus (best kept)"
+    )
+    arg_parser.add_argument("--backends", default="bs4,lxml")
+    args = arg_parser.parse_args()
+    
+    pages = load_corpus(args.archive, args.pages_dir)
+    by_type = {
+        url_type: [page for page in pages if page.url_type is url_type]
+        for url_type in UrlType
+    }
+    size_kb = sum(len(page.body) for page in pages) / len(pages) / 1024
+    print(f"{len(pages)} pages, {size_kb:.0f} KB on average\n")
+    
+    print(f"{'backend':<8}{'type':<14}{'pages':>7}{'ms/page':>10}{'pages/s':>10}{'listings':>10}")
+    baseline = {}
+    for name in args.backends.split(","):
+        parser = BACKENDS[name]()
+        for url_type, typed_pages in by_type.items():
+            if not typed_pages:
+                continue
+            parse(parser, typed_pages[0])   # warm up imports and caches
+            best = float("inf")
+            for _ in range(max(1, args.rounds)):
+                started = time.perf_counter()
+                listings = sum(parse(parser, page) for page in typed_pages)
+                best = min(best, time.perf_counter() - started)
+            per_page = best / len(typed_pages)
+            speedup = ""
+            if url_type in baseline:
+                speedup = f"  ({baseline[url_type] / per_page:.1f}x)"
+            else:
+                baseline[url_type] = per_page
+            print(f"{name:<8}{url_type.name.lower():<14}{len(typed_pages):>7}"
+                  f"{per_page * 1000:>10.2f}{1 / per_page:>10.0f}{listings:>10}{speedup}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Benchmark: full spider pipeline replayed from a recorded archive.
+
+Runs SpiderService, BatDongSanParser and storage against an archive
+written with `batdongsan crawl --record DIR`, with no network access, so
+runs on different machines or commits see identical inputs.
+Without an archive, a synthetic one is generated from benchmarks/pages.py.
+
+Usage:
+    python benchmarks/bench_replay.py [--archive DIR] [--pages 200]
+        [--concurrent 8] [--latency 0.0] [--error-rate 0.0] [--profile]
+"""
+import argparse
+import asyncio
+import cProfile
+import pstats
+import tempfile
+import time
+
+from batdongsan.container import create_container
+from batdongsan.domain.interfaces import CrawlUrl, FetchResult, UrlType
+from batdongsan.infrastructure import settings
+from batdongsan.infrastructure.http import HttpArchive
+from batdongsan.infrastructure.http.cache import guess_url_type
+
+from pages import listing_page
+
+
+def write_synthetic_archive(path: str, pages: int) -> None:
+    """Record generated listing pages as if they had been crawled"""
+    archive = HttpArchive(path)
+    for page in range(1, pages + 1):
+        archive.append(FetchResult(
+            url=f"{settings.base_url}/ban-can-ho-chung-cu/p{page}",
+            status=200,
+            headers={"content-type": "text/html; charset=utf-8"},
+            content=listing_page(page),
+            encoding="utf-8",
+        ))
+    archive.close()
+
+
+def run(args, archive_path: str, output_dir: str):
+    """Replay every recorded listing page through a fresh container"""
+    settings.replay_latency = args.latency
+    settings.replay_error_rate = args.error_rate
+    container = create_container(
+        output_dir=output_dir,
+        max_concurrent=args.concurrent,
+        crawl_details=False,
+        replay_path=archive_path,
+    )
+    for entry in HttpArchive(archive_path).entries():
+        if guess_url_type(entry["url"]) is UrlType.LISTING_PAGE:
+            container.frontier.add(CrawlUrl(url=entry["url"], url_type=UrlType.LISTING_PAGE))
+            
+    started = time.perf_counter()
+    result = asyncio.run(container.spider_service.run())
+    return result, time.perf_counter() - started
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--archive", help="Archive recorded with crawl --record")
+    arg_parser.add_argument("--pages", type=int, default=200, help="Synthetic archive size")
+    arg_parser.add_argument("--concurrent", type=int, default=8)
+    arg_parser.add_argument("--latency", type=float, default=0.0)
+    arg_parser.add_argument("--error-rate", type=float, default=0.0)
+    arg_parser.add_argument("--profile", action="store_true", help="Print top cProfile entries")
+    args = arg_parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        archive_path = args.archive
+        if archive_path is None:
+            archive_path = f"{tmp}/archive"
+            write_synthetic_archive(archive_path, args.pages)
+            
+        profiler = cProfile.Profile() if args.profile else None
+        if profiler:
+            profiler.enable()
+        result, seconds = run(args, archive_path, f"{tmp}/output")
+        if profiler:
+            profiler.disable()
+            
+    print()
+    print(f"pages: {result.pages_crawled}  listings: {result.total_found}  "
+          f"errors: {result.errors}  retries: {result.retries}")
+    print(f"wall: {seconds:.2f}s  throughput: {result.pages_crawled / seconds * 60:.0f} pages/min")
+    if profiler:
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(25)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Benchmark: per-card extraction cost of the compiled schema.
+
+Parses listing pages once, then times only field extraction for every
+card (page parsing excluded):
+
+- bs4: BatDongSanParser._parse_card, select_one() chains on a
+  BeautifulSoup card
+- uncompiled: the same schema, every selector translated and run with
+  element.xpath() for each field of each card, with no sharing (field
+  values only, so it skips building the PropertyListing)
+- compiled: LxmlBatDongSanParser._parse_card, the compiled plan
+
+Usage:
+    python benchmarks/bench_schema.py [--pages 20] [--rounds 5]
+"""
+import argparse
+import time
+
+from bs4 import BeautifulSoup
+
+from batdongsan.infrastructure.parsers import BatDongSanParser, LxmlBatDongSanParser
+from batdongsan.infrastructure.parsers.batdongsan_schema import BATDONGSAN
+from batdongsan.infrastructure.parsers.schema import css_to_xpath, element_text
+
+from pages import listing_page
+
+
+def uncompiled_card(card) -> dict:
+    """Card fields with per-call XPath strings: first hit per field, nothing shared"""
+    values = {}
+    for name, spec in BATDONGSAN.card.items():
+        found = []
+        for selector in spec.selectors:
+            found = card.xpath(css_to_xpath(selector))
+            if found:
+                break
+        if not found:
+            values[name] = spec.default
+            continue
+        hows = [spec.extract] if isinstance(spec.extract, str) else spec.extract
+        value = None
+        for how in hows:
+            if how == "text":
+                value = element_text(found[0])
+            elif how == "exists":
+                value = True
+            else:
+                value = found[0].get(how[1:], "")
+            if value:
+                break
+        values[name] = spec.post(value) if spec.post else value
+    return values
+
+
+def timed(function, items, rounds: int) -> float:
+    """Best seconds per item over `rounds` passes"""
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for item in items:
+            function(item)
+        best = min(best, time.perf_counter() - started)
+    return best / len(items)
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--pages", type=int, default=20)
+    arg_parser.add_argument("--rounds", type=int, default=5)
+    args = arg_parser.parse_args()
+    
+    bodies = [listing_page(page, padding_kb=0) for page in range(1, args.pages + 1)]
+    bs4_parser, lxml_parser = BatDongSanParser(), LxmlBatDongSanParser()
+    soup_cards = [
+        card for body in bodies for card in BeautifulSoup(body, "lxml").select(".js__card")
+    ]
+    lxml_cards = [
+        card for body in bodies
+        for card in lxml_parser._cards.extract(lxml_parser._make_tree(body, "utf-8"))["cards"]
+    ]
+    print(f"{len(lxml_cards)} cards; card plan: {lxml_parser._card}\n")
+    
+    print(f"{'extraction':<12}{'us/card':>10}{'cards/s':>12}")
+    baseline = None
+    for name, function, cards in (
+        ("bs4", lambda card: bs4_parser._parse_card(card, {}), soup_cards),
+        ("uncompiled", uncompiled_card, lxml_cards),
+        ("compiled", lambda card: lxml_parser._parse_card(card, {}), lxml_cards),
+    ):
+        per_card = timed(function, cards, args.rounds)
+        baseline = baseline or per_card
+        speedup = baseline / per_card
+        print(f"{name:<12}{per_card * 1e6:>10.1f}{1 / per_card:>12,.0f}  ({speedup:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Benchmark: memory and throughput of the frontier's seen-set backends.
+
+Inserts N distinct 64-bit digests (what the frontier derives from each
+normalized URL) into each backend, then re-adds a sample of them as
+duplicates, reporting bytes per URL and operations per second.
+The old hex-string set is estimated for comparison.
+
+Usage:
+    python benchmarks/bench_seen_set.py [--urls 10000000] [--backends set,digest]
+"""
+import argparse
+import math
+import random
+import sys
+import time
+
+from batdongsan.infrastructure.storage import DigestSeenSet, PySeenSet
+
+
+BACKENDS = {
+    "set": PySeenSet,
+    "digest": DigestSeenSet,
+}
+
+
+def digests(count: int, seed: int):
+    rng = random.Random(seed)
+    return [rng.getrandbits(64) for _ in range(count)]
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--urls", type=int, default=10_000_000)
+    arg_parser.add_argument("--duplicates", type=int, default=1_000_000,
+                            help="Already-seen digests re-added per backend")
+    arg_parser.add_argument("--backends", default="set,digest")
+    args = arg_parser.parse_args()
+    
+    print(f"Generating {args.urls:,} digests...")
+    keys = digests(args.urls, seed=1)
+    sample = keys[:min(args.duplicates, args.urls)]
+    
+    # Set table of 16-byte entries kept under 60% full, plus a 32-char str per URL
+    table_bytes = 16 * (1 << math.ceil(math.log2(args.urls / 0.6)))
+    hex_bytes = table_bytes + args.urls * sys.getsizeof("0" * 32)
+    print(f"hex-string set (old): ~{hex_bytes / args.urls:.0f} B/URL (estimated)\n")
+    
+    print(f"{'backend':<8}{'MB':>9}{'B/URL':>8}{'adds/s':>12}{'dups/s':>12}")
+    for name in args.backends.split(","):
+        seen = BACKENDS[name]()
+        add = seen.add
+        started = time.perf_counter()
+        for key in keys:
+            add(key)
+        add_rate = len(keys) / (time.perf_counter() - started)
+        
+        started = time.perf_counter()
+        missed = sum(1 for key in sample if add(key))
+        dup_rate = len(sample) / (time.perf_counter() - started)
+        assert missed == 0, f"{name} forgot {missed} digests"
+        
+        print(f"{name:<8}{seen.nbytes / 1024 / 1024:>9.1f}{seen.nbytes / args.urls:>8.1f}"
+              f"{add_rate:>12,.0f}{dup_rate:>12,.0f}")
+        del seen
+
+
+if __name__ == "__main__":
+    main()
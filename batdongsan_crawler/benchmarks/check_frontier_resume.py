@@ -0,0 +1,141 @@
+"""
+Resume check: nothing a crawl did not finish is lost to --resume.
+
+Exercises SqliteUrlFrontier directly (lease, complete, release, crash,
+reopen, a lease held for hours), then runs SpiderService against clients that never finish a
+page before the deadline: one whose fetches fail faster than a retry
+could fit (abandoned) and one whose fetches outlive the deadline
+(cancelled workers). After each run the frontier is reopened and every
+seed must be queued again. Exits non-zero on any failure.
+
+Usage:
+    python benchmarks/check_frontier_resume.py
+"""
+import asyncio
+import contextlib
+import io
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+from unittest import mock
+
+from batdongsan.application import HostRateLimiter, SpiderService
+from batdongsan.domain.exceptions import FailureKind
+from batdongsan.domain.interfaces import CrawlUrl, FetchResult, IHttpClient, UrlType
+from batdongsan.infrastructure import BatDongSanParser, JsonLinesStorage, SqliteUrlFrontier
+
+
+failures: List[str] = []
+
+
+def check(condition: bool, message: str) -> None:
+    """Record a failed expectation"""
+    print(f"  [{'ok' if condition else 'FAIL'}] {message}")
+    if not condition:
+        failures.append(message)
+
+
+def queued_urls(path: Path) -> List[str]:
+    """Reopen a run and drain what it would crawl"""
+    frontier = SqliteUrlFrontier(str(path))
+    urls = []
+    while (crawl_url := frontier.get()) is not None:
+        urls.append(crawl_url.url)
+    frontier.close()
+    return sorted(urls)
+
+
+def check_long_lease(directory: Path) -> None:
+    """A URL stays leased while its worker holds it, however long that takes"""
+    print("Frontier: lease held across a long wait")
+    frontier = SqliteUrlFrontier(str(directory / "long-lease.sqlite"))
+    frontier.add(CrawlUrl(url="https://example.com/slow", url_type=UrlType.LISTING_PAGE))
+    frontier.get()
+    later = time.time() + 86400
+    with mock.patch("batdongsan.infrastructure.storage.sqlite_frontier.time.time",
+                    return_value=later):
+        check(frontier.get() is None, "leased URL not handed out again a day later")
+        check(frontier.pending_count == 1, "lease still held")
+    frontier.close()
+
+
+def check_frontier(directory: Path) -> None:
+    """Completed URLs stay done; released and crashed leases come back"""
+    print("Frontier: lease, complete, release, crash, reopen")
+    path = directory / "frontier.sqlite"
+    frontier = SqliteUrlFrontier(str(path))
+    for name in ("done", "released", "crashed"):
+        frontier.add(CrawlUrl(url=f"https://example.com/{name}", url_type=UrlType.LISTING_PAGE))
+    taken = {frontier.get().url: None for _ in range(3)}
+    frontier.complete("https://example.com/done")
+    frontier.release("https://example.com/released")
+    check(len(taken) == 3, "three URLs leased")
+    check(frontier.released_count == 1, "released URL set aside")
+    check(frontier.get() is None, "released URL not handed out again in the same run")
+    frontier.close()    # "crashed" is still leased, as after a kill
+    
+    check(queued_urls(path) == ["https://example.com/crashed", "https://example.com/released"],
+          "reopened run queues the released and the crashed URL, not the completed one")
+
+
+class FailingClient(IHttpClient):
+    """Every fetch fails at once, as a timeout"""
+    
+    async def fetch(self, url: str, headers: Optional[Dict[str, str]] = None) -> FetchResult:
+        return FetchResult(url=url, error=FailureKind.TRANSIENT, error_message="Timeout")
+    
+    async def close(self) -> None:
+        return None
+
+
+class StalledClient(IHttpClient):
+    """Every fetch outlives the crawl deadline"""
+    
+    async def fetch(self, url: str, headers: Optional[Dict[str, str]] = None) -> FetchResult:
+        await asyncio.sleep(3600)
+        raise AssertionError("unreachable")
+    
+    async def close(self) -> None:
+        return None
+
+
+def check_spider(directory: Path, name: str, client: IHttpClient, deadline: float) -> None:
+    """A crawl that finishes nothing leaves every seed queued for --resume"""
+    print(f"Spider: {name}")
+    path = directory / f"{name}.sqlite"
+    frontier = SqliteUrlFrontier(str(path))
+    spider = SpiderService(
+        http_client=client,
+        parser=BatDongSanParser(),
+        storage=JsonLinesStorage(str(directory / "out")),
+        frontier=frontier,
+        max_concurrent=2,
+        rate_limiter=HostRateLimiter(0),
+        deadline=deadline,
+        adaptive_pagination=False,
+    )
+    spider.add_seed_urls(property_types=["nha-rieng"], max_pages=3)
+    seeds = sorted(spider._page_url(f"{spider.BASE_URL}/ban-nha-rieng", page) for page in (1, 2, 3))
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = asyncio.run(spider.run())
+        
+    check(result.pages_crawled == 0, "no page finished before the deadline")
+    check(queued_urls(path) == seeds, "every seed is queued again on resume")
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as temp:
+        directory = Path(temp)
+        check_frontier(directory)
+        check_long_lease(directory)
+        check_spider(directory, "abandoned", FailingClient(), deadline=0.5)
+        check_spider(directory, "cancelled", StalledClient(), deadline=0.3)
+        
+    print(f"{len(failures)} failed checks")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
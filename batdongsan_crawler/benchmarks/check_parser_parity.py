@@ -0,0 +1,123 @@
+"""
+Parity check: the lxml parser backend against BatDongSanParser.
+
+Runs both parsers over a corpus and compares everything the spider
+uses: listings from listing pages (every field but crawled_at), detail
+URLs, the pager's last page and detail page listings. Markup edge cases
+(script/comment/template text, entities, other charsets, empty pages)
+are always included. Exits non-zero on any difference.
+
+Usage:
+    python benchmarks/check_parser_parity.py [--archive DIR | --pages-dir DIR]
+"""
+import argparse
+import sys
+from dataclasses import asdict
+
+from batdongsan.domain.interfaces import UrlType
+from batdongsan.infrastructure.parsers import BatDongSanParser, LxmlBatDongSanParser
+
+from corpus import Page, load_corpus
+
+
+EDGE_CARD = """
+<div class="js__card re__verified-badge">
+  <a class="js__product-link-for-product-id"
+     href="https://batdongsan.com.vn/ban-nha-rieng-pr{id}">
+    <img src="/thumb/{id}.jpg">
+    <span class="js__card-title">  Nhà <b>đẹp</b> &amp; rẻ<!-- comment -->
+      <script>var x = 1;</script>
+      <template>hidden</template> Quận 1 </span>
+    <span class="re__card-config-price">{price}</span>
+    <span class="re__card-config-area"> 85,5 m² </span>
+    <div class="re__card-location">Phường Bến Nghé,<style>.x{{}}</style> Quận 1, TP.HCM</div>
+  </a>
+</div>"""
+
+EDGE_DETAIL = """<html><head><meta charset="{charset}"></head><body>
+<h1>Nhà phố <ruby>漢<rt>kan</rt></ruby> Quận 3</h1>
+<div class="re__pr-short-info-item--price"> 12,5 tỷ </div>
+<div class="re__pr-short-description">Đường Lê Lợi, Phường 7, Quận 3, Hồ Chí Minh</div>
+<div class="re__pr-specs-content-item">
+  <span class="re__pr-specs-content-item-title">Diện tích</span>
+  <span class="re__pr-specs-content-item-value">120 m²</span></div>
+<div class="re__pr-specs-content-item">
+  <span class="re__pr-specs-content-item-title">Số phòng ngủ</span></div>
+<div class="re__detail-content">Mô tả<br>dòng hai <script>ignored()</script></div>
+<div class="re__contact-name">  Anh Minh </div><a href="tel:0909123456">Gọi</a>
+<div class="re__media-thumb-item"><img data-src="/a.jpg"></div>
+<div class="re__media-thumb-item"><img src="/b.jpg"></div>
+</body></html>"""
+
+
+def edge_pages():
+    """Hand-written markup that differs between naive text extraction and BeautifulSoup"""
+    cards = "".join(EDGE_CARD.format(id=9000 + i, price=price)
+                    for i, price in enumerate(["3,2 tỷ", "15 triệu/tháng", "Thỏa thuận"]))
+    listing = f"<html><body>{cards}<div class='ProductItem'>x</div></body></html>"
+    listing_url = "https://batdongsan.com.vn/ban-nha-rieng"
+    detail_url = "https://batdongsan.com.vn/ban-nha-pho-pr9100"
+    detail = EDGE_DETAIL.format(charset="utf-8").encode()
+    return [
+        Page(listing_url, UrlType.LISTING_PAGE, listing.encode(), "utf-8"),
+        Page(listing_url, UrlType.LISTING_PAGE, listing.encode(), None),
+        Page(f"{listing_url}/p2", UrlType.LISTING_PAGE, b"", "utf-8"),
+        Page(detail_url, UrlType.DETAIL_PAGE, detail, None),
+        Page(detail_url, UrlType.DETAIL_PAGE,
+             EDGE_DETAIL.format(charset="utf-16").encode("utf-16"), "utf-16"),
+        Page(detail_url, UrlType.DETAIL_PAGE, b"<html><body><p>no listing</p></body></html>", None),
+        Page(detail_url, UrlType.DETAIL_PAGE, b"", None),
+        Page(detail_url, UrlType.DETAIL_PAGE, detail, "no-such-charset"),
+    ]
+
+
+def comparable(listing):
+    """Listing fields that must match (crawled_at differs between any two parses)"""
+    if listing is None:
+        return None
+    fields = asdict(listing)
+    del fields["crawled_at"]
+    return fields
+
+
+def outputs(parser, page: Page):
+    """What the spider takes from a page"""
+    if page.url_type is UrlType.LISTING_PAGE:
+        return {
+            "listings": [comparable(listing) for listing in
+                         parser.parse_listing_page(page.body, {"property_type": "nha-rieng"},
+                                                   encoding=page.encoding)],
+            "detail_urls": parser.extract_detail_urls(page.body, encoding=page.encoding),
+            "last_page": parser.parse_last_page(page.body, encoding=page.encoding),
+        }
+    listing = parser.parse_detail_page(page.body, page.url, encoding=page.encoding)
+    return {"detail": comparable(listing)}
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--archive", help="Archive recorded with `crawl --record`")
+    arg_parser.add_argument("--pages-dir", help="Directory of saved .html pages")
+    args = arg_parser.parse_args()
+    
+    pages = load_corpus(args.archive, args.pages_dir) + edge_pages()
+    reference, candidate = BatDongSanParser(), LxmlBatDongSanParser()
+    mismatches = 0
+    listings = 0
+    for page in pages:
+        expected = outputs(reference, page)
+        actual = outputs(candidate, page)
+        listings += len(expected.get("listings", [])) + (1 if expected.get("detail") else 0)
+        if expected != actual:
+            mismatches += 1
+            print(f"[!] {page.url} ({page.url_type.name})")
+            for key in expected:
+                if expected[key] != actual[key]:
+                    print(f"    {key}:\n      bs4:  {expected[key]}\n      lxml: {actual[key]}")
+                    
+    print(f"{len(pages)} pages, {listings} listings: {mismatches} mismatching pages")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
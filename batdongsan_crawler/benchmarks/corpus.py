@@ -0,0 +1,69 @@
+"""
+Page corpus for parser benchmarks and parity checks.
+
+Pages come from an archive recorded with `batdongsan crawl --record DIR`
+(real pages), a directory of saved .html files, or, without either, the
+synthetic pages of benchmarks/pages.py.
+"""
+import zlib
+from pathlib import Path
+from typing import List, NamedTuple, Optional
+
+from batdongsan.domain.interfaces import UrlType
+from batdongsan.infrastructure import settings
+from batdongsan.infrastructure.http import HttpArchive
+from batdongsan.infrastructure.http.cache import guess_url_type
+
+from pages import detail_page, listing_page
+
+
+class Page(NamedTuple):
+    url: str
+    url_type: UrlType
+    body: bytes
+    encoding: Optional[str]
+
+
+def archive_pages(path: str) -> List[Page]:
+    """Successful HTML responses of a recorded archive"""
+    archive = HttpArchive(path)
+    pages = []
+    with open(archive.path / HttpArchive.BODIES_FILE, "rb") as bodies:
+        for entry in archive.entries():
+            if entry["error"] or entry["status"] != 200 or not entry["length"]:
+                continue
+            bodies.seek(entry["offset"])
+            body = zlib.decompress(bodies.read(entry["length"]))
+            pages.append(Page(entry["url"], guess_url_type(entry["url"]), body, entry["encoding"]))
+    return pages
+
+
+def directory_pages(path: str) -> List[Page]:
+    """Saved pages, one .html file each (charset taken from the markup)"""
+    pages = []
+    for file in sorted(Path(path).glob("*.html")):
+        url = f"{settings.base_url}/{file.stem}"
+        pages.append(Page(url, guess_url_type(url), file.read_bytes(), None))
+    return pages
+
+
+def synthetic_pages(listings: int = 20, details: int = 20) -> List[Page]:
+    """Generated listing and detail pages"""
+    pages = []
+    for page in range(1, listings + 1):
+        url = f"{settings.base_url}/ban-can-ho-chung-cu/p{page}"
+        body = listing_page(page, last_page=listings)
+        pages.append(Page(url, UrlType.LISTING_PAGE, body, "utf-8"))
+    for listing_id in range(1000, 1000 + details):
+        url = f"{settings.base_url}/ban-can-ho-chung-cu-duong-{listing_id % 97}-pr{listing_id}"
+        pages.append(Page(url, UrlType.DETAIL_PAGE, detail_page(listing_id), "utf-8"))
+    return pages
+
+
+def load_corpus(archive: Optional[str] = None, pages_dir: Optional[str] = None) -> List[Page]:
+    """Pages from the archive or directory given, else synthetic ones"""
+    if archive:
+        return archive_pages(archive)
+    if pages_dir:
+        return directory_pages(pages_dir)
+    return synthetic_pages()
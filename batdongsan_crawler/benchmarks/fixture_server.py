@@ -0,0 +1,231 @@
+"""
+Local fixture server mimicking batdongsan.com.vn for load and soak tests.
+
+Serves generated listing pages (`/<category>` and `/<category>/pN`) and
+detail pages (`/...-prNNN`) with the markup BatDongSanParser expects,
+over a minimal keep-alive HTTP/1.1 implementation on asyncio streams.
+Latency, throttling, challenge pages and slow-loris bodies can be mixed
+in to see how the spider behaves under pressure.
+
+Usage:
+    python benchmarks/fixture_server.py --port 8080 --latency-ms 80 --rate-429 0.02
+    BATDONGSAN_BASE_URL=http://127.0.0.1:8080 BATDONGSAN_REQUESTS_PER_SECOND=0 \\
+        python -m batdongsan crawl --pages 50 --concurrent 32 --details
+"""
+import argparse
+import asyncio
+import math
+import random
+import re
+import time
+import zlib
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, Tuple
+
+from pages import detail_page, listing_page
+
+
+DETAIL_PATH = re.compile(r"-pr(\d+)/?$")
+PAGE_PATH = re.compile(r"^(?P<category>/[^/?#]+)(?:/p(?P<page>\d+))?/?$")
+
+CHALLENGE_PAGE = b"""<!DOCTYPE html><html lang="en-US"><head>
+<title>Just a moment...</title><meta http-equiv="refresh" content="390">
+</head><body><div id="challenge-running">Checking if the site connection is secure</div>
+<script>window._cf_chl_opt={cvId: '3', cType: 'managed'};</script></body></html>"""
+
+REASONS = {200: "OK", 404: "Not Found", 429: "Too Many Requests", 503: "Service Unavailable"}
+
+
+class FixtureServer:
+    """
+    batdongsan.com.vn look-alike.
+    
+    Every response is delayed by a log-normal latency (median
+    `latency_ms`, spread `latency_sigma`; sigma 0 gives a fixed delay),
+    then one of the fault modes may be picked by probability:
+    429 (with Retry-After), 503, a 200 challenge page, or a slow-loris
+    body trickled out in small chunks.
+    """
+    
+    def __init__(self, args: argparse.Namespace):
+        self.args = args
+        self.rng = random.Random(args.seed)
+        self.counts: Counter = Counter()
+        self.bytes_sent = 0
+        self.started = time.monotonic()
+        self._listing = lru_cache(maxsize=args.cache_pages)(self._render_listing)
+        self._detail = lru_cache(maxsize=args.cache_pages)(self._render_detail)
+    
+    def _render_listing(self, category: str, page: int) -> bytes:
+        seed = zlib.crc32(category.encode()) % 1000
+        cards = self.args.cards
+        if page > self.args.max_pages:
+            # Past the end: the real site serves an empty page or repeats the last one
+            if self.args.past_end == "empty":
+                cards = 0
+            else:
+                page = self.args.max_pages
+        return listing_page(page, cards=cards, padding_kb=self.args.padding_kb,
+                            seed=seed, category=category, last_page=self.args.max_pages)
+    
+    def _render_detail(self, listing_id: int) -> bytes:
+        return detail_page(listing_id, padding_kb=self.args.padding_kb // 2)
+    
+    def route(self, path: str) -> Tuple[int, bytes]:
+        """Map a request path to (status, body)"""
+        path = path.split("?", 1)[0]
+        match = DETAIL_PATH.search(path)
+        if match:
+            return 200, self._detail(int(match.group(1)))
+            
+        match = PAGE_PATH.match(path)
+        if match:
+            page = int(match.group("page") or 1)
+            if 1 <= page <= self.args.max_pages or (page > 1 and self.args.past_end != "404"):
+                return 200, self._listing(match.group("category"), page)
+        return 404, b"<html><body><h1>404</h1></body></html>"
+    
+    def latency(self) -> float:
+        """Sample one response delay in seconds"""
+        median = self.args.latency_ms / 1000
+        if median <= 0:
+            return 0.0
+        if self.args.latency_sigma <= 0:
+            return median
+        return median * math.exp(self.rng.gauss(0, self.args.latency_sigma))
+    
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve requests on one keep-alive connection"""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                headers: Dict[str, str] = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                    
+                parts = request_line.decode("latin-1").split()
+                if len(parts) != 3:
+                    break
+                method, path, version = parts
+                keep_alive = (version == "HTTP/1.1"
+                              and headers.get("connection", "").lower() != "close")
+                await self.respond(writer, path, keep_alive, head_only=method == "HEAD")
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+    
+    async def respond(
+        self,
+        writer: asyncio.StreamWriter,
+        path: str,
+        keep_alive: bool,
+        head_only: bool = False,
+    ) -> None:
+        """Pick an outcome for one request and write it"""
+        delay = self.latency()
+        if delay:
+            await asyncio.sleep(delay)
+            
+        args = self.args
+        extra: Dict[str, str] = {}
+        slow = False
+        roll = self.rng.random()
+        if roll < args.rate_429:
+            status, body = 429, b"Too Many Requests"
+            extra["Retry-After"] = str(args.retry_after)
+        elif roll < args.rate_429 + args.rate_503:
+            status, body = 503, b"Service Unavailable"
+        elif roll < args.rate_429 + args.rate_503 + args.challenge_rate:
+            status, body = 200, CHALLENGE_PAGE
+            self.counts["challenge"] += 1
+        else:
+            status, body = self.route(path)
+            slow = self.rng.random() < args.slowloris_rate
+            
+        self.counts[status] += 1
+        head = [
+            f"HTTP/1.1 {status} {REASONS.get(status, 'OK')}",
+            "Content-Type: text/html; charset=utf-8",
+            f"Content-Length: {len(body)}",
+            f"Connection: {'keep-alive' if keep_alive else 'close'}",
+        ] + [f"{k}: {v}" for k, v in extra.items()]
+        writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1"))
+        
+        if head_only:
+            await writer.drain()
+            return
+        if slow:
+            self.counts["slowloris"] += 1
+            for start in range(0, len(body), args.slowloris_chunk):
+                writer.write(body[start:start + args.slowloris_chunk])
+                await writer.drain()
+                await asyncio.sleep(args.slowloris_delay)
+        else:
+            writer.write(body)
+            await writer.drain()
+        self.bytes_sent += len(body)
+    
+    def report(self) -> str:
+        elapsed = time.monotonic() - self.started
+        total = sum(v for k, v in self.counts.items() if isinstance(k, int))
+        by_kind = " ".join(f"{k}={v}" for k, v in sorted(self.counts.items(), key=str))
+        return (f"[fixture] {total} responses, {total / elapsed * 60:.0f}/min, "
+                f"{self.bytes_sent / 1024 / 1024:.1f} MB | {by_kind}")
+    
+    async def serve(self) -> None:
+        server = await asyncio.start_server(self.handle, self.args.host, self.args.port,
+                                            backlog=1024)
+        print(f"[fixture] Serving on http://{self.args.host}:{self.args.port}")
+        async with server:
+            while True:
+                await asyncio.sleep(10)
+                print(self.report())
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--host", default="127.0.0.1")
+    arg_parser.add_argument("--port", type=int, default=8080)
+    arg_parser.add_argument("--max-pages", type=int, default=1000, help="Pages per category")
+    arg_parser.add_argument(
+        "--past-end", choices=["404", "empty", "repeat"], default="404",
+        help="Pages beyond --max-pages: 404, no listings, or the last page again",
+    )
+    arg_parser.add_argument("--cards", type=int, default=20, help="Cards per listing page")
+    arg_parser.add_argument("--padding-kb", type=int, default=400, help="Listing page chrome size")
+    arg_parser.add_argument("--cache-pages", type=int, default=256, help="Rendered pages kept")
+    arg_parser.add_argument("--latency-ms", type=float, default=0.0, help="Median latency")
+    arg_parser.add_argument("--latency-sigma", type=float, default=0.5,
+                            help="Log-normal spread (0 = fixed latency)")
+    arg_parser.add_argument("--rate-429", type=float, default=0.0)
+    arg_parser.add_argument("--retry-after", type=int, default=5, help="Retry-After on 429s (s)")
+    arg_parser.add_argument("--rate-503", type=float, default=0.0)
+    arg_parser.add_argument("--challenge-rate", type=float, default=0.0,
+                            help="Share of 200 challenge pages")
+    arg_parser.add_argument("--slowloris-rate", type=float, default=0.0,
+                            help="Share of bodies trickled out slowly")
+    arg_parser.add_argument("--slowloris-chunk", type=int, default=1024, help="Bytes per trickle")
+    arg_parser.add_argument("--slowloris-delay", type=float, default=0.5,
+                            help="Seconds between trickles")
+    arg_parser.add_argument("--seed", type=int, default=None)
+    args = arg_parser.parse_args()
+    
+    server = FixtureServer(args)
+    try:
+        asyncio.run(server.serve())
+    except KeyboardInterrupt:
+        print(server.report())
+
+
+if __name__ == "__main__":
+    main()
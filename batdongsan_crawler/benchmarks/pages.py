@@ -0,0 +1,167 @@
+"""
+Synthetic batdongsan.com.vn pages for benchmarks and the fixture server.
+
+Listing and detail pages use the same markup that BatDongSanParser
+expects (`.js__card` cards, `.re__pr-*` detail blocks) and are padded
+with inline script/style blobs to the size of real pages (300-600 KB).
+"""
+import random
+from typing import Optional
+
+STREETS = ["Nguyễn Hữu Thọ", "Lê Văn Lương", "Phạm Văn Đồng", "Võ Văn Kiệt", "Trần Duy Hưng"]
+DISTRICTS = ["Quận 7", "Quận 2", "Quận Cầu Giấy", "Quận Thanh Xuân", "Huyện Nhà Bè"]
+PROVINCES = ["Hồ Chí Minh", "Hà Nội", "Đà Nẵng"]
+IMAGE_HOST = "https://file4.batdongsan.com.vn/crop"
+
+
+def listing_card(listing_id: int, rng: random.Random) -> str:
+    """One property card"""
+    street = rng.choice(STREETS)
+    district = rng.choice(DISTRICTS)
+    province = rng.choice(PROVINCES)
+    price = f"{rng.randint(1, 30)},{rng.randint(0, 9)} tỷ"
+    area = rng.randint(30, 250)
+    vip = ' re__vip-diamond' if rng.random() < 0.2 else ''
+    title = f"Bán căn hộ {area}m² đường {street}, {district}, sổ hồng chính chủ"
+    return f"""
+<div class="js__card re__card-full{vip}" prid="{listing_id}">
+  <a class="js__product-link-for-product-id" data-product-id="{listing_id}"
+     href="/ban-can-ho-chung-cu-duong-{listing_id % 97}-pr{listing_id}"
+     title="Bán căn hộ {area}m² đường {street}, {district}">
+    <div class="re__card-image"><img data-src="{IMAGE_HOST}/{listing_id}.jpg" alt="">
+      <span class="re__card-image-feature">{rng.randint(3, 20)} ảnh</span></div>
+    <div class="re__card-info">
+      <h3 class="re__card-title"><span class="pr-title js__card-title">{title}</span></h3>
+      <div class="re__card-config js__card-config">
+        <span class="re__card-config-price js__card-config-item">{price}</span>
+        <span class="re__card-config-dot">·</span>
+        <span class="re__card-config-area js__card-config-item">{area} m²</span>
+        <span class="re__card-config-bedroom">{rng.randint(1, 4)} PN</span>
+      </div>
+      <div class="re__card-location"><span>{district}, {province}</span></div>
+      <div class="re__card-description js__card-description">
+        Căn hộ thiết kế hiện đại, view sông, nội thất đầy đủ, gần trường học, chợ và bệnh viện.
+        Pháp lý rõ ràng, hỗ trợ vay ngân hàng 70%. Liên hệ chính chủ để xem nhà.
+      </div>
+    </div>
+  </a>
+</div>"""
+
+
+def padding(padding_kb: int, rng: random.Random) -> str:
+    """Inline style/script chrome of roughly `padding_kb` KB"""
+    blob = "var __NEXT_DATA__ = " + ",".join(
+        f'{{"k{i}":"{rng.getrandbits(64):x}-Hồ Chí Minh"}}' for i in range(padding_kb * 28)
+    ) + ";"
+    style = '.re__x{color:#333;margin:0 auto}' * (padding_kb * 4)
+    return f"<style>{style}</style>\n<script>{blob}</script>"
+
+
+def listing_page(
+    page: int = 1,
+    cards: int = 20,
+    padding_kb: int = 400,
+    seed: int = 0,
+    category: str = "/ban-can-ho-chung-cu",
+    last_page: Optional[int] = None,
+) -> bytes:
+    """
+    A full listing page, UTF-8 encoded.
+    
+    Args:
+        page: Page number (varies listing ids)
+        cards: Number of property cards
+        padding_kb: Approximate size of inline script/style chrome
+        seed: Random seed for deterministic content (varies listing ids too)
+        category: Category path used in the pagination links
+        last_page: Category's last page, shown in the pager like the real
+            site does (None links only the next page)
+    """
+    rng = random.Random(seed * 100_003 + page)
+    first_id = seed * 1_000_000 + page * 1000
+    body = "".join(listing_card(first_id + i, rng) for i in range(cards))
+    pager = pagination(page, category, last_page)
+    html = f"""<!DOCTYPE html>
+<html lang="vi"><head><meta charset="utf-8">
+<title>Mua bán căn hộ chung cư - trang {page}</title>
+{padding(padding_kb, rng)}
+</head><body>
+<div class="re__main"><div class="re__srp-list js__product-list">{body}</div>
+{pager}
+</div></body></html>"""
+    return html.encode("utf-8")
+
+
+def pagination(page: int, category: str, last_page: Optional[int] = None) -> str:
+    """Pager block: nearby page numbers, the last page and a next arrow"""
+    if last_page is None:
+        return (f'<div class="re__pagination-group"><a class="re__pagination-number" '
+                f'href="{category}/p{page + 1}">{page + 1}</a></div>')
+        
+    def link(number: int, css: str = "re__pagination-number", label: str = "") -> str:
+        href = category if number == 1 else f"{category}/p{number}"
+        return f'<a class="{css}" href="{href}" pid="{number}">{label or number}</a>'
+        
+    numbers = [link(n) for n in range(max(1, page - 2), min(last_page, page + 2) + 1) if n != page]
+    if page + 2 < last_page:
+        numbers.append(f'<span>...</span>{link(last_page)}')
+    if page < last_page:
+        numbers.append(
+            link(page + 1, "re__pagination-icon", '<i class="re__icon-chevron-right--sm"></i>')
+        )
+    return f'<div class="re__pagination-group">{"".join(numbers)}</div>'
+
+
+def detail_page(listing_id: int, padding_kb: int = 200) -> bytes:
+    """
+    A property detail page, UTF-8 encoded.
+    
+    Args:
+        listing_id: Listing id (the `prNNN` suffix of the URL)
+        padding_kb: Approximate size of inline script/style chrome
+    """
+    rng = random.Random(listing_id)
+    street = rng.choice(STREETS)
+    district = rng.choice(DISTRICTS)
+    province = rng.choice(PROVINCES)
+    area = rng.randint(30, 250)
+    specs = [
+        ("Diện tích", f"{area} m²"),
+        ("Số phòng ngủ", f"{rng.randint(1, 4)} phòng"),
+        ("Số toilet", f"{rng.randint(1, 3)} phòng"),
+        ("Hướng nhà", rng.choice(["Đông", "Tây Nam", "Bắc"])),
+        ("Pháp lý", "Sổ đỏ/ Sổ hồng"),
+    ]
+    spec_html = "".join(
+        f'<div class="re__pr-specs-content-item">'
+        f'<span class="re__pr-specs-content-item-title">{label}</span>'
+        f'<span class="re__pr-specs-content-item-value">{value}</span></div>'
+        for label, value in specs
+    )
+    thumbs = "".join(
+        f'<li class="re__media-thumb-item"><img data-src="{IMAGE_HOST}/{listing_id}-{i}.jpg"></li>'
+        for i in range(rng.randint(3, 12))
+    )
+    chrome = padding(padding_kb, rng)
+    title = f"Bán căn hộ {area}m² đường {street}, {district}, sổ hồng chính chủ"
+    address = f"Dự án Sunrise City, Đường {street}, Phường Tân Hưng, {district}, {province}"
+    price = f"{rng.randint(1, 30)},{rng.randint(0, 9)} tỷ"
+    html = f"""<!DOCTYPE html>
+<html lang="vi"><head><meta charset="utf-8">
+<title>Bán căn hộ {area}m² - pr{listing_id}</title>
+{chrome}
+</head><body>
+<div class="re__main">
+<ul class="re__media-thumbs">{thumbs}</ul>
+<h1 class="re__pr-title pr-title js__pr-title">{title}</h1>
+<span class="re__pr-short-description js__pr-address">{address}</span>
+<div class="re__pr-short-info"><div class="re__pr-short-info-item re__pr-short-info-item--price">
+<span class="title">Mức giá</span><span class="value">{price}</span></div></div>
+<div class="re__section re__pr-description"><div class="re__detail-content">
+Căn hộ thiết kế hiện đại, view sông, nội thất đầy đủ, gần trường học, chợ và bệnh viện.
+Pháp lý rõ ràng, hỗ trợ vay ngân hàng 70%. Liên hệ chính chủ để xem nhà.</div></div>
+<div class="re__pr-specs-content">{spec_html}</div>
+<div class="re__contact"><div class="re__contact-name">Nguyễn Văn {rng.choice("ABCDEHK")}</div>
+<a href="tel:09{rng.randint(10_000_000, 99_999_999)}">Gọi ngay</a></div>
+</div></body></html>"""
+    return html.encode("utf-8")
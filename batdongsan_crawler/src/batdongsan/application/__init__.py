@@ -1,4 +1,30 @@
 """Application Layer"""
-from .services import SpiderService, CrawlStats
+from .services import (
+    SpiderService,
+    CrawlStats,
+    HostRateLimiter,
+    TokenBucket,
+    AdaptiveConcurrencyLimiter,
+    RetryPolicy,
+    HostCircuitBreaker,
+    CircuitState,
+    PaginationTracker,
+    StopReason,
+    RevisitPolicy,
+    RevisitScheduler,
+)
 
-__all__ = ["SpiderService", "CrawlStats"]
+__all__ = [
+    "SpiderService",
+    "CrawlStats",
+    "HostRateLimiter",
+    "TokenBucket",
+    "AdaptiveConcurrencyLimiter",
+    "RetryPolicy",
+    "HostCircuitBreaker",
+    "CircuitState",
+    "PaginationTracker",
+    "StopReason",
+    "RevisitPolicy",
+    "RevisitScheduler",
+]
@@ -1,4 +1,23 @@
 """Services package"""
 from .spider_service import SpiderService, CrawlStats
+from .rate_limiter import HostRateLimiter, TokenBucket
+from .concurrency import AdaptiveConcurrencyLimiter
+from .retry_policy import RetryPolicy
+from .circuit_breaker import HostCircuitBreaker, CircuitState
+from .pagination import PaginationTracker, StopReason
+from .revisit import RevisitPolicy, RevisitScheduler
 
-__all__ = ["SpiderService", "CrawlStats"]
+__all__ = [
+    "SpiderService",
+    "CrawlStats",
+    "HostRateLimiter",
+    "TokenBucket",
+    "AdaptiveConcurrencyLimiter",
+    "RetryPolicy",
+    "HostCircuitBreaker",
+    "CircuitState",
+    "PaginationTracker",
+    "StopReason",
+    "RevisitPolicy",
+    "RevisitScheduler",
+]
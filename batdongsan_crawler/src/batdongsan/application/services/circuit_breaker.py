@@ -0,0 +1,171 @@
+"""
+Application Layer - Circuit Breaker
+
+Per-host circuit breaker shared by all spider workers.
+Once a host keeps answering with blocks/challenges, every worker pauses
+instead of burning requests, then a single probe decides whether to resume.
+"""
+import asyncio
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+
+class CircuitState(str, Enum):
+    """Breaker state for one host"""
+    CLOSED = "closed"           # Requests flow normally
+    OPEN = "open"               # All requests wait for the cooldown
+    HALF_OPEN = "half_open"     # One probe request decides
+
+
+@dataclass
+class HostCircuit:
+    """State of one host's breaker"""
+    state: CircuitState = CircuitState.CLOSED
+    failures: int = 0           # Consecutive blocked responses
+    open_until: float = 0.0
+    probing: bool = False
+    changed: asyncio.Event = field(default_factory=asyncio.Event)
+    
+    def notify(self) -> None:
+        """Wake every waiter; later waiters get a fresh event"""
+        self.changed.set()
+        self.changed = asyncio.Event()
+
+
+class HostCircuitBreaker:
+    """
+    Circuit breaker keeping one circuit per host.
+    
+    - closed: requests pass; `failure_threshold` consecutive blocks open it
+    - open: acquire() waits until the cooldown (or a longer Retry-After) ends
+    - half-open: exactly one caller is let through as a probe; the others
+      wait for its outcome. Success closes the circuit and everyone
+      resumes, another block reopens it.
+      
+    A threshold of 0 (or less) disables the breaker.
+    """
+    
+    def __init__(self, failure_threshold: int = 5, cooldown: float = 30.0):
+        """
+        Initialize the breaker.
+        
+        Args:
+            failure_threshold: Consecutive blocked responses that open a circuit
+            cooldown: Seconds a circuit stays open before probing
+        """
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._circuits: Dict[str, HostCircuit] = {}
+        self.trips = 0
+    
+    @property
+    def enabled(self) -> bool:
+        return self.failure_threshold > 0
+    
+    def state(self, url: str) -> CircuitState:
+        """Current state of the URL's host circuit"""
+        circuit = self._circuits.get(urlparse(url).netloc.lower())
+        return circuit.state if circuit else CircuitState.CLOSED
+    
+    def _circuit(self, url: str) -> HostCircuit:
+        host = urlparse(url).netloc.lower()
+        circuit = self._circuits.get(host)
+        if circuit is None:
+            circuit = HostCircuit()
+            self._circuits[host] = circuit
+        return circuit
+    
+    async def acquire(self, url: str) -> None:
+        """
+        Wait until a request to the URL's host is allowed.
+        
+        Every acquire() must be followed by record() once the request
+        finishes, otherwise a half-open circuit never settles.
+        
+        Args:
+            url: URL about to be fetched
+        """
+        if not self.enabled:
+            return
+            
+        circuit = self._circuit(url)
+        while True:
+            if circuit.state is CircuitState.CLOSED:
+                return
+                
+            if circuit.state is CircuitState.OPEN:
+                remaining = circuit.open_until - time.monotonic()
+                if remaining > 0:
+                    await self._wait(circuit, remaining)
+                    continue
+                circuit.state = CircuitState.HALF_OPEN
+                circuit.probing = False
+                
+            if not circuit.probing:
+                circuit.probing = True
+                return
+            await self._wait(circuit, None)
+    
+    @staticmethod
+    async def _wait(circuit: HostCircuit, timeout: Optional[float]) -> None:
+        """Sleep until the circuit changes state or the timeout passes"""
+        try:
+            await asyncio.wait_for(circuit.changed.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+    
+    def record(
+        self,
+        url: str,
+        blocked: Optional[bool],
+        retry_after: Optional[float] = None,
+    ) -> None:
+        """
+        Report the outcome of a request.
+        
+        Args:
+            url: URL that was fetched
+            blocked: True if blocked/challenged, False if the host answered
+                normally, None if the outcome says nothing (cache hit, ...)
+            retry_after: Server-requested delay, extends the open period
+        """
+        if not self.enabled:
+            return
+            
+        circuit = self._circuit(url)
+        if blocked is None:
+            if circuit.state is CircuitState.HALF_OPEN and circuit.probing:
+                # Inconclusive probe: let the next caller try
+                circuit.probing = False
+                circuit.notify()
+            return
+            
+        if not blocked:
+            circuit.failures = 0
+            if circuit.state is CircuitState.HALF_OPEN:
+                circuit.state = CircuitState.CLOSED
+                circuit.probing = False
+                print(f"[+] Circuit closed for {urlparse(url).netloc}, resuming")
+                circuit.notify()
+            return
+            
+        circuit.failures += 1
+        if circuit.state is CircuitState.HALF_OPEN or (
+            circuit.state is CircuitState.CLOSED
+            and circuit.failures >= self.failure_threshold
+        ):
+            self._open(circuit, url, retry_after)
+    
+    def _open(self, circuit: HostCircuit, url: str, retry_after: Optional[float]) -> None:
+        """Trip the circuit and park every caller until the cooldown ends"""
+        pause = max(self.cooldown, retry_after or 0.0)
+        circuit.state = CircuitState.OPEN
+        circuit.open_until = time.monotonic() + pause
+        circuit.probing = False
+        self.trips += 1
+        print(f"[!] Circuit open for {urlparse(url).netloc} "
+              f"({circuit.failures} consecutive blocks), pausing {pause:.0f}s")
+        circuit.notify()
@@ -0,0 +1,225 @@
+"""
+Application Layer - Adaptive Concurrency
+
+AIMD (additive-increase / multiplicative-decrease) limiter that finds
+the highest number of in-flight requests the site tolerates.
+"""
+import asyncio
+import time
+from collections import deque
+from typing import Deque, Dict, Hashable, Optional, Tuple
+
+
+class _LatencyBaseline:
+    """
+    Latency of one kind of request against its recent best.
+    
+    The baseline is the lowest long-run average latency seen in the last
+    `window` seconds: a slow average rides out jitter that a single fast
+    sample would turn into a false alarm, and old lows expire so the
+    baseline follows the site when it gets slower for good.
+    """
+    
+    def __init__(self, window: float, smoothing: float, min_samples: int):
+        self.window = window
+        self.smoothing = smoothing
+        self.min_samples = min_samples
+        self.samples = 0
+        self.smoothed = 0.0
+        self._average = 0.0
+        # (time, average), averages increasing: the front is the window minimum
+        self._minima: Deque[Tuple[float, float]] = deque()
+    
+    @property
+    def minimum(self) -> Optional[float]:
+        return self._minima[0][1] if self._minima else None
+    
+    def add(self, latency: float, now: float) -> None:
+        self.samples += 1
+        if self.samples == 1:
+            self.smoothed = latency
+        else:
+            self.smoothed += self.smoothing * (latency - self.smoothed)
+        # Plain mean until there are enough samples for the slow average
+        self._average += max(self.smoothing / 10, 1 / self.samples) * (latency - self._average)
+        if self.samples < self.min_samples:
+            return
+            
+        while self._minima and self._minima[-1][1] >= self._average:
+            self._minima.pop()
+        self._minima.append((now, self._average))
+        while self._minima[0][0] < now - self.window:
+            self._minima.popleft()
+    
+    def congested(self, tolerance: float) -> bool:
+        """Whether latency alone says the server is saturated"""
+        minimum = self.minimum
+        return minimum is not None and self.smoothed > minimum * tolerance
+    
+    def reset(self) -> None:
+        """Start the short-term average over from the baseline"""
+        minimum = self.minimum
+        if minimum is not None:
+            self.smoothed = minimum
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    In-flight request limiter whose limit adapts at runtime.
+    
+    - Every `limit` clean completions (one window), the limit grows by one.
+    - Pushback (429/403/503, challenge pages) or latency rising above
+      `latency_tolerance` times the best recent latency multiplies
+      the limit by `decrease_factor`. Latency is tracked per kind of
+      request (listing and detail pages differ in size and cost), the
+      best latency is the minimum over the last `latency_window`
+      seconds, and latency alone only counts once a kind has
+      `min_latency_samples` samples.
+    - After a decrease, further congestion signals are ignored until a
+      full window of requests has completed, so one burst of failures
+      from requests already in flight only counts once.
+      
+    `learned_limit` is the highest limit that sustained a full window
+    without pushback, i.e. the best sustainable rate found so far.
+    
+    Use as an async context manager in place of asyncio.Semaphore.
+    """
+    
+    def __init__(
+        self,
+        initial_limit: int,
+        min_limit: int = 1,
+        max_limit: int = 10,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 2.0,
+        smoothing: float = 0.2,
+        latency_window: float = 60.0,
+        min_latency_samples: int = 20,
+    ):
+        """
+        Initialize the limiter.
+        
+        Args:
+            initial_limit: Starting number of in-flight requests
+            min_limit: Limit never drops below this
+            max_limit: Limit never grows above this
+            decrease_factor: Multiplier applied to the limit on congestion
+            latency_tolerance: Smoothed latency / baseline ratio treated as congestion
+            smoothing: EWMA weight given to each new latency sample
+            latency_window: Seconds a low latency sample stays the baseline
+            min_latency_samples: Samples of a kind needed before its latency
+                can cause a decrease
+        """
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.smoothing = smoothing
+        self.latency_window = latency_window
+        self.min_latency_samples = min_latency_samples
+        
+        self._limit = min(max(initial_limit, self.min_limit), self.max_limit)
+        self._learned = self.min_limit
+        self._in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        
+        self._window_successes = 0
+        self._since_decrease = self._limit  # allow an immediate first decrease
+        self._latencies: Dict[Hashable, _LatencyBaseline] = {}
+        self.decreases = 0
+    
+    @property
+    def limit(self) -> int:
+        """Current in-flight limit"""
+        return self._limit
+    
+    @property
+    def learned_limit(self) -> int:
+        """Highest limit sustained for a full window without pushback"""
+        return self._learned
+    
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+    
+    async def acquire(self) -> None:
+        """Wait for an in-flight slot"""
+        if self._in_flight < self._limit and not self._waiters:
+            self._in_flight += 1
+            return
+            
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Slot was granted right before cancellation: hand it on
+                self.release()
+            raise
+    
+    def release(self) -> None:
+        """Return an in-flight slot"""
+        self._in_flight -= 1
+        self._wake_waiters()
+    
+    async def __aenter__(self) -> "AdaptiveConcurrencyLimiter":
+        await self.acquire()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self.release()
+    
+    def on_success(self, latency: float, kind: Hashable = None) -> None:
+        """
+        Record a completed request.
+        
+        Args:
+            latency: Time to first byte (or request duration) in seconds
+            kind: Kind of request; each kind keeps its own latency baseline
+        """
+        self._since_decrease += 1
+        
+        baseline = self._latencies.get(kind)
+        if baseline is None:
+            baseline = self._latencies[kind] = _LatencyBaseline(
+                self.latency_window, self.smoothing, self.min_latency_samples
+            )
+        baseline.add(latency, time.monotonic())
+        if baseline.congested(self.latency_tolerance):
+            self._decrease()
+            return
+            
+        self._window_successes += 1
+        if self._window_successes >= self._limit:
+            self._window_successes = 0
+            self._learned = max(self._learned, self._limit)
+            if self._limit < self.max_limit:
+                self._limit += 1
+                self._wake_waiters()
+    
+    def on_pushback(self) -> None:
+        """Record a throttled or challenged request"""
+        self._since_decrease += 1
+        self._decrease()
+    
+    def _decrease(self) -> None:
+        """Multiplicative decrease, at most once per window"""
+        self._window_successes = 0
+        if self._since_decrease < self._limit:
+            return
+            
+        self._since_decrease = 0
+        self._limit = max(self.min_limit, int(self._limit * self.decrease_factor))
+        # Latency is re-learned against the new load level
+        for baseline in self._latencies.values():
+            baseline.reset()
+        self.decreases += 1
+    
+    def _wake_waiters(self) -> None:
+        """Hand free slots to queued acquirers in FIFO order"""
+        while self._waiters and self._in_flight < self._limit:
+            future = self._waiters.popleft()
+            if not future.done():
+                self._in_flight += 1
+                future.set_result(None)
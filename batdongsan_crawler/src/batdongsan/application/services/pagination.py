@@ -0,0 +1,165 @@
+"""
+Application Layer - Adaptive Pagination
+
+Content-driven pagination: a category's next listing page is only
+requested once the current one has shown new listings, so a category
+with 4 pages costs 4 requests (plus one to see the end) instead of
+max_pages.
+"""
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+
+class StopReason(str, Enum):
+    """Why a category stopped paginating"""
+    EMPTY = "empty"             # A page had no listings
+    REPEATED = "repeated"       # A page only repeated known listing ids
+    LAST_PAGE = "last_page"     # Reached the pager's last page number
+    MAX_PAGES = "max_pages"     # Reached the configured page budget
+    FAILED = "failed"           # A page could not be fetched
+
+
+# Stops where the content showed the category had no more pages
+CONTENT_STOPS = frozenset({StopReason.EMPTY, StopReason.REPEATED, StopReason.LAST_PAGE})
+
+
+@dataclass
+class CategoryPagination:
+    """Pagination state of one category"""
+    max_pages: int
+    seen_ids: Set[str] = field(default_factory=set)
+    pages_fetched: int = 0
+    highest_requested: int = 0
+    last_page: Optional[int] = None     # From the pager, once seen
+    stopped: Optional[StopReason] = None
+    
+    @property
+    def limit(self) -> int:
+        """Highest page worth requesting"""
+        if self.last_page is None:
+            return self.max_pages
+        return min(self.max_pages, self.last_page)
+    
+    @property
+    def saved_requests(self) -> int:
+        """
+        Pages within max_pages that were never requested because the
+        content showed the category had ended. A category that failed,
+        was cut off by the deadline or is still running saved nothing.
+        """
+        if self.stopped not in CONTENT_STOPS:
+            return 0
+        return max(0, self.max_pages - self.highest_requested)
+
+
+class PaginationTracker:
+    """
+    Decides, page by page, whether a category has more to crawl.
+    
+    Each category starts with pages 1..window. Every fetched page that
+    shows at least one new listing id schedules page + window, up to
+    the pager's last page and max_pages. An empty page, a page of ids
+    already seen, or a failed page stops the category; pages already in
+    flight still finish but schedule nothing.
+    
+    With window 1 pages are fetched strictly one after another; a larger
+    window keeps several pages of a category in flight at the cost of up
+    to window - 1 requests past its end.
+    """
+    
+    def __init__(self, max_pages: int, window: int = 1):
+        """
+        Initialize the tracker.
+        
+        Args:
+            max_pages: Page budget per category
+            window: Pages of one category requested ahead
+        """
+        self.max_pages = max_pages
+        self.window = max(1, window)
+        self._categories: Dict[str, CategoryPagination] = {}
+    
+    def _category(self, category: str) -> CategoryPagination:
+        state = self._categories.get(category)
+        if state is None:
+            state = CategoryPagination(max_pages=self.max_pages)
+            self._categories[category] = state
+        return state
+    
+    def first_pages(self, category: str) -> List[int]:
+        """Register a category and return the pages to request up front"""
+        state = self._category(category)
+        pages = list(range(1, min(self.window, self.max_pages) + 1))
+        state.highest_requested = max(state.highest_requested, pages[-1] if pages else 0)
+        return pages
+    
+    def on_page(
+        self,
+        category: str,
+        page: int,
+        listing_ids: Iterable[str],
+        last_page: Optional[int] = None,
+    ) -> Optional[int]:
+        """
+        Record a fetched listing page.
+        
+        Args:
+            category: Category key (URL of its first page)
+            page: Page number fetched
+            listing_ids: Ids of the listings on the page
+            last_page: Highest page number in the page's pager, if any
+            
+        Returns:
+            Next page number to request, or None
+        """
+        state = self._category(category)
+        state.pages_fetched += 1
+        state.highest_requested = max(state.highest_requested, page)
+        if last_page:
+            state.last_page = max(state.last_page or 0, last_page)
+            
+        ids = set(listing_ids)
+        new_ids = ids - state.seen_ids
+        state.seen_ids |= ids
+        if state.stopped:
+            return None
+            
+        if not ids:
+            state.stopped = StopReason.EMPTY
+            return None
+        if not new_ids:
+            state.stopped = StopReason.REPEATED
+            return None
+            
+        next_page = page + self.window
+        if next_page > state.limit:
+            if page >= state.limit:
+                at_last_page = state.last_page is not None and state.last_page <= state.max_pages
+                state.stopped = StopReason.LAST_PAGE if at_last_page else StopReason.MAX_PAGES
+            return None
+        state.highest_requested = max(state.highest_requested, next_page)
+        return next_page
+    
+    def on_failure(self, category: str) -> None:
+        """A page of the category was given up on"""
+        state = self._category(category)
+        if not state.stopped:
+            state.stopped = StopReason.FAILED
+    
+    @property
+    def saved_requests(self) -> int:
+        """Requests avoided across all categories"""
+        return sum(state.saved_requests for state in self._categories.values())
+    
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-category counters"""
+        return {
+            category: {
+                "pages": state.pages_fetched,
+                "last_page": state.last_page,
+                "saved": state.saved_requests,
+                "stopped": state.stopped.value if state.stopped else None,
+            }
+            for category, state in self._categories.items()
+        }
@@ -0,0 +1,89 @@
+"""
+Application Layer - Rate Limiter
+
+Per-host token bucket shared by all spider workers.
+Politeness (requests per second) is enforced here, independently of
+how many requests are allowed in flight at once.
+"""
+import asyncio
+import time
+from typing import Dict
+from urllib.parse import urlparse
+
+
+class TokenBucket:
+    """
+    Token bucket with reservation semantics.
+    
+    Each acquire() reserves one token immediately, letting the balance go
+    negative, and sleeps until the reservation is covered. Waiters are
+    therefore served in arrival order without holding a lock while asleep.
+    """
+    
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Initialize the bucket.
+        
+        Args:
+            rate: Tokens added per second
+            burst: Maximum number of tokens that can accumulate
+        """
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+    
+    def _reserve(self) -> float:
+        """Reserve one token and return the seconds to wait for it"""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= 1
+        return -self._tokens / self.rate if self._tokens < 0 else 0.0
+    
+    async def acquire(self) -> None:
+        """Wait until a token is available"""
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class HostRateLimiter:
+    """
+    Rate limiter keeping one token bucket per host.
+    
+    A rate of 0 (or less) disables limiting.
+    """
+    
+    def __init__(self, requests_per_second: float, burst: int = 1):
+        """
+        Initialize the limiter.
+        
+        Args:
+            requests_per_second: Sustained request rate allowed per host
+            burst: Requests that may be sent back-to-back after an idle period
+        """
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self._buckets: Dict[str, TokenBucket] = {}
+    
+    @property
+    def enabled(self) -> bool:
+        return self.requests_per_second > 0
+    
+    async def acquire(self, url: str) -> None:
+        """
+        Wait for permission to send a request to the URL's host.
+        
+        Args:
+            url: URL about to be fetched
+        """
+        if not self.enabled:
+            return
+            
+        host = urlparse(url).netloc.lower()
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = TokenBucket(self.requests_per_second, self.burst)
+            self._buckets[host] = bucket
+        await bucket.acquire()
@@ -0,0 +1,68 @@
+"""
+Application Layer - Retry Policy
+
+Decides whether and when a failed URL is fetched again.
+Retries are rescheduled through the frontier, so a backoff never
+keeps a worker busy.
+"""
+import random
+from typing import Optional
+
+from batdongsan.domain.exceptions import FetchError
+
+
+class RetryPolicy:
+    """
+    Capped exponential backoff with full jitter.
+    
+    The n-th retry waits uniform(0, min(max_delay, base_delay * 2**n))
+    seconds. A server-supplied Retry-After is treated as a lower bound;
+    if it asks for more than max_retry_after the URL is given up.
+    """
+    
+    def __init__(
+        self,
+        max_retries: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0,
+        max_retry_after: float = 300.0,
+    ):
+        """
+        Initialize the policy.
+        
+        Args:
+            max_retries: Retries allowed per URL (0 disables retrying)
+            base_delay: Backoff scale for the first retry, in seconds
+            max_delay: Cap on the exponential backoff, in seconds
+            max_retry_after: Longest Retry-After we are willing to honour
+        """
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_retry_after = max_retry_after
+    
+    def backoff(self, attempt: int) -> float:
+        """Jittered backoff for the given (0-based) retry attempt"""
+        ceiling = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return random.uniform(0, ceiling)
+    
+    def next_delay(self, error: FetchError, retries: int) -> Optional[float]:
+        """
+        Compute the delay before retrying a failed fetch.
+        
+        Args:
+            error: The classified failure
+            retries: Retries already made for this URL
+            
+        Returns:
+            Seconds to wait, or None if the URL should be given up
+        """
+        if not error.retryable or retries >= self.max_retries:
+            return None
+            
+        delay = self.backoff(retries)
+        if error.retry_after is not None:
+            if error.retry_after > self.max_retry_after:
+                return None
+            delay = max(delay, error.retry_after)
+        return delay
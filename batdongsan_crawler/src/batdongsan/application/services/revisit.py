@@ -0,0 +1,172 @@
+"""
+Application Layer - Revisit Scheduling
+
+Decides when a page is worth fetching again. Each page's changes are
+modelled as a Poisson process; its rate is estimated from how often
+past revisits found the content changed, and the page is due again once
+it has more likely than not changed (see RevisitPolicy).
+"""
+import math
+import time
+from typing import Dict, Optional
+
+from batdongsan.domain.interfaces import IRevisitStore, PageHistory
+
+
+class RevisitPolicy:
+    """
+    Adaptive revisit intervals from observed change rates.
+    
+    After n revisits spanning T seconds, X of which found the page
+    changed, the change rate is estimated as (Cho & Garcia-Molina)
+        
+        rate = -ln((n - X + 0.5) / (n + 0.5)) / (T / n)
+        
+    which, unlike X / T, accounts for several changes between two visits
+    being seen as one. The next visit is scheduled when the page has
+    changed with probability `change_probability`:
+        
+        interval = -ln(1 - change_probability) / rate
+        
+    A page that never changed has rate 0; its interval grows by at most
+    `max_growth` per visit instead of jumping to max_interval, and all
+    intervals are kept within [min_interval, max_interval].
+    """
+    
+    def __init__(
+        self,
+        initial_interval: float = 86400,
+        min_interval: float = 3600,
+        max_interval: float = 30 * 86400,
+        change_probability: float = 0.5,
+        max_growth: float = 2.0,
+    ):
+        """
+        Initialize the policy.
+        
+        Args:
+            initial_interval: Seconds before the first revisit of a new page
+            min_interval: Shortest revisit interval
+            max_interval: Longest revisit interval
+            change_probability: Probability of a change at which a page is due
+            max_growth: Largest factor between two consecutive intervals
+        """
+        self.initial_interval = initial_interval
+        self.min_interval = min_interval
+        self.max_interval = max(min_interval, max_interval)
+        self.change_probability = min(max(change_probability, 0.01), 0.99)
+        self.max_growth = max(1.0, max_growth)
+    
+    @staticmethod
+    def change_rate(history: PageHistory) -> Optional[float]:
+        """Estimated changes per second, or None before the first revisit"""
+        revisits = history.visits - 1
+        if revisits <= 0 or history.observed <= 0:
+            return None
+        unchanged = revisits - history.changes
+        return -math.log((unchanged + 0.5) / (revisits + 0.5)) / (history.observed / revisits)
+    
+    def next_interval(self, history: PageHistory, last_interval: float = 0.0) -> float:
+        """
+        Seconds from the latest fetch until the page is due again.
+        
+        Args:
+            history: History including the latest fetch
+            last_interval: Seconds between the latest fetch and the one before
+        """
+        rate = self.change_rate(history)
+        if rate is None:
+            interval = self.initial_interval
+        elif rate <= 0:
+            interval = self.max_interval
+        else:
+            interval = -math.log(1 - self.change_probability) / rate
+        if last_interval > 0:
+            interval = min(interval, last_interval * self.max_growth)
+        return min(max(interval, self.min_interval), self.max_interval)
+
+
+class RevisitScheduler:
+    """
+    Tracks fetched pages and tells which are due for a refetch.
+    
+    Pages never fetched are always due. After each fetch, record() stores
+    the content fingerprint, counts a change if it differs from the last
+    one, and sets the next due time from the policy.
+    """
+    
+    def __init__(self, store: IRevisitStore, policy: Optional[RevisitPolicy] = None):
+        """
+        Initialize the scheduler.
+        
+        Args:
+            store: Persistent page histories
+            policy: Interval policy (defaults to RevisitPolicy())
+        """
+        self._store = store
+        self._policy = policy or RevisitPolicy()
+        self.new = 0
+        self.due = 0
+        self.skipped = 0
+        self.changed = 0
+        self.unchanged = 0
+    
+    def is_due(self, url: str, now: Optional[float] = None) -> bool:
+        """Whether a page should be fetched now"""
+        history = self._store.get(url)
+        if history is None:
+            self.new += 1
+            return True
+        if history.next_due <= (now if now is not None else time.time()):
+            self.due += 1
+            return True
+        self.skipped += 1
+        return False
+    
+    def record(self, url: str, fingerprint: str, now: Optional[float] = None) -> bool:
+        """
+        Record a fetch of a page.
+        
+        Args:
+            url: Page URL
+            fingerprint: Fingerprint of the content fetched
+            now: Fetch time (defaults to the current time)
+            
+        Returns:
+            True if the content changed since the previous fetch
+        """
+        now = now if now is not None else time.time()
+        history = self._store.get(url)
+        changed = False
+        last_interval = 0.0
+        if history is None:
+            history = PageHistory(url=url, fingerprint=fingerprint, fetched_at=now)
+        else:
+            last_interval = max(0.0, now - history.fetched_at)
+            changed = fingerprint != history.fingerprint
+            history.visits += 1
+            history.changes += changed
+            history.observed += last_interval
+            history.fingerprint = fingerprint
+            history.fetched_at = now
+            if changed:
+                self.changed += 1
+            else:
+                self.unchanged += 1
+        history.next_due = now + self._policy.next_interval(history, last_interval)
+        self._store.put(history)
+        return changed
+    
+    def stats(self) -> Dict[str, int]:
+        """Counters for crawl statistics"""
+        return {
+            "new": self.new,
+            "due": self.due,
+            "skipped": self.skipped,
+            "changed": self.changed,
+            "unchanged": self.unchanged,
+        }
+    
+    def close(self) -> None:
+        """Persist the histories"""
+        self._store.close()
@@ -5,18 +5,29 @@ Orchestrates the crawling process using domain interfaces.
 Depends on abstractions, not implementations (DIP).
 """
 import asyncio
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set
 from urllib.parse import urljoin
 
 from batdongsan.domain.entities import (
     PropertyListing, CrawlResult, ListingType, PropertyType
 )
+from batdongsan.domain.deadline import (
+    set_deadline, deadline_remaining, deadline_expired, crawl_deadline
+)
+from batdongsan.domain.exceptions import FailureKind, FetchError
 from batdongsan.domain.interfaces import (
-    IHttpClient, IParser, IStorage, IUrlFrontier, CrawlUrl, UrlType
+    IHttpClient, IParser, IStorage, IUrlFrontier, CrawlUrl, UrlType, FetchResult
 )
 from batdongsan.infrastructure.config import settings
+from .circuit_breaker import CircuitState, HostCircuitBreaker
+from .concurrency import AdaptiveConcurrencyLimiter
+from .pagination import PaginationTracker
+from .rate_limiter import HostRateLimiter
+from .retry_policy import RetryPolicy
+from .revisit import RevisitScheduler
 
 
 @dataclass
@@ -27,6 +38,20 @@ class CrawlStats:
     listings_found: int = 0
     details_crawled: int = 0
     errors: int = 0
+    retries: int = 0
+    throttled: int = 0
+    circuit_trips: int = 0
+    bytes_downloaded: int = 0
+    concurrency_limit: int = 0
+    learned_concurrency_limit: int = 0
+    first_listing_seconds: Optional[float] = None     # Run start to first listing saved
+    deadline_reached: bool = False
+    abandoned: int = 0              # URLs left undone when the deadline hit
+    pages_saved: int = 0            # Listing pages skipped by the pagination cutoff
+    revisits_skipped: int = 0       # Detail pages not due for a revisit
+    revisit: Dict[str, int] = field(default_factory=dict)     # Revisit scheduler counters
+    pagination: Dict[str, Dict[str, Any]] = field(default_factory=dict)   # Per category
+    http: Dict[str, int] = field(default_factory=dict)    # Client counters (cache, ...)
     
     @property
     def elapsed_seconds(self) -> float:
@@ -59,6 +84,14 @@ class SpiderService:
         frontier: IUrlFrontier,
         max_concurrent: int = 3,
         crawl_details: bool = False,
+        rate_limiter: Optional[HostRateLimiter] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[HostCircuitBreaker] = None,
+        deadline: Optional[float] = None,
+        seed_lookahead: Optional[int] = None,
+        adaptive_pagination: Optional[bool] = None,
+        revisit_scheduler: Optional[RevisitScheduler] = None,
     ):
         """
         Initialize the spider service.
@@ -68,8 +101,18 @@ class SpiderService:
             parser: HTML parser for extracting data
             storage: Storage for persisting data
             frontier: URL frontier for queue management
-            max_concurrent: Maximum concurrent requests
+            max_concurrent: Maximum in-flight requests (number of workers)
             crawl_details: Whether to also crawl detail pages
+            rate_limiter: Per-host politeness limiter (defaults to settings)
+            concurrency_limiter: In-flight limiter (defaults to AIMD from settings)
+            retry_policy: Backoff policy for failed fetches (defaults to settings)
+            circuit_breaker: Per-host breaker pausing workers on blocks (defaults to settings)
+            deadline: Time budget for run() in seconds (defaults to settings, 0 = none)
+            seed_lookahead: Seed URLs kept waiting in the frontier (defaults to settings)
+            adaptive_pagination: Follow each category's pages only while
+                they show new listings (defaults to settings)
+            revisit_scheduler: Skips detail pages not due for a refetch
+                and learns their change rates (None = fetch every one)
         """
         self._http_client = http_client
         self._parser = parser
@@ -77,9 +120,53 @@ class SpiderService:
         self._frontier = frontier
         self._max_concurrent = max_concurrent
         self._crawl_details = crawl_details
-        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._rate_limiter = rate_limiter or HostRateLimiter(
+            settings.requests_per_second, settings.rate_burst
+        )
+        self._limiter = concurrency_limiter or self._create_limiter(max_concurrent)
+        self._retry_policy = retry_policy or RetryPolicy(
+            max_retries=settings.max_retries,
+            base_delay=settings.retry_base_delay,
+            max_delay=settings.retry_max_delay,
+            max_retry_after=settings.max_retry_after,
+        )
+        self._circuit_breaker = circuit_breaker or HostCircuitBreaker(
+            failure_threshold=settings.circuit_breaker_threshold,
+            cooldown=settings.circuit_breaker_cooldown,
+        )
+        self._deadline = deadline if deadline is not None else settings.crawl_deadline
+        self._seed_lookahead = max(1, seed_lookahead or settings.seed_lookahead)
+        self._seeds: Optional[Iterator[CrawlUrl]] = None
+        self._queued_seeds: Set[str] = set()
+        if adaptive_pagination is None:
+            adaptive_pagination = settings.adaptive_pagination
+        self._adaptive_pagination = adaptive_pagination
+        self._pagination: Optional[PaginationTracker] = None
+        self._revisit = revisit_scheduler
         self._stats = CrawlStats()
         
+    # Time given to workers past the deadline to finish parsing/saving
+    DEADLINE_GRACE = 2.0
+    
+    @staticmethod
+    def _create_limiter(max_concurrent: int) -> AdaptiveConcurrencyLimiter:
+        """Build the in-flight limiter described by settings"""
+        if not settings.adaptive_concurrency:
+            # Fixed limit: behaves like a plain semaphore
+            return AdaptiveConcurrencyLimiter(
+                initial_limit=max_concurrent,
+                min_limit=max_concurrent,
+                max_limit=max_concurrent,
+            )
+        return AdaptiveConcurrencyLimiter(
+            initial_limit=min(settings.initial_concurrent, max_concurrent),
+            min_limit=settings.min_concurrent,
+            max_limit=max_concurrent,
+            latency_tolerance=settings.latency_tolerance,
+            latency_window=settings.latency_window,
+            min_latency_samples=settings.min_latency_samples,
+        )
+    
     def add_seed_urls(
         self,
         listing_types: List[str] = None,
@@ -88,7 +175,17 @@ class SpiderService:
         max_pages: int = 10,
     ) -> int:
         """
-        Add seed URLs to the frontier.
+        Plan the seed URLs of the crawl.
+        
+        Seeds are generated lazily: only `seed_lookahead` of them sit in
+        the frontier at a time, and each one a worker takes is replaced
+        by the next, so memory stays flat however many categories,
+        locations and pages are requested. URLs the frontier has already
+        seen (e.g. when resuming a run) are skipped.
+        
+        With adaptive pagination only the first page(s) of each category
+        are seeds; later pages are queued as earlier ones prove to have
+        new listings (see PaginationTracker).
         
         Args:
             listing_types: ["ban", "cho-thue"]
@@ -97,56 +194,161 @@ class SpiderService:
             max_pages: Pages per category
             
         Returns:
-            Number of URLs added
+            Number of seed URLs the crawl will generate (with adaptive
+            pagination, the upper bound)
         """
         if listing_types is None:
             listing_types = ["ban"]
         if property_types is None:
             property_types = ["can-ho-chung-cu", "nha-rieng"]
             
-        count = 0
-        
+        if self._adaptive_pagination:
+            self._pagination = PaginationTracker(max_pages, settings.pagination_window)
+        self._seeds = self._generate_seeds(listing_types, property_types, locations, max_pages)
+        self._refill_seeds()
+        return len(listing_types) * len(property_types) * len(locations or [None]) * max_pages
+    
+    def _generate_seeds(
+        self,
+        listing_types: List[str],
+        property_types: List[str],
+        locations: Optional[List[str]],
+        max_pages: int,
+    ) -> Iterator[CrawlUrl]:
+        """Listing page URLs, category by category, page by page"""
+        category_locations: List[Optional[str]] = [*locations] if locations else [None]
         for listing_type in listing_types:
             for prop_type in property_types:
                 base_path = f"/{listing_type}-{prop_type}"
+                metadata = {"listing_type": listing_type, "property_type": prop_type}
                 
-                if locations:
-                    for location in locations:
-                        for page in range(1, max_pages + 1):
-                            url = f"{self.BASE_URL}{base_path}-{location}"
-                            if page > 1:
-                                url += f"/p{page}"
-                            if self._frontier.add(CrawlUrl(
-                                url=url,
-                                url_type=UrlType.LISTING_PAGE,
-                                metadata={"listing_type": listing_type, "property_type": prop_type}
-                            )):
-                                count += 1
-                else:
-                    for page in range(1, max_pages + 1):
-                        url = f"{self.BASE_URL}{base_path}"
-                        if page > 1:
-                            url += f"/p{page}"
-                        if self._frontier.add(CrawlUrl(
-                            url=url,
+                for location in category_locations:
+                    category_url = f"{self.BASE_URL}{base_path}"
+                    if location:
+                        category_url += f"-{location}"
+                    pages: Iterable[int]
+                    if self._pagination is not None:
+                        pages = self._pagination.first_pages(category_url)
+                    else:
+                        pages = range(1, max_pages + 1)
+                    for page in pages:
+                        yield CrawlUrl(
+                            url=self._page_url(category_url, page),
                             url_type=UrlType.LISTING_PAGE,
-                            metadata={"listing_type": listing_type, "property_type": prop_type}
-                        )):
-                            count += 1
-                            
-        return count
+                            metadata={**metadata, "category": category_url, "page": page},
+                        )
     
-    async def _process_listing_page(self, crawl_url: CrawlUrl) -> List[PropertyListing]:
-        """Process a listing page"""
-        html = await self._http_client.get(crawl_url.url)
-        if not html:
-            return []
+    @staticmethod
+    def _page_url(category_url: str, page: int) -> str:
+        """URL of a category's listing page"""
+        return category_url if page == 1 else f"{category_url}/p{page}"
+    
+    def _refill_seeds(self) -> None:
+        """Top the frontier up with seeds until `seed_lookahead` are waiting"""
+        while self._seeds is not None and len(self._queued_seeds) < self._seed_lookahead:
+            crawl_url = next(self._seeds, None)
+            if crawl_url is None:
+                self._seeds = None
+                break
+            if self._frontier.add(crawl_url):
+                self._queued_seeds.add(crawl_url.url)
+    
+    def _take_seed(self, crawl_url: CrawlUrl) -> None:
+        """Replace a seed taken by a worker before the frontier can run dry"""
+        if crawl_url.url in self._queued_seeds:
+            self._queued_seeds.discard(crawl_url.url)
+            self._refill_seeds()
+    
+    async def _fetch(
+        self,
+        url: str,
+        paced: bool = True,
+        url_type: Optional[UrlType] = None,
+    ) -> FetchResult:
+        """
+        Fetch a page.
+        
+        The body stays as bytes: parsers receive it with the charset
+        and decode it inside lxml, never as an intermediate str.
+        
+        Feeds latency and pushback to the concurrency limiter and the
+        circuit breaker, and counts downloaded bytes. Failures are raised
+        as FetchError.
+        
+        Args:
+            url: URL to fetch
+            paced: Whether the caller acquired the host's circuit breaker
+                (False for fresh cache hits, which settle nothing)
+            url_type: Kind of page, which keeps its own latency baseline
+        """
+        started = time.monotonic()
+        blocked = None
+        try:
+            result = await self._http_client.fetch(url)
             
-        listings = self._parser.parse_listing_page(html, crawl_url.metadata)
+            if not result.from_cache:
+                # A revalidation went over the network but sent no body
+                if not result.revalidated:
+                    self._stats.bytes_downloaded += len(result.content)
+                if result.error is FailureKind.BLOCK:
+                    self._limiter.on_pushback()
+                    self._stats.throttled += 1
+                    blocked = True
+                elif result.ok:
+                    # Time to first byte: server load, not page size
+                    latency = (result.timings.ttfb or result.timings.total
+                               or time.monotonic() - started)
+                    self._limiter.on_success(latency, url_type)
+                    blocked = False
+        finally:
+            # An unpaced fetch never held the probe of a half-open circuit
+            if paced or blocked is not None:
+                self._circuit_breaker.record(
+                    url, blocked, result.retry_after if blocked else None
+                )
+            self._stats.circuit_trips = self._circuit_breaker.trips
+        self._stats.concurrency_limit = self._limiter.limit
+        self._stats.learned_concurrency_limit = self._limiter.learned_limit
         
-        # Add detail URLs to frontier if enabled
+        result.raise_for_error()
+        return result
+    
+    async def _warmup_gate(self, url: str) -> bool:
+        """
+        Let the HTTP client send a connection warm-up request to `url`.
+        
+        Warm-up requests wait for the host's rate limit like pages do.
+        None are sent while the host's circuit is open, when nothing is
+        left to crawl, or while workers are busy with pages that never
+        reach the network (cache hits).
+        """
+        if (self._circuit_breaker.state(url) is not CircuitState.CLOSED
+                or self._frontier.is_empty() or self._limiter.in_flight):
+            return False
+        await self._rate_limiter.acquire(url)
+        return True
+    
+    async def _process_listing_page(
+        self,
+        crawl_url: CrawlUrl,
+        paced: bool = True,
+    ) -> List[PropertyListing]:
+        """Process a listing page"""
+        result = await self._fetch(crawl_url.url, paced, crawl_url.url_type)
+        listings = []
+        if result.content:
+            listings = self._parser.parse_listing_page(
+                result.content, crawl_url.metadata, encoding=result.encoding
+            )
+        if self._pagination is not None and "page" in crawl_url.metadata:
+            self._paginate(self._pagination, crawl_url, listings, result)
+        
+        # Add detail URLs to frontier if enabled (and due, when revisiting)
         if self._crawl_details:
             for listing in listings:
+                if self._revisit is not None and not self._revisit.is_due(listing.url):
+                    self._stats.revisits_skipped += 1
+                    continue
                 self._frontier.add(CrawlUrl(
                     url=listing.url,
                     url_type=UrlType.DETAIL_PAGE,
@@ -156,48 +358,129 @@ class SpiderService:
                 
         return listings
     
-    async def _process_detail_page(self, crawl_url: CrawlUrl) -> Optional[PropertyListing]:
+    def _paginate(
+        self,
+        pagination: PaginationTracker,
+        crawl_url: CrawlUrl,
+        listings: List[PropertyListing],
+        result: FetchResult,
+    ) -> None:
+        """Queue the category's next listing page if this one was worth it"""
+        category = crawl_url.metadata["category"]
+        last_page = None
+        if result.content:
+            last_page = self._parser.parse_last_page(result.content, encoding=result.encoding)
+        next_page = pagination.on_page(
+            category,
+            crawl_url.metadata["page"],
+            [listing.id for listing in listings],
+            last_page=last_page,
+        )
+        if next_page is not None:
+            self._frontier.add(CrawlUrl(
+                url=self._page_url(category, next_page),
+                url_type=UrlType.LISTING_PAGE,
+                metadata={**crawl_url.metadata, "page": next_page},
+            ))
+    
+    async def _process_detail_page(
+        self,
+        crawl_url: CrawlUrl,
+        paced: bool = True,
+    ) -> Optional[PropertyListing]:
         """Process a detail page"""
-        html = await self._http_client.get(crawl_url.url)
-        if not html:
+        result = await self._fetch(crawl_url.url, paced, crawl_url.url_type)
+        if not result.content:
             return None
             
-        return self._parser.parse_detail_page(html, crawl_url.url)
+        listing = self._parser.parse_detail_page(
+            result.content, crawl_url.url, encoding=result.encoding
+        )
+        if listing is not None and self._revisit is not None:
+            self._revisit.record(crawl_url.url, listing.content_fingerprint())
+        return listing
+    
+    def _schedule_retry(self, worker_id: int, crawl_url: CrawlUrl, error: FetchError) -> bool:
+        """
+        Reschedule a failed URL through the frontier, or give it up.
+        
+        Returns:
+            False if the URL was abandoned for lack of time and should be
+            released rather than completed
+        """
+        delay = self._retry_policy.next_delay(error, crawl_url.retries)
+        remaining = deadline_remaining()
+        if delay is not None and remaining is not None and delay >= remaining:
+            print(f"[W{worker_id}] No time left to retry: {error}")
+            self._stats.abandoned += 1
+            return False
+        if delay is None:
+            print(f"[W{worker_id}] Giving up: {error}")
+            self._stats.errors += 1
+            if self._pagination is not None and "category" in crawl_url.metadata:
+                self._pagination.on_failure(crawl_url.metadata["category"])
+            return True
+            
+        crawl_url.retries += 1
+        self._frontier.reschedule(crawl_url, delay)
+        self._stats.retries += 1
+        print(f"[W{worker_id}] Retry {crawl_url.retries}/{self._retry_policy.max_retries} "
+              f"in {delay:.1f}s: {error}")
+        return True
     
     async def _worker(self, worker_id: int) -> None:
         """Worker coroutine for processing URLs"""
         while True:
-            crawl_url = self._frontier.get()
-            
+            # Sleeps until work arrives; None means the crawl is over
+            crawl_url = await self._frontier.get_async()
             if crawl_url is None:
-                await asyncio.sleep(0.5)
-                if self._frontier.is_empty():
-                    break
-                continue
-                
+                break
+            self._take_seed(crawl_url)
+            
+            # Completed unless abandoned at the deadline or cut off by it
+            finished = True
             try:
-                async with self._semaphore:
+                # Wait for the host's circuit and rate limit before taking
+                # a slot, so slots are only held by requests actually in
+                # flight. Pages the cache holds fresh never reach the host
+                paced = not self._http_client.is_fresh(crawl_url.url)
+                if paced:
+                    await self._circuit_breaker.acquire(crawl_url.url)
+                    await self._rate_limiter.acquire(crawl_url.url)
+                async with self._limiter:
                     if crawl_url.url_type == UrlType.LISTING_PAGE:
-                        listings = await self._process_listing_page(crawl_url)
+                        listings = await self._process_listing_page(crawl_url, paced)
                         for listing in listings:
                             self._storage.save(listing)
                             self._stats.listings_found += 1
+                        if listings and self._stats.first_listing_seconds is None:
+                            self._stats.first_listing_seconds = self._stats.elapsed_seconds
                         print(f"[W{worker_id}] {crawl_url.url[:50]}... -> {len(listings)} listings")
                         
                     elif crawl_url.url_type == UrlType.DETAIL_PAGE:
-                        listing = await self._process_detail_page(crawl_url)
+                        listing = await self._process_detail_page(crawl_url, paced)
                         if listing:
                             self._storage.save(listing)
                             self._stats.details_crawled += 1
                             
                     self._stats.pages_crawled += 1
                     
+            except FetchError as e:
+                finished = self._schedule_retry(worker_id, crawl_url, e)
+                
+            except asyncio.CancelledError:
+                finished = False
+                raise
+                
             except Exception as e:
                 print(f"[W{worker_id}] Error: {e}")
                 self._stats.errors += 1
                 
             finally:
-                self._frontier.complete(crawl_url.url)
+                if finished:
+                    self._frontier.complete(crawl_url.url)
+                else:
+                    self._frontier.release(crawl_url.url)
     
     async def run(self) -> CrawlResult:
         """
@@ -210,37 +493,77 @@ class SpiderService:
         print("BatDongSan Spider")
         print("=" * 50)
         print(f"URLs in queue: {len(self._frontier)}")
-        print(f"Concurrent: {self._max_concurrent}")
+        if self._deadline > 0:
+            print(f"Deadline: {self._deadline:.0f}s")
+        print(f"Concurrent: {self._limiter.limit} (adaptive {self._limiter.min_limit}"
+              f"-{self._limiter.max_limit})")
+        if self._rate_limiter.enabled:
+            print(f"Rate limit: {self._rate_limiter.requests_per_second}/s per host "
+                  f"(burst {self._rate_limiter.burst})")
         print("=" * 50)
         
-        self._semaphore = asyncio.Semaphore(self._max_concurrent)
-        self._stats = CrawlStats()
+        self._stats = CrawlStats(
+            concurrency_limit=self._limiter.limit,
+            learned_concurrency_limit=self._limiter.learned_limit,
+        )
         
+        # Workers, and every request they make, inherit the deadline
+        deadline_token = set_deadline(self._deadline)
         try:
+            # Open connections (DNS, TCP, TLS) before the workers need them
+            await self._http_client.warmup([self.BASE_URL], self._warmup_gate)
+            
             # Create workers
             workers = [
                 asyncio.create_task(self._worker(i))
-                for i in range(self._max_concurrent)
+                for i in range(self._limiter.max_limit)
             ]
             
             # Progress monitor
             async def monitor():
                 while not self._frontier.is_empty() or any(not w.done() for w in workers):
+                    self._stats.http = self._http_client.stats()
                     print(f"\n[Stats] Pages: {self._stats.pages_crawled} | "
                           f"Listings: {self._stats.listings_found} | "
                           f"Errors: {self._stats.errors} | "
+                          f"Retries: {self._stats.retries} | "
+                          f"Throttled: {self._stats.throttled} | "
+                          f"Trips: {self._stats.circuit_trips} | "
+                          f"Limit: {self._stats.concurrency_limit} | "
                           f"Queue: {len(self._frontier)} | "
                           f"Speed: {self._stats.pages_per_minute:.1f}/min")
                     await asyncio.sleep(10)
                     
             monitor_task = asyncio.create_task(monitor())
             
-            # Wait for workers
-            await asyncio.gather(*workers)
+            # Wait for workers; past the deadline (plus grace) cut them off
+            remaining = deadline_remaining()
+            _, unfinished = await asyncio.wait(
+                workers,
+                timeout=None if remaining is None else max(0.0, remaining) + self.DEADLINE_GRACE,
+            )
+            for worker in unfinished:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
             monitor_task.cancel()
             
+            if deadline_expired():
+                self._stats.deadline_reached = True
+                self._stats.abandoned += len(unfinished) + len(self._frontier)
+                print(f"\n[!] Deadline reached: {self._stats.abandoned} URLs left undone")
+            self._stats.http = self._http_client.stats()
+            if self._pagination is not None:
+                self._stats.pagination = self._pagination.stats()
+                self._stats.pages_saved = self._pagination.saved_requests
+            if self._revisit is not None:
+                self._stats.revisit = self._revisit.stats()
+                
         finally:
+            crawl_deadline.reset(deadline_token)
             self._storage.close()
+            self._frontier.close()
+            if self._revisit is not None:
+                self._revisit.close()
             await self._http_client.close()
             
         # Final stats
@@ -250,6 +573,23 @@ class SpiderService:
         print(f"Pages: {self._stats.pages_crawled}")
         print(f"Listings: {self._stats.listings_found}")
         print(f"Errors: {self._stats.errors}")
+        print(f"Retries: {self._stats.retries}")
+        print(f"Circuit trips: {self._stats.circuit_trips}")
+        if self._stats.deadline_reached:
+            print(f"Abandoned at deadline: {self._stats.abandoned}")
+        if self._stats.pagination:
+            print(f"Listing pages saved by pagination cutoff: {self._stats.pages_saved}")
+        if self._stats.revisit:
+            print(f"Detail pages not due for a revisit: {self._stats.revisits_skipped}")
+            print(f"Revisited pages changed: {self._stats.revisit['changed']} "
+                  f"(unchanged {self._stats.revisit['unchanged']})")
+        print(f"Data downloaded: {self._stats.bytes_downloaded / 1024 / 1024:.2f} MB")
+        for name, value in self._stats.http.items():
+            print(f"{name}: {value}")
+        print(f"Concurrency: {self._stats.concurrency_limit} "
+              f"(learned {self._stats.learned_concurrency_limit})")
+        if self._stats.first_listing_seconds is not None:
+            print(f"First listing after: {self._stats.first_listing_seconds:.2f}s")
         print(f"Time: {self._stats.elapsed_seconds:.1f}s")
         
         return CrawlResult(
@@ -257,5 +597,18 @@ class SpiderService:
             total_found=self._stats.listings_found,
             pages_crawled=self._stats.pages_crawled,
             errors=self._stats.errors,
+            retries=self._stats.retries,
+            circuit_trips=self._stats.circuit_trips,
+            bytes_downloaded=self._stats.bytes_downloaded,
+            http_stats=dict(self._stats.http),
             duration_seconds=self._stats.elapsed_seconds,
+            first_listing_seconds=self._stats.first_listing_seconds,
+            deadline_reached=self._stats.deadline_reached,
+            abandoned=self._stats.abandoned,
+            concurrency_limit=self._stats.concurrency_limit,
+            learned_concurrency_limit=self._stats.learned_concurrency_limit,
+            pages_saved=self._stats.pages_saved,
+            revisits_skipped=self._stats.revisits_skipped,
+            revisit=dict(self._stats.revisit),
+            pagination=dict(self._stats.pagination),
         )
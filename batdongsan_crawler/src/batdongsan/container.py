@@ -5,18 +5,27 @@ Wires up all dependencies following the Composition Root pattern.
 """
 import sys
 from dataclasses import dataclass
+from typing import Optional
 
-from batdongsan.domain.interfaces import IHttpClient, IParser, IStorage, IUrlFrontier
+from batdongsan.domain.interfaces import IHttpClient, IParser, IStorage, IUrlFrontier, UrlType
 from batdongsan.infrastructure import (
     CurlCffiClient,
+    CachingHttpClient,
+    CoalescingHttpClient,
+    RecordingHttpClient,
+    ReplayHttpClient,
     BatDongSanParser,
+    LxmlBatDongSanParser,
     JsonLinesStorage,
     CsvStorage,
     MultiStorage,
     MemoryUrlFrontier,
+    SqliteUrlFrontier,
+    SqliteRevisitStore,
     settings,
 )
-from batdongsan.application import SpiderService
+from batdongsan.infrastructure.storage import new_run_id, run_path
+from batdongsan.application import SpiderService, HostRateLimiter, RevisitPolicy, RevisitScheduler
 
 
 @dataclass
@@ -32,12 +41,22 @@ class Container:
     storage: IStorage
     frontier: IUrlFrontier
     spider_service: SpiderService
+    run_id: Optional[str] = None    # Set when the frontier is persisted
 
 
 def create_container(
     output_dir: str = None,
     max_concurrent: int = None,
     crawl_details: bool = None,
+    requests_per_second: Optional[float] = None,
+    use_cache: Optional[bool] = None,
+    record_path: Optional[str] = None,
+    replay_path: Optional[str] = None,
+    deadline: Optional[float] = None,
+    frontier_backend: Optional[str] = None,
+    run_id: Optional[str] = None,
+    revisit: Optional[bool] = None,
+    parser_backend: Optional[str] = None,
 ) -> Container:
     """
     Create a fully wired container.
@@ -46,6 +65,15 @@ def create_container(
         output_dir: Output directory for storage
         max_concurrent: Maximum concurrent requests
         crawl_details: Whether to crawl detail pages
+        requests_per_second: Per-host request rate (0 disables limiting)
+        use_cache: Whether to use the persistent response cache
+        record_path: Archive directory to record every fetch into
+        replay_path: Archive directory to serve fetches from instead of the network
+        deadline: Time budget for the crawl in seconds (0 = none)
+        frontier_backend: "memory" or "sqlite"
+        run_id: Persisted run to continue (implies the sqlite frontier)
+        revisit: Whether to skip detail pages not due for a revisit
+        parser_backend: "bs4" or "lxml"
         
     Returns:
         Container with all dependencies
@@ -54,11 +82,71 @@ def create_container(
     output_dir = output_dir or settings.output_dir
     max_concurrent = max_concurrent if max_concurrent is not None else settings.max_concurrent
     crawl_details = crawl_details if crawl_details is not None else settings.crawl_details
+    use_cache = use_cache if use_cache is not None else settings.cache_enabled
+    record_path = record_path or settings.record_path
+    replay_path = replay_path or settings.replay_path
+    frontier_backend = frontier_backend or settings.frontier_backend
+    revisit = revisit if revisit is not None else settings.revisit_enabled
+    parser_backend = parser_backend or settings.parser_backend
+    if run_id:
+        frontier_backend = "sqlite"
+    if requests_per_second is None:
+        # Nobody to be polite to when replaying offline
+        requests_per_second = 0 if replay_path else settings.requests_per_second
     
     # Create infrastructure
-    http_client = CurlCffiClient()
-    parser = BatDongSanParser()
-    frontier = MemoryUrlFrontier()
+    http_client: IHttpClient
+    if replay_path:
+        http_client = ReplayHttpClient(
+            replay_path,
+            latency=settings.replay_latency,
+            jitter=settings.replay_jitter,
+            error_rate=settings.replay_error_rate,
+            block_rate=settings.replay_block_rate,
+        )
+    else:
+        # One session must fit every request the spider may have in flight
+        http_client = CurlCffiClient(max_clients=max(10, max_concurrent))
+        if record_path:
+            http_client = RecordingHttpClient(http_client, record_path)
+    if use_cache:
+        http_client = CachingHttpClient(
+            http_client,
+            path=settings.cache_path,
+            ttl_by_type={
+                UrlType.LISTING_PAGE: settings.cache_listing_ttl,
+                UrlType.DETAIL_PAGE: settings.cache_detail_ttl,
+            },
+        )
+    if settings.coalesce_requests:
+        http_client = CoalescingHttpClient(http_client)
+    parser: IParser
+    if parser_backend == "lxml":
+        parser = LxmlBatDongSanParser()
+    elif parser_backend == "bs4":
+        parser = BatDongSanParser()
+    else:
+        raise ValueError(f"Unknown parser backend: {parser_backend}")
+    frontier: IUrlFrontier
+    if frontier_backend == "sqlite":
+        run_id = run_id or new_run_id()
+        frontier = SqliteUrlFrontier(str(run_path(run_id)))
+    elif frontier_backend == "memory":
+        frontier = MemoryUrlFrontier()
+    else:
+        raise ValueError(f"Unknown frontier backend: {frontier_backend}")
+    rate_limiter = HostRateLimiter(requests_per_second, settings.rate_burst)
+    revisit_scheduler = None
+    if revisit:
+        revisit_scheduler = RevisitScheduler(
+            SqliteRevisitStore(settings.revisit_path),
+            RevisitPolicy(
+                initial_interval=settings.revisit_initial_interval,
+                min_interval=settings.revisit_min_interval,
+                max_interval=settings.revisit_max_interval,
+                change_probability=settings.revisit_change_probability,
+            ),
+        )
     
     # Multi-storage: both JSONL and CSV
     storage = MultiStorage([
@@ -74,6 +162,9 @@ def create_container(
         frontier=frontier,
         max_concurrent=max_concurrent,
         crawl_details=crawl_details,
+        rate_limiter=rate_limiter,
+        deadline=deadline,
+        revisit_scheduler=revisit_scheduler,
     )
     
     return Container(
@@ -82,4 +173,5 @@ def create_container(
         storage=storage,
         frontier=frontier,
         spider_service=spider_service,
+        run_id=run_id,
     )
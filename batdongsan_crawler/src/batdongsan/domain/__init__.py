@@ -14,9 +14,16 @@ from .interfaces import (
     IParser,
     IStorage,
     IUrlFrontier,
+    IRevisitStore,
     CrawlUrl,
     UrlType,
+    FetchResult,
+    FetchTimings,
+    PageHistory,
+    Markup,
 )
+from .exceptions import FailureKind, FetchError, BlockedError
+from .deadline import crawl_deadline, set_deadline, deadline_remaining, deadline_expired
 
 __all__ = [
     "PropertyListing",
@@ -31,6 +38,18 @@ __all__ = [
     "IParser",
     "IStorage",
     "IUrlFrontier",
+    "IRevisitStore",
     "CrawlUrl",
     "UrlType",
+    "FetchResult",
+    "FetchTimings",
+    "PageHistory",
+    "Markup",
+    "FailureKind",
+    "FetchError",
+    "BlockedError",
+    "crawl_deadline",
+    "set_deadline",
+    "deadline_remaining",
+    "deadline_expired",
 ]
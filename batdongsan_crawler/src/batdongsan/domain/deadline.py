@@ -0,0 +1,43 @@
+"""
+Domain Layer - Deadlines
+
+Crawl-wide time budget carried in a context variable, so every task
+spawned by the spider sees it and HTTP clients can clamp their timeouts
+without it being passed through each call.
+"""
+import time
+from contextvars import ContextVar, Token
+from typing import Optional
+
+
+# time.monotonic() value after which no more work should start
+crawl_deadline: ContextVar[Optional[float]] = ContextVar("crawl_deadline", default=None)
+
+
+def set_deadline(budget: Optional[float]) -> Token:
+    """
+    Start a deadline `budget` seconds from now in the current context.
+    
+    Tasks created afterwards inherit it. A budget of None (or <= 0)
+    clears the deadline.
+    
+    Returns:
+        Token for crawl_deadline.reset()
+    """
+    if not budget or budget <= 0:
+        return crawl_deadline.set(None)
+    return crawl_deadline.set(time.monotonic() + budget)
+
+
+def deadline_remaining() -> Optional[float]:
+    """Seconds left before the current deadline, or None if there is none"""
+    deadline = crawl_deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def deadline_expired() -> bool:
+    """Whether the current deadline has passed"""
+    remaining = deadline_remaining()
+    return remaining is not None and remaining <= 0
@@ -4,8 +4,10 @@ Domain Layer - Core business entities
 These entities are pure Python with no external dependencies.
 They represent the core business concepts of the crawler.
 """
-from dataclasses import dataclass, field
-from typing import Optional, List
+import hashlib
+import json
+from dataclasses import asdict, dataclass, field
+from typing import Any, Optional, List, Dict
 from datetime import datetime
 from enum import Enum
 
@@ -123,6 +125,17 @@ class PropertyListing:
     is_vip: bool = False
     crawled_at: datetime = field(default_factory=datetime.now)
     
+    def content_fingerprint(self) -> str:
+        """
+        Hash of everything the listing says, except when it was crawled.
+        
+        Equal fingerprints across two crawls mean the page did not change.
+        """
+        content = asdict(self)
+        del content["crawled_at"]
+        encoded = json.dumps(content, sort_keys=True, default=str, ensure_ascii=False)
+        return hashlib.blake2b(encoded.encode(), digest_size=16).hexdigest()
+    
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization"""
         return {
@@ -165,5 +178,18 @@ class CrawlResult:
     total_found: int = 0
     pages_crawled: int = 0
     errors: int = 0
+    retries: int = 0
+    circuit_trips: int = 0
+    bytes_downloaded: int = 0
+    http_stats: Dict[str, int] = field(default_factory=dict)
     duration_seconds: float = 0.0
+    first_listing_seconds: Optional[float] = None
+    deadline_reached: bool = False
+    abandoned: int = 0
+    concurrency_limit: int = 0
+    learned_concurrency_limit: int = 0
+    pages_saved: int = 0            # Listing pages skipped by the pagination cutoff
+    pagination: Dict[str, Dict[str, Any]] = field(default_factory=dict)   # Per category
+    revisits_skipped: int = 0       # Detail pages not due for a revisit
+    revisit: Dict[str, int] = field(default_factory=dict)     # Revisit scheduler counters
     error_message: Optional[str] = None
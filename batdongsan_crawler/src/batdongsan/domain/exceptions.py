@@ -0,0 +1,63 @@
+"""
+Domain Layer - Exceptions
+
+Errors raised through the domain interfaces so that the application
+layer can react to them without knowing the infrastructure.
+"""
+from enum import Enum
+from typing import Optional
+
+
+class FailureKind(Enum):
+    """How a failed fetch should be handled"""
+    TRANSIENT = "transient"    # Timeouts, resets, 5xx: retry with backoff
+    PERMANENT = "permanent"    # 404, 410, bad URL: never retry
+    BLOCK = "block"            # 429/403/503, challenge: slow down, then retry
+
+
+class FetchError(Exception):
+    """A page could not be fetched"""
+    
+    def __init__(
+        self,
+        url: str,
+        kind: FailureKind = FailureKind.TRANSIENT,
+        message: str = "",
+        status: Optional[int] = None,
+        retry_after: Optional[float] = None,
+    ):
+        """
+        Args:
+            url: URL that failed
+            kind: Failure classification
+            message: Human readable reason
+            status: HTTP status code, if a response was received
+            retry_after: Seconds the server asked us to wait (Retry-After)
+        """
+        self.url = url
+        self.kind = kind
+        self.status = status
+        self.retry_after = retry_after
+        super().__init__(message or f"{kind.value} failure fetching {url} (status={status})")
+    
+    @property
+    def retryable(self) -> bool:
+        return self.kind is not FailureKind.PERMANENT
+
+
+class BlockedError(FetchError):
+    """
+    The site pushed back on the request.
+    
+    Raised for throttling and anti-bot responses (HTTP 429/403/503,
+    Cloudflare challenge pages) so callers can slow down.
+    """
+    
+    def __init__(
+        self,
+        url: str,
+        message: str = "",
+        status: Optional[int] = None,
+        retry_after: Optional[float] = None,
+    ):
+        super().__init__(url, FailureKind.BLOCK, message, status, retry_after)
@@ -6,11 +6,24 @@ Following Dependency Inversion Principle - domain defines what it needs,
 infrastructure provides the implementation.
 """
 from abc import ABC, abstractmethod
-from typing import Optional, List, Dict, Any, AsyncIterator
+import asyncio
+from typing import (
+    Optional, List, Dict, Any, AsyncIterator, Awaitable, Callable, Iterable, Set, Union,
+)
 from dataclasses import dataclass, field
 from enum import Enum
 
+from .deadline import deadline_expired
 from .entities import PropertyListing
+from .exceptions import BlockedError, FailureKind, FetchError
+
+
+# Page markup: raw response bytes (preferred, parsed without decoding) or text
+Markup = Union[bytes, str]
+
+# Awaited with a URL before a request the crawl did not ask for (connection
+# warm-up); False means the request must not be sent
+RequestGate = Callable[[str], Awaitable[bool]]
 
 
 class UrlType(Enum):
@@ -27,9 +40,76 @@ class CrawlUrl:
     priority: int = 1
     depth: int = 0
     retries: int = 0
+    not_before: float = 0.0     # Unix time before which it must not be fetched
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass
+class PageHistory:
+    """What revisits of one page have shown so far"""
+    url: str
+    fingerprint: str                # Content fingerprint at the last fetch
+    fetched_at: float               # Unix time of the last fetch
+    visits: int = 1
+    changes: int = 0                # Revisits that found the content changed
+    observed: float = 0.0           # Seconds covered by revisits (sum of intervals)
+    next_due: float = 0.0           # Unix time from which a refetch is worthwhile
+
+
+@dataclass(slots=True)
+class FetchTimings:
+    """Cumulative seconds from request start, as reported by the transport"""
+    dns: float = 0.0        # Name lookup done
+    connect: float = 0.0    # TCP connected
+    tls: float = 0.0        # TLS handshake done
+    ttfb: float = 0.0       # First response byte received
+    total: float = 0.0      # Transfer complete
+
+
+@dataclass(slots=True)
+class FetchResult:
+    """
+    Outcome of a single fetch.
+    
+    Either a response (status, headers, raw bytes) or a classified
+    failure (`error` set). The body is kept as bytes and only decoded
+    to text when `text` is first accessed.
+    """
+    url: str
+    status: int = 0                                         # 0 if no response
+    headers: Dict[str, str] = field(default_factory=dict)   # Lower-cased names
+    content: bytes = b""
+    encoding: Optional[str] = None                          # Charset from Content-Type
+    final_url: Optional[str] = None                         # After redirects
+    timings: FetchTimings = field(default_factory=FetchTimings)
+    error: Optional[FailureKind] = None
+    error_message: str = ""
+    retry_after: Optional[float] = None
+    from_cache: bool = False                                # Served from disk, no request
+    revalidated: bool = False                               # Stored body confirmed by a 304
+    _text: Optional[str] = field(default=None, repr=False, compare=False)
+    
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+    
+    @property
+    def text(self) -> str:
+        """Body decoded with the response charset (UTF-8 by default)"""
+        if self._text is None:
+            self._text = self.content.decode(self.encoding or 'utf-8', errors='replace')
+        return self._text
+    
+    def raise_for_error(self) -> None:
+        """Raise the matching FetchError if the fetch failed"""
+        if self.error is None:
+            return
+        status = self.status or None
+        if self.error is FailureKind.BLOCK:
+            raise BlockedError(self.url, self.error_message, status, self.retry_after)
+        raise FetchError(self.url, self.error, self.error_message, status, self.retry_after)
+
+
 class IHttpClient(ABC):
     """
     Abstract HTTP client interface.
@@ -39,18 +119,112 @@ class IHttpClient(ABC):
     """
     
     @abstractmethod
-    async def get(self, url: str) -> Optional[str]:
+    async def fetch(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> FetchResult:
         """
-        Fetch URL and return HTML content.
+        Fetch URL and describe the outcome.
+        
+        Failures are reported through FetchResult.error rather than
+        raised, so callers always get status, timings and the reason.
         
         Args:
             url: URL to fetch
+            headers: Extra request headers (e.g. If-None-Match)
             
         Returns:
-            HTML content or None if failed
+            FetchResult (2xx/3xx/304 responses have error=None)
         """
         pass
     
+    async def get(self, url: str) -> str:
+        """
+        Fetch URL and return HTML content.
+        
+        Args:
+            url: URL to fetch
+            
+        Returns:
+            HTML content, decoded with the response charset
+            
+        Raises:
+            BlockedError: If the site throttled or challenged the request
+            FetchError: If the fetch failed for any other reason (see
+                FetchError.kind); get() never returns None
+        """
+        result = await self.fetch(url)
+        result.raise_for_error()
+        return result.text
+    
+    async def get_many(self, urls: Iterable[str], limit: int = 8) -> AsyncIterator[FetchResult]:
+        """
+        Fetch many URLs, yielding results in completion order.
+        
+        At most `limit` fetches are in flight; URLs are pulled from the
+        iterable lazily as slots free up, so it may be a generator.
+        Failures are yielded like any other result (see FetchResult.error).
+        Closing the iterator early cancels the fetches still in flight.
+        
+        Args:
+            urls: URLs to fetch
+            limit: Maximum number of concurrent fetches
+            
+        Yields:
+            FetchResult for each URL, fastest first
+        """
+        pending_urls = iter(urls)
+        in_flight: Set["asyncio.Future[FetchResult]"] = set()
+        try:
+            while True:
+                while len(in_flight) < max(1, limit):
+                    url = next(pending_urls, None)
+                    if url is None:
+                        break
+                    in_flight.add(asyncio.ensure_future(self.fetch(url)))
+                if not in_flight:
+                    return
+                    
+                done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in in_flight:
+                task.cancel()
+    
+    async def warmup(self, urls: List[str], gate: Optional[RequestGate] = None) -> None:
+        """
+        Prepare connections to the origins of `urls` before crawling.
+        
+        Optional: the default does nothing. Decorators forward it to
+        the client they wrap.
+        
+        Args:
+            urls: URLs whose origins will be crawled
+            gate: Awaited before every warm-up request, now or later
+                (reopening dropped connections); lets the caller apply
+                its politeness and veto requests
+        """
+        return None
+    
+    def is_fresh(self, url: str) -> bool:
+        """
+        Whether fetch(url) would be answered without touching the network.
+        
+        Lets callers skip per-host politeness (rate limit, circuit
+        breaker) for responses a cache already holds. The default says
+        no; caches answer for themselves and decorators forward it.
+        
+        Args:
+            url: URL about to be fetched
+        """
+        return False
+    
+    def stats(self) -> Dict[str, int]:
+        """Client-specific counters (cache hits, ...) for crawl statistics"""
+        return {}
+    
     @abstractmethod
     async def close(self) -> None:
         """Close the client and cleanup resources"""
@@ -62,16 +236,25 @@ class IParser(ABC):
     Abstract HTML parser interface.
     
     Each website needs its own parser implementation.
+    Markup may be given as raw bytes plus the charset announced by the
+    server, so parsers can hand it to the HTML engine without a
+    decode/re-encode round trip.
     """
     
     @abstractmethod
-    def parse_listing_page(self, html: str, metadata: Dict[str, Any] = None) -> List[PropertyListing]:
+    def parse_listing_page(
+        self,
+        html: Markup,
+        metadata: Dict[str, Any] = None,
+        encoding: Optional[str] = None,
+    ) -> List[PropertyListing]:
         """
         Parse a listing page and extract property listings.
         
         Args:
-            html: Raw HTML content
+            html: Raw HTML content (bytes or str)
             metadata: Additional context (listing_type, property_type, etc.)
+            encoding: Charset of byte content, if known
             
         Returns:
             List of PropertyListing entities
@@ -79,13 +262,19 @@ class IParser(ABC):
         pass
     
     @abstractmethod
-    def parse_detail_page(self, html: str, url: str) -> Optional[PropertyListing]:
+    def parse_detail_page(
+        self,
+        html: Markup,
+        url: str,
+        encoding: Optional[str] = None,
+    ) -> Optional[PropertyListing]:
         """
         Parse a detail page for full property information.
         
         Args:
-            html: Raw HTML content
+            html: Raw HTML content (bytes or str)
             url: Page URL for reference
+            encoding: Charset of byte content, if known
             
         Returns:
             PropertyListing with full details or None
@@ -93,17 +282,33 @@ class IParser(ABC):
         pass
     
     @abstractmethod
-    def extract_detail_urls(self, html: str) -> List[str]:
+    def extract_detail_urls(self, html: Markup, encoding: Optional[str] = None) -> List[str]:
         """
         Extract detail page URLs from a listing page.
         
         Args:
-            html: Raw HTML content
+            html: Raw HTML content (bytes or str)
+            encoding: Charset of byte content, if known
             
         Returns:
             List of detail page URLs
         """
         pass
+    
+    def parse_last_page(self, html: Markup, encoding: Optional[str] = None) -> Optional[int]:
+        """
+        Highest page number linked from a listing page's pager.
+        
+        Optional: the default reports no pager.
+        
+        Args:
+            html: Raw HTML content (bytes or str)
+            encoding: Charset of byte content, if known
+            
+        Returns:
+            Page number, or None if the page has no pager
+        """
+        return None
 
 
 class IStorage(ABC):
@@ -152,11 +357,54 @@ class IUrlFrontier(ABC):
         """Get next URL to crawl"""
         pass
     
+    async def get_async(self) -> Optional[CrawlUrl]:
+        """
+        Wait for the next URL to crawl.
+        
+        Returns None once the crawl is over: nothing queued, delayed or
+        pending, or the crawl deadline has passed. The default polls
+        get(); implementations that know when work arrives override it.
+        """
+        while not deadline_expired():
+            crawl_url = self.get()
+            if crawl_url is not None or self.is_empty():
+                return crawl_url
+            await asyncio.sleep(0.5)
+        return None
+    
     @abstractmethod
     def complete(self, url: str) -> None:
         """Mark URL as completed"""
         pass
     
+    def release(self, url: str) -> None:
+        """
+        Hand back a URL taken with get() that was not finished.
+        
+        Used when the crawl stops before the URL could be fetched or
+        retried (deadline). A persistent frontier keeps it for the next
+        run; the default, for frontiers that end with the crawl, treats
+        it as completed.
+        
+        Args:
+            url: URL returned by get()
+        """
+        self.complete(url)
+    
+    @abstractmethod
+    def reschedule(self, crawl_url: CrawlUrl, delay: float) -> None:
+        """
+        Put an already-seen URL back in the queue after a delay.
+        
+        Used for retries: bypasses deduplication, and the URL is not
+        returned by get() until the delay has passed.
+        
+        Args:
+            crawl_url: URL to retry
+            delay: Seconds to wait before it becomes available
+        """
+        pass
+    
     @abstractmethod
     def is_empty(self) -> bool:
         """Check if frontier is empty"""
@@ -166,3 +414,38 @@ class IUrlFrontier(ABC):
     def __len__(self) -> int:
         """Return number of URLs in queue"""
         pass
+    
+    def close(self) -> None:
+        """
+        Persist and release resources at the end of a crawl.
+        
+        Optional: the default does nothing.
+        """
+        return None
+
+
+class IRevisitStore(ABC):
+    """
+    Abstract store of per-page fetch histories.
+    
+    Persists across runs, so recurring crawls can skip pages that are
+    unlikely to have changed since they were last fetched.
+    """
+    
+    @abstractmethod
+    def get(self, url: str) -> Optional[PageHistory]:
+        """History of a page, or None if it was never fetched"""
+        pass
+    
+    @abstractmethod
+    def put(self, history: PageHistory) -> None:
+        """Save a page's history"""
+        pass
+    
+    def close(self) -> None:
+        """
+        Persist and release resources at the end of a crawl.
+        
+        Optional: the default does nothing.
+        """
+        return None
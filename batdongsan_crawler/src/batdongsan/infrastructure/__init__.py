@@ -1,17 +1,38 @@
 """Infrastructure Layer"""
 from .config import CrawlerSettings, settings
-from .http import CurlCffiClient
-from .parsers import BatDongSanParser
-from .storage import JsonStorage, JsonLinesStorage, CsvStorage, MultiStorage, MemoryUrlFrontier
+from .http import (
+    CurlCffiClient,
+    CachingHttpClient,
+    CoalescingHttpClient,
+    RecordingHttpClient,
+    ReplayHttpClient,
+)
+from .parsers import BatDongSanParser, LxmlBatDongSanParser
+from .storage import (
+    JsonStorage,
+    JsonLinesStorage,
+    CsvStorage,
+    MultiStorage,
+    MemoryUrlFrontier,
+    SqliteUrlFrontier,
+    SqliteRevisitStore,
+)
 
 __all__ = [
     "CrawlerSettings",
     "settings",
     "CurlCffiClient",
+    "CachingHttpClient",
+    "CoalescingHttpClient",
+    "RecordingHttpClient",
+    "ReplayHttpClient",
     "BatDongSanParser",
+    "LxmlBatDongSanParser",
     "JsonStorage",
     "JsonLinesStorage",
     "CsvStorage",
     "MultiStorage",
     "MemoryUrlFrontier",
+    "SqliteUrlFrontier",
+    "SqliteRevisitStore",
 ]
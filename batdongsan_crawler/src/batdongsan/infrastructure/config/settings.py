@@ -5,7 +5,7 @@ Uses pydantic-settings for environment variable support.
 """
 from pydantic_settings import BaseSettings
 from pydantic import Field
-from typing import Tuple
+from typing import List, Optional
 
 
 class CrawlerSettings(BaseSettings):
@@ -17,18 +17,146 @@ class CrawlerSettings(BaseSettings):
     """
     
     # HTTP Client settings
-    max_concurrent: int = Field(default=3, description="Maximum concurrent requests")
-    delay_min: float = Field(default=2.0, description="Minimum delay between requests")
-    delay_max: float = Field(default=4.0, description="Maximum delay between requests")
-    timeout: int = Field(default=30, description="Request timeout in seconds")
+    max_concurrent: int = Field(default=3, description="Maximum in-flight requests")
+    timeout: int = Field(default=30, description="Total request timeout in seconds")
+    connect_timeout: float = Field(default=10.0, description="TCP/TLS connect timeout (s)")
+    first_byte_timeout: float = Field(
+        default=15.0, description="Abort when no byte arrives for this long (s)"
+    )
+    crawl_deadline: float = Field(default=0, description="Budget for a whole run (s), 0 = none")
     max_retries: int = Field(default=3, description="Maximum retry attempts")
+    retry_base_delay: float = Field(default=1.0, description="Backoff for the first retry (s)")
+    retry_max_delay: float = Field(default=60.0, description="Cap on retry backoff (s)")
+    max_retry_after: float = Field(
+        default=300.0, description="Longest Retry-After honoured before giving up (s)"
+    )
+    
+    # Adaptive concurrency (AIMD between min_concurrent and max_concurrent)
+    adaptive_concurrency: bool = Field(default=True, description="Adapt in-flight limit at runtime")
+    min_concurrent: int = Field(default=1, description="Lowest in-flight limit")
+    initial_concurrent: int = Field(default=2, description="Starting in-flight limit")
+    latency_tolerance: float = Field(
+        default=2.0, description="Latency growth over baseline treated as congestion"
+    )
+    latency_window: float = Field(
+        default=60.0, description="Seconds the lowest latency sample stays the baseline"
+    )
+    min_latency_samples: int = Field(
+        default=20, description="Samples per page type before latency can lower the limit"
+    )
+    
+    # Rate limiting (per host, shared by all workers)
+    requests_per_second: float = Field(default=1.0, description="Per-host request rate, 0 = off")
+    rate_burst: int = Field(default=3, description="Requests allowed back-to-back after idling")
+    
+    # Circuit breaker (per host): pause all workers after repeated blocks
+    circuit_breaker_threshold: int = Field(
+        default=5, description="Consecutive blocked responses that pause a host, 0 = off"
+    )
+    circuit_breaker_cooldown: float = Field(
+        default=30.0, description="Pause before probing a blocked host again (s)"
+    )
     
     # Browser impersonation
     impersonate: str = Field(default="chrome120", description="Browser to impersonate")
     
+    # HTTP version and connection reuse. "auto" keeps the impersonated
+    # browser's ALPN choice (HTTP/2 over TLS for Chrome); "1.1", "2" and
+    # "2-prior-knowledge" (cleartext h2, for local test servers) force one.
+    http_version: str = Field(default="auto", description="auto, 1.1, 2 or 2-prior-knowledge")
+    multiplex_connections: int = Field(
+        default=0, description="Share at most N HTTP/2 connections per host, 0 = off"
+    )
+    
+    # Connection warm-up and keep-alive
+    warmup_connections: int = Field(
+        default=2, description="Connections per session opened before crawling, 0 = off"
+    )
+    dns_cache_ttl: int = Field(default=600, description="Seconds resolved hosts stay cached")
+    keepalive_interval: float = Field(
+        default=30.0, description="Seconds between connection upkeep passes, 0 = off"
+    )
+    connection_max_idle: float = Field(
+        default=90.0, description="Idle seconds after which connections are dropped/rewarmed"
+    )
+    
+    # Session pool
+    session_pool_size: int = Field(default=1, description="Number of curl-cffi sessions")
+    impersonate_profiles: List[str] = Field(
+        default_factory=list, description="Profiles rotated across pooled sessions"
+    )
+    session_assignment: str = Field(
+        default="least_loaded", description="Session choice: least_loaded or sticky"
+    )
+    session_min_health: float = Field(
+        default=0.5, description="Health score below which a session is recreated"
+    )
+    
+    # Share one fetch between identical requests that are in flight together
+    coalesce_requests: bool = Field(default=True, description="Collapse duplicate in-flight GETs")
+    
+    # Response cache (conditional revalidation on recrawl)
+    cache_enabled: bool = Field(default=False, description="Cache responses on disk")
+    cache_path: str = Field(default=".cache/http_cache.sqlite", description="Cache database")
+    cache_listing_ttl: float = Field(default=3600, description="Listing page freshness (s)")
+    cache_detail_ttl: float = Field(default=7 * 86400, description="Detail page freshness (s)")
+    
+    # Revisit scheduling for recurring crawls: detail pages are refetched only
+    # once their observed change rate makes a change likely (Poisson model)
+    revisit_enabled: bool = Field(
+        default=False, description="Skip detail pages not due for a revisit"
+    )
+    revisit_path: str = Field(default=".cache/revisit.sqlite", description="Page history database")
+    revisit_initial_interval: float = Field(default=86400, description="First revisit after (s)")
+    revisit_min_interval: float = Field(default=3600, description="Shortest revisit interval (s)")
+    revisit_max_interval: float = Field(default=2592000, description="Longest revisit interval (s)")
+    revisit_change_probability: float = Field(
+        default=0.5, description="Likelihood of a change at which a page is due"
+    )
+    
+    # Record/replay archives (offline benchmarking)
+    record_path: Optional[str] = Field(default=None, description="Record fetches to this archive")
+    replay_path: Optional[str] = Field(default=None, description="Serve fetches from this archive")
+    replay_latency: float = Field(
+        default=0.0, description="Simulated latency per replayed fetch (s)"
+    )
+    replay_jitter: float = Field(default=0.0, description="Random latency added on top (s)")
+    replay_error_rate: float = Field(default=0.0, description="Share of injected transient errors")
+    replay_block_rate: float = Field(default=0.0, description="Share of injected 429 responses")
+    
+    # HTML parser: "bs4" (BeautifulSoup over lxml) or "lxml" (same output,
+    # precompiled XPath on the libxml2 tree, much less CPU per page)
+    parser_backend: str = Field(default="bs4", description="bs4 or lxml")
+    
+    # Frontier lanes: URLs served per round from each lane while both have work
+    listing_lane_weight: int = Field(default=1, description="Listing pages per round")
+    detail_lane_weight: int = Field(default=3, description="Detail pages per round")
+    
+    # URL canonicalization: query parameters dropped before deduplication and
+    # caching ("name" or "prefix*"), and canonical digests memoized in an LRU
+    ignored_query_params: List[str] = Field(
+        default=["utm_*", "fbclid", "gclid", "ref", "sessionid"],
+        description="Query parameters that never change the page",
+    )
+    url_cache_size: int = Field(default=65536, description="Memoized URL digests")
+    
+    # URL deduplication in the memory frontier: "digest" (compact array of
+    # 64-bit digests, ~20 bytes/URL) or "set" (Python set, ~80 bytes/URL)
+    seen_set: str = Field(default="digest", description="digest or set")
+    
+    # Frontier storage: "memory", or "sqlite" to checkpoint the queue and resume runs
+    frontier_backend: str = Field(default="memory", description="memory or sqlite")
+    frontier_dir: str = Field(default=".frontier", description="Directory of run databases")
+    frontier_batch_size: int = Field(default=256, description="Writes per frontier commit")
+    
     # Crawl settings
+    seed_lookahead: int = Field(default=64, description="Seed URLs kept queued ahead of workers")
     crawl_details: bool = Field(default=False, description="Also crawl detail pages")
     max_pages: int = Field(default=10, description="Maximum pages per category")
+    adaptive_pagination: bool = Field(
+        default=True, description="Request a category's next page only after new listings"
+    )
+    pagination_window: int = Field(default=1, description="Pages of a category requested ahead")
     
     # Output settings
     output_dir: str = Field(default="output", description="Output directory")
@@ -36,10 +164,6 @@ class CrawlerSettings(BaseSettings):
     # Base URL
     base_url: str = Field(default="https://batdongsan.com.vn", description="Base URL")
     
-    @property
-    def delay_range(self) -> Tuple[float, float]:
-        return (self.delay_min, self.delay_max)
-    
     class Config:
         env_prefix = "BATDONGSAN_"
         env_file = ".env"
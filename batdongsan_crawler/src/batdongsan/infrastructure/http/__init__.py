@@ -1,4 +1,18 @@
 """HTTP package"""
 from .curl_client import CurlCffiClient
+from .cache import CachingHttpClient
+from .coalescing import CoalescingHttpClient
+from .challenge import detect_challenge
+from .replay import HttpArchive, RecordingHttpClient, ReplayHttpClient
+from .session_pool import SessionPool
 
-__all__ = ["CurlCffiClient"]
+__all__ = [
+    "CurlCffiClient",
+    "CachingHttpClient",
+    "CoalescingHttpClient",
+    "SessionPool",
+    "detect_challenge",
+    "HttpArchive",
+    "RecordingHttpClient",
+    "ReplayHttpClient",
+]
@@ -0,0 +1,197 @@
+"""
+Infrastructure Layer - Persistent HTTP Response Cache
+
+Decorates any IHttpClient with an on-disk cache (SQLite) so recrawls
+skip fresh pages and revalidate stale ones with conditional requests.
+"""
+import re
+import sqlite3
+import time
+import zlib
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from batdongsan.domain.interfaces import IHttpClient, FetchResult, RequestGate, UrlType
+from batdongsan.infrastructure.storage.canonical import url_fingerprint
+
+
+DETAIL_URL_PATTERN = re.compile(r'-pr\d+')
+
+
+def guess_url_type(url: str) -> UrlType:
+    """Classify a batdongsan URL as listing or detail page"""
+    return UrlType.DETAIL_PAGE if DETAIL_URL_PATTERN.search(url) else UrlType.LISTING_PAGE
+
+
+class CachingHttpClient(IHttpClient):
+    """
+    HTTP client decorator with a persistent response cache.
+    
+    - Fresh entries (younger than the TTL for their UrlType) are served
+      without touching the network.
+    - Stale entries are revalidated with If-None-Match / If-Modified-Since;
+      a 304 refreshes the entry and serves the stored body.
+    - Anything else goes to the wrapped client and is stored.
+    
+    Entries are keyed by the frontier's normalized URL fingerprint.
+    """
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS responses (
+            key TEXT PRIMARY KEY,
+            url TEXT NOT NULL,
+            status INTEGER NOT NULL,
+            body BLOB NOT NULL,
+            encoding TEXT,
+            etag TEXT,
+            last_modified TEXT,
+            fetched_at REAL NOT NULL
+        )
+    """
+    
+    def __init__(
+        self,
+        inner: IHttpClient,
+        path: str,
+        ttl_by_type: Dict[UrlType, float],
+        url_type_of: Callable[[str], UrlType] = guess_url_type,
+    ):
+        """
+        Initialize the cache.
+        
+        Args:
+            inner: Client used for network fetches
+            path: SQLite database file
+            ttl_by_type: Seconds an entry stays fresh, per UrlType
+            url_type_of: Maps a URL to its UrlType for TTL lookup
+        """
+        self._inner = inner
+        self._ttl_by_type = ttl_by_type
+        self._url_type_of = url_type_of
+        
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(path)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(self.SCHEMA)
+        
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+    
+    async def fetch(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> FetchResult:
+        """
+        Fetch URL through the cache.
+        
+        Args:
+            url: URL to fetch
+            headers: Extra request headers (bypass the cache when given)
+            
+        Returns:
+            FetchResult, with from_cache=True when served from disk without
+            a request and revalidated=True when a 304 confirmed the stored body
+        """
+        if headers:
+            return await self._inner.fetch(url, headers)
+            
+        key = url_fingerprint(url)
+        row = self._db.execute(
+            "SELECT url, status, body, encoding, etag, last_modified, fetched_at "
+            "FROM responses WHERE key = ?",
+            (key,),
+        ).fetchone()
+        
+        if row is None:
+            self.misses += 1
+            result = await self._inner.fetch(url)
+            self._store(key, result)
+            return result
+            
+        cached_url, status, body, encoding, etag, last_modified, fetched_at = row
+        if self._fresh(url, fetched_at):
+            self.hits += 1
+            return FetchResult(
+                url=url, status=status, content=zlib.decompress(body), encoding=encoding,
+                final_url=cached_url, from_cache=True,
+            )
+            
+        conditional = {}
+        if etag:
+            conditional["If-None-Match"] = etag
+        if last_modified:
+            conditional["If-Modified-Since"] = last_modified
+        if not conditional:
+            self.misses += 1
+            result = await self._inner.fetch(url)
+            self._store(key, result)
+            return result
+            
+        result = await self._inner.fetch(url, conditional)
+        if result.ok and result.status == 304:
+            self.revalidated += 1
+            self._db.execute(
+                "UPDATE responses SET fetched_at = ? WHERE key = ?", (time.time(), key)
+            )
+            self._db.commit()
+            return FetchResult(
+                url=url, status=status, headers=result.headers, content=zlib.decompress(body),
+                encoding=encoding, final_url=cached_url, timings=result.timings,
+                revalidated=True,
+            )
+            
+        self.misses += 1
+        self._store(key, result)
+        return result
+    
+    def is_fresh(self, url: str) -> bool:
+        """Whether a fresh entry would answer fetch(url) from disk"""
+        row = self._db.execute(
+            "SELECT fetched_at FROM responses WHERE key = ?", (url_fingerprint(url),)
+        ).fetchone()
+        return row is not None and self._fresh(url, row[0])
+    
+    def _fresh(self, url: str, fetched_at: float) -> bool:
+        """Whether an entry stored at `fetched_at` is still within its TTL"""
+        return time.time() - fetched_at < self._ttl_by_type.get(self._url_type_of(url), 0)
+    
+    def _store(self, key: str, result: FetchResult) -> None:
+        """Persist a 200 response with its validators"""
+        if not result.ok or result.status != 200:
+            return
+        self._db.execute(
+            "INSERT OR REPLACE INTO responses "
+            "(key, url, status, body, encoding, etag, last_modified, fetched_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                key,
+                result.final_url or result.url,
+                result.status,
+                zlib.compress(result.content),
+                result.encoding,
+                result.headers.get("etag"),
+                result.headers.get("last-modified"),
+                time.time(),
+            ),
+        )
+        self._db.commit()
+    
+    async def warmup(self, urls: List[str], gate: Optional[RequestGate] = None) -> None:
+        """Warm up the wrapped client"""
+        await self._inner.warmup(urls, gate)
+    
+    def stats(self) -> Dict[str, int]:
+        """Cache counters merged with the wrapped client's"""
+        return {
+            **self._inner.stats(),
+            "cache_hits": self.hits,
+            "cache_misses": self.misses,
+            "cache_revalidated": self.revalidated,
+        }
+    
+    async def close(self) -> None:
+        """Close the wrapped client and the database"""
+        await self._inner.close()
+        self._db.close()
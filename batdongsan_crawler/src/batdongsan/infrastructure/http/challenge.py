@@ -0,0 +1,44 @@
+"""
+Infrastructure Layer - Challenge Page Detection
+
+Recognizes Cloudflare challenge/interstitial pages served with a
+success status, by scanning the head of the raw response body.
+"""
+from typing import Optional
+
+
+# Challenge pages announce themselves within the first few KB.
+# The generic "/cdn-cgi/challenge-platform/" script is deliberately not
+# a marker: Cloudflare injects it into ordinary pages as well.
+CHALLENGE_MARKERS = (
+    b"<title>Just a moment...</title>",
+    b"window._cf_chl_opt",
+    b"cf-browser-verification",
+    b"<title>Attention Required! | Cloudflare</title>",
+    b'id="challenge-form"',
+    b'id="challenge-running"',
+)
+
+# Bytes scanned from the start of the body
+SCAN_LIMIT = 16 * 1024
+
+
+def detect_challenge(content: bytes, limit: int = SCAN_LIMIT) -> Optional[str]:
+    """
+    Check whether a response body is a challenge page.
+    
+    Only a prefix of the body is searched and nothing is decoded, so
+    the check costs a few substring scans per response.
+    
+    Args:
+        content: Raw response body
+        limit: Number of leading bytes to scan
+        
+    Returns:
+        The matched marker, or None for a regular page
+    """
+    head = content[:limit]
+    for marker in CHALLENGE_MARKERS:
+        if marker in head:
+            return marker.decode("ascii")
+    return None
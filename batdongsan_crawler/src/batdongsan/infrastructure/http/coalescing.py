@@ -0,0 +1,77 @@
+"""
+Infrastructure Layer - Request Coalescing
+
+Single-flight decorator for IHttpClient: identical GETs that are in
+flight at the same time share one underlying fetch.
+"""
+import asyncio
+from typing import Dict, List, Optional
+
+from batdongsan.domain.interfaces import IHttpClient, FetchResult, RequestGate
+from batdongsan.infrastructure.storage.canonical import url_fingerprint
+
+
+class CoalescingHttpClient(IHttpClient):
+    """
+    HTTP client decorator collapsing duplicate in-flight requests.
+    
+    Requests are keyed by the frontier's normalized URL fingerprint.
+    The first caller starts the fetch; callers arriving before it
+    completes await the same result instead of hitting the network.
+    The shared fetch is shielded, so one waiter being cancelled does
+    not cancel it for the others.
+    """
+    
+    def __init__(self, inner: IHttpClient):
+        """
+        Args:
+            inner: Client performing the actual fetches
+        """
+        self._inner = inner
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self.coalesced = 0
+    
+    async def fetch(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> FetchResult:
+        """
+        Fetch URL, joining an identical request already in flight.
+        
+        Args:
+            url: URL to fetch
+            headers: Extra request headers (such requests are never shared)
+            
+        Returns:
+            FetchResult, possibly the same object handed to other callers
+        """
+        if headers:
+            return await self._inner.fetch(url, headers)
+            
+        key = url_fingerprint(url)
+        shared = self._in_flight.get(key)
+        if shared is not None:
+            self.coalesced += 1
+            return await asyncio.shield(shared)
+            
+        shared = asyncio.ensure_future(self._inner.fetch(url))
+        self._in_flight[key] = shared
+        shared.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        return await asyncio.shield(shared)
+    
+    async def warmup(self, urls: List[str], gate: Optional[RequestGate] = None) -> None:
+        """Warm up the wrapped client"""
+        await self._inner.warmup(urls, gate)
+    
+    def is_fresh(self, url: str) -> bool:
+        """Ask the wrapped client"""
+        return self._inner.is_fresh(url)
+    
+    def stats(self) -> Dict[str, int]:
+        """Coalescing counters merged with the wrapped client's"""
+        return {**self._inner.stats(), "coalesced_fetches": self.coalesced}
+    
+    async def close(self) -> None:
+        """Close the wrapped client"""
+        await self._inner.close()
@@ -5,13 +5,20 @@ Implements IHttpClient interface with TLS fingerprint impersonation
 to bypass Cloudflare protection.
 """
 import asyncio
-import random
-from typing import Optional, Dict
+import time
+from typing import Optional, Dict, List
+from urllib.parse import urlparse
 
+from curl_cffi import CurlHttpVersion, CurlInfo, CurlMOpt, CurlOpt
 from curl_cffi.requests import AsyncSession
 
-from batdongsan.domain.interfaces import IHttpClient
+from batdongsan.domain.deadline import deadline_remaining
+from batdongsan.domain.exceptions import FailureKind
+from batdongsan.domain.interfaces import IHttpClient, FetchResult, FetchTimings, RequestGate
 from batdongsan.infrastructure.config import settings
+from .challenge import detect_challenge
+from .errors import classify_exception, classify_status, parse_retry_after, timeout_phase
+from .session_pool import SessionPool
 
 
 class CurlCffiClient(IHttpClient):
@@ -19,33 +26,127 @@ class CurlCffiClient(IHttpClient):
     HTTP client using curl-cffi for Cloudflare bypass.
     
     curl-cffi impersonates real browser TLS fingerprints,
-    which helps bypass Cloudflare's bot detection.
+    which helps bypass Cloudflare's bot detection. Requests are spread
+    over a SessionPool so parallel requests do not all share one
+    session's cookies and fingerprint reputation.
     """
     
+    # Per-phase timings (and new connections) collected from libcurl for every response
+    TIMING_INFOS = [
+        CurlInfo.NAMELOOKUP_TIME,
+        CurlInfo.CONNECT_TIME,
+        CurlInfo.APPCONNECT_TIME,
+        CurlInfo.STARTTRANSFER_TIME,
+        CurlInfo.TOTAL_TIME,
+        CurlInfo.NUM_CONNECTS,
+    ]
+    
+    HTTP_VERSIONS = {
+        "auto": None,
+        "1.1": CurlHttpVersion.V1_1,
+        "2": CurlHttpVersion.V2TLS,
+        "2-prior-knowledge": CurlHttpVersion.V2_PRIOR_KNOWLEDGE,
+    }
+    
     def __init__(
         self,
         impersonate: str = None,
-        delay_range: tuple = None,
         timeout: int = None,
+        pool_size: Optional[int] = None,
+        profiles: Optional[List[str]] = None,
+        assignment: Optional[str] = None,
+        http_version: Optional[str] = None,
+        multiplex_connections: Optional[int] = None,
+        max_clients: Optional[int] = None,
+        warmup_connections: Optional[int] = None,
     ):
         """
         Initialize the HTTP client.
         
         Args:
             impersonate: Browser to impersonate (chrome120, firefox, safari)
-            delay_range: (min, max) seconds between requests
-            timeout: Request timeout in seconds
+            timeout: Total request timeout in seconds
+            pool_size: Number of pooled sessions
+            profiles: Impersonation profiles for the pool (defaults to [impersonate])
+            assignment: Session assignment strategy ("least_loaded" or "sticky")
+            http_version: "auto", "1.1", "2" or "2-prior-knowledge"
+            multiplex_connections: Connections per host that concurrent HTTP/2
+                requests are multiplexed over (0 = one connection per request)
+            max_clients: Requests each session may have in flight
+            warmup_connections: Connections per session opened by warmup()
         """
         self.impersonate = impersonate or settings.impersonate
-        self.delay_range = delay_range or settings.delay_range
         self.timeout = timeout or settings.timeout
-        self._session: Optional[AsyncSession] = None
+        self.connect_timeout = settings.connect_timeout
+        self.first_byte_timeout = settings.first_byte_timeout
+        self.timeouts: Dict[str, int] = {"connect": 0, "stall": 0, "total": 0, "deadline": 0}
+        self.http_version = http_version or settings.http_version
+        if self.http_version not in self.HTTP_VERSIONS:
+            raise ValueError(f"Unknown HTTP version: {self.http_version}")
+        if multiplex_connections is None:
+            multiplex_connections = settings.multiplex_connections
+        # Multiplexing needs HTTP/2; waiting on an HTTP/1.1 connection would serialize requests
+        self.multiplex_connections = 0 if self.http_version == "1.1" else multiplex_connections
+        self.max_clients = max_clients or max(10, settings.max_concurrent)
+        self.connections_opened = 0
+        if warmup_connections is None:
+            warmup_connections = settings.warmup_connections
+        self.warmup_connections = warmup_connections
+        self.keepalive_interval = settings.keepalive_interval
+        self.connection_max_idle = settings.connection_max_idle
+        self._warm_origins: List[str] = []
+        self._warmup_gate: Optional[RequestGate] = None
+        self._keepalive_task: Optional[asyncio.Task] = None
+        self._last_activity = time.monotonic()
+        self._in_flight = 0
+        self._pool = SessionPool(
+            size=pool_size or settings.session_pool_size,
+            profiles=profiles or settings.impersonate_profiles or [self.impersonate],
+            strategy=assignment or settings.session_assignment,
+            min_health=settings.session_min_health,
+            session_factory=self._create_session,
+        )
+        
+    def _create_session(self, impersonate: str) -> AsyncSession:
+        """
+        Create a pooled session for one impersonation profile.
+        
+        With multiplexing on, new requests wait for an existing HTTP/2
+        connection to the host (PIPEWAIT) instead of racing to open their
+        own, and the session's multi handle caps connections per host, so
+        in-flight requests become streams on a few connections and pay
+        for the impersonated TLS handshake only once per connection.
+        Only enable it for HTTP/2 origins: against an HTTP/1.1 server the
+        waiting requests queue behind each other.
+        
+        Resolved addresses are cached for dns_cache_ttl, TCP keep-alive
+        is on, and libcurl drops connections idle past connection_max_idle
+        rather than reusing a probably dead socket.
         
-    async def _get_session(self) -> AsyncSession:
-        """Get or create async session"""
-        if self._session is None:
-            self._session = AsyncSession(impersonate=self.impersonate)
-        return self._session
+        Timeouts are per phase: connect_timeout for TCP/TLS setup, and
+        first_byte_timeout for a response (or body) making no progress
+        at all; the total timeout is set per request in _request.
+        """
+        curl_options = {
+            CurlOpt.CONNECTTIMEOUT_MS: int(self.connect_timeout * 1000),
+            CurlOpt.LOW_SPEED_LIMIT: 1,
+            CurlOpt.LOW_SPEED_TIME: max(1, int(self.first_byte_timeout)),
+            CurlOpt.DNS_CACHE_TIMEOUT: settings.dns_cache_ttl,
+            CurlOpt.TCP_KEEPALIVE: 1,
+            CurlOpt.MAXAGE_CONN: int(self.connection_max_idle),
+        }
+        if self.multiplex_connections > 0:
+            curl_options[CurlOpt.PIPEWAIT] = 1
+        session: AsyncSession = AsyncSession(
+            impersonate=impersonate,
+            curl_infos=self.TIMING_INFOS,
+            http_version=self.HTTP_VERSIONS[self.http_version],
+            max_clients=self.max_clients,
+            curl_options=curl_options,
+        )
+        if self.multiplex_connections > 0:
+            session.acurl.setopt(CurlMOpt.MAX_HOST_CONNECTIONS, self.multiplex_connections)
+        return session
     
     def _get_headers(self) -> Dict[str, str]:
         """Get request headers"""
@@ -56,35 +157,235 @@ class CurlCffiClient(IHttpClient):
             "Referer": settings.base_url,
         }
     
-    async def get(self, url: str) -> Optional[str]:
+    async def fetch(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> FetchResult:
         """
-        Fetch URL with rate limiting.
+        Fetch URL.
+        
+        Rate limiting is the caller's concern (see HostRateLimiter),
+        so no time is spent idle inside the client.
         
         Args:
             url: URL to fetch
+            headers: Extra request headers
             
         Returns:
-            HTML content or None if failed
+            FetchResult; throttling statuses and Cloudflare challenges are
+            reported as BLOCK, other failures as TRANSIENT or PERMANENT
         """
-        # Rate limiting
-        await asyncio.sleep(random.uniform(*self.delay_range))
-        
+        # Never outlive the crawl deadline: clamp the total timeout to it
+        timeout: float = self.timeout
+        remaining = deadline_remaining()
+        if remaining is not None:
+            if remaining <= 0:
+                self.timeouts["deadline"] += 1
+                return FetchResult(
+                    url=url, error=FailureKind.TRANSIENT,
+                    error_message="Crawl deadline reached",
+                )
+            timeout = min(timeout, remaining)
+            
+        pooled = self._pool.acquire(url)
+        self._in_flight += 1
+        result = None
         try:
-            session = await self._get_session()
+            result = await self._request(pooled.session, url, headers, timeout)
+        finally:
+            self._in_flight -= 1
+            self._last_activity = time.monotonic()
+            # Only block/success outcomes say something about the session itself
+            if result is not None and result.error is FailureKind.BLOCK:
+                await self._pool.release(pooled, blocked=True)
+            else:
+                ok = result is not None and result.ok
+                await self._pool.release(pooled, blocked=False if ok else None)
+        return result
+    
+    async def _request(
+        self,
+        session: AsyncSession,
+        url: str,
+        headers: Optional[Dict[str, str]],
+        timeout: float,
+    ) -> FetchResult:
+        """Perform one GET on a session and classify the outcome"""
+        try:
+            request_headers = self._get_headers()
+            if headers:
+                request_headers.update(headers)
             response = await session.get(
                 url,
-                headers=self._get_headers(),
-                timeout=self.timeout
+                headers=request_headers,
+                timeout=timeout
             )
-            response.raise_for_status()
-            return response.text
-            
         except Exception as e:
-            print(f"[!] HTTP Error: {url} - {e}")
+            phase = timeout_phase(e)
+            if phase:
+                self.timeouts[phase] += 1
+            return FetchResult(
+                url=url,
+                error=classify_exception(e),
+                error_message=f"{type(e).__name__}: {e}",
+            )
+            
+        result = FetchResult(
+            url=url,
+            status=response.status_code,
+            headers={k.lower(): v for k, v in response.headers.items()},
+            content=response.content,
+            encoding=response.charset_encoding,
+            final_url=str(response.url),
+            timings=self._timings(response),
+        )
+        self.connections_opened += response.infos.get(CurlInfo.NUM_CONNECTS, 0)
+        
+        challenge = self._detect_challenge(result)
+        if challenge:
+            result.error = FailureKind.BLOCK
+            result.error_message = f"Cloudflare challenge ({challenge})"
+        else:
+            result.error = classify_status(response.status_code)
+            if result.error is not None:
+                result.error_message = f"HTTP {response.status_code}"
+        if result.error is not None:
+            result.retry_after = parse_retry_after(result.headers.get("retry-after"))
+        return result
+    
+    async def warmup(self, urls: List[str], gate: Optional[RequestGate] = None) -> None:
+        """
+        Resolve and open keep-alive connections to the URLs' origins.
+        
+        Every pooled session sends `warmup_connections` concurrent HEAD
+        requests to each origin root, so DNS, TCP and TLS are done before
+        the first worker asks for a page. Afterwards a background task
+        keeps the connections alive (see _keepalive).
+        
+        Args:
+            urls: URLs whose origins will be crawled
+            gate: Awaited before each HEAD request, including the ones
+                reopening dropped connections later; False skips it
+        """
+        origins = []
+        for url in urls:
+            parsed = urlparse(url)
+            origin = f"{parsed.scheme}://{parsed.netloc}/"
+            if parsed.netloc and origin not in origins:
+                origins.append(origin)
+        if self.warmup_connections <= 0 or not origins:
+            return
+            
+        self._warm_origins = origins
+        self._warmup_gate = gate
+        started = time.monotonic()
+        opened = await self._open_connections()
+        print(f"[*] Pre-warmed {opened} connections to {', '.join(origins)} "
+              f"in {time.monotonic() - started:.2f}s")
+              
+        if self.keepalive_interval > 0 and self._keepalive_task is None:
+            self._keepalive_task = asyncio.create_task(self._keepalive())
+            
+    async def _open_connections(self) -> int:
+        """Send the warm-up HEAD requests the gate allows; return connections opened"""
+        requests = [
+            self._warm(pooled.session, origin)
+            for pooled in self._pool.sessions()
+            for origin in self._warm_origins
+            for _ in range(self.warmup_connections)
+        ]
+        sent = [opened for opened in await asyncio.gather(*requests) if opened is not None]
+        if sent:
+            self._last_activity = time.monotonic()
+        self.connections_opened += sum(sent)
+        return sum(sent)
+    
+    async def _warm(self, session: AsyncSession, origin: str) -> Optional[int]:
+        """
+        One HEAD request; failures only mean the connection stays cold.
+        
+        Returns:
+            Connections opened, or None if the gate vetoed the request
+        """
+        if self._warmup_gate is not None and not await self._warmup_gate(origin):
             return None
+        try:
+            response = await session.head(origin, headers=self._get_headers(), timeout=self.timeout)
+        except Exception as e:
+            print(f"[!] Warm-up request to {origin} failed: {type(e).__name__}: {e}")
+            return 0
+        return response.infos.get(CurlInfo.NUM_CONNECTS, 0)
+    
+    async def _keepalive(self) -> None:
+        """
+        Periodic connection upkeep while the client is open.
+        
+        Idle sessions get curl upkeep (HTTP/2 PINGs keep multiplexed
+        connections open). Once nothing has been fetched for
+        connection_max_idle, libcurl will have dropped the connections,
+        so they are reopened before the workers come back, as far as
+        the warm-up gate allows (the spider vetoes hosts whose circuit
+        is open, and idle periods with nothing waiting for the network).
+        A failed pass is logged and the next one runs as usual.
+        """
+        while True:
+            await asyncio.sleep(self.keepalive_interval)
+            if self._in_flight:
+                continue
+                
+            try:
+                for pooled in self._pool.active():
+                    if pooled.in_flight == 0 and hasattr(pooled.session, "upkeep"):
+                        await pooled.session.upkeep()
+                        
+                if time.monotonic() - self._last_activity >= self.connection_max_idle:
+                    opened = await self._open_connections()
+                    if opened:
+                        print(f"[*] Reopened {opened} idle connections")
+            except Exception as e:
+                print(f"[!] Connection upkeep failed: {type(e).__name__}: {e}")
+    
+    def _timings(self, response) -> FetchTimings:
+        """Extract libcurl phase timings from a response"""
+        infos = response.infos
+        return FetchTimings(
+            dns=infos.get(CurlInfo.NAMELOOKUP_TIME, 0.0),
+            connect=infos.get(CurlInfo.CONNECT_TIME, 0.0),
+            tls=infos.get(CurlInfo.APPCONNECT_TIME, 0.0),
+            ttfb=infos.get(CurlInfo.STARTTRANSFER_TIME, 0.0),
+            total=infos.get(CurlInfo.TOTAL_TIME, 0.0),
+        )
+    
+    @staticmethod
+    def _detect_challenge(result: FetchResult) -> Optional[str]:
+        """
+        Check whether Cloudflare answered with a challenge.
+        
+        Challenges are flagged by the cf-mitigated header, but can also
+        arrive as a plain 200 page, so the body is scanned too.
+        """
+        if result.headers.get("cf-mitigated", "").lower() == "challenge":
+            return "cf-mitigated"
+        if result.status < 400:
+            return detect_challenge(result.content)
+        return None
+    
+    def stats(self) -> Dict[str, int]:
+        """Session pool and connection counters"""
+        return {
+            "sessions": self._pool.active_sessions,
+            "session_evictions": self._pool.evictions,
+            "connections_opened": self.connections_opened,
+            "timeouts_connect": self.timeouts["connect"],
+            "stalled_requests": self.timeouts["stall"],
+            "timeouts_total": self.timeouts["total"],
+            "cut_by_deadline": self.timeouts["deadline"],
+        }
     
     async def close(self) -> None:
-        """Close the session"""
-        if self._session:
-            await self._session.close()
-            self._session = None
+        """Stop connection upkeep and close all pooled sessions"""
+        if self._keepalive_task is not None:
+            self._keepalive_task.cancel()
+            self._keepalive_task = None
+        await self._pool.close()
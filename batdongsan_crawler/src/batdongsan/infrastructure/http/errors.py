@@ -0,0 +1,107 @@
+"""
+Infrastructure Layer - HTTP Failure Classification
+
+Maps transport exceptions and HTTP status codes to FailureKind,
+and parses Retry-After headers.
+"""
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+from curl_cffi.requests import exceptions as curl_exceptions
+
+from batdongsan.domain.exceptions import FailureKind
+
+
+# Status codes meaning "slow down" rather than "page is broken"
+BLOCK_STATUSES = frozenset({403, 429, 503})
+
+# 4xx codes that are worth another attempt
+TRANSIENT_CLIENT_STATUSES = frozenset({408, 425})
+
+# Transport errors that will not go away by retrying
+PERMANENT_EXCEPTIONS = (
+    curl_exceptions.InvalidURL,
+    curl_exceptions.InvalidSchema,
+    curl_exceptions.MissingSchema,
+    curl_exceptions.TooManyRedirects,
+)
+
+
+def classify_status(status: int) -> Optional[FailureKind]:
+    """
+    Classify an HTTP status code.
+    
+    Args:
+        status: HTTP status code
+        
+    Returns:
+        FailureKind, or None if the status is a success
+    """
+    if status < 400:
+        return None
+    if status in BLOCK_STATUSES:
+        return FailureKind.BLOCK
+    if status >= 500 or status in TRANSIENT_CLIENT_STATUSES:
+        return FailureKind.TRANSIENT
+    return FailureKind.PERMANENT
+
+
+def classify_exception(error: Exception) -> FailureKind:
+    """
+    Classify a transport-level exception.
+    
+    Timeouts, connection resets, DNS hiccups and truncated bodies are
+    transient; malformed URLs and redirect loops are permanent.
+    """
+    if isinstance(error, PERMANENT_EXCEPTIONS):
+        return FailureKind.PERMANENT
+    return FailureKind.TRANSIENT
+
+
+def timeout_phase(error: Exception) -> Optional[str]:
+    """
+    Tell which timeout aborted a request.
+    
+    libcurl reports every timeout as OPERATION_TIMEDOUT; the message
+    says which limit was hit.
+    
+    Returns:
+        "connect" (connect timeout), "stall" (no bytes for the first-byte
+        timeout, before or during the body), "total" (overall timeout),
+        or None if the error is not a timeout
+    """
+    if not isinstance(error, curl_exceptions.Timeout):
+        return None
+    message = str(error)
+    if "Operation too slow" in message:
+        return "stall"
+    if "Connection timed out" in message or "Failed to connect" in message:
+        return "connect"
+    return "total"
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header.
+    
+    Args:
+        value: Header value, either delta-seconds or an HTTP-date
+        
+    Returns:
+        Seconds to wait, or None if absent or unparseable
+    """
+    if not value:
+        return None
+    value = value.strip()
+    
+    if value.isdigit():
+        return float(value)
+        
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
@@ -0,0 +1,319 @@
+"""
+Infrastructure Layer - Record/Replay HTTP Transport
+
+Records every fetch of a real crawl into an archive on disk and serves
+it back later without a network, so the spider, parser and storage can
+be benchmarked against identical inputs.
+
+Archive layout (a directory):
+- index.jsonl: one JSON object per response (status, headers, timings,
+  classified error, and where its body lives in bodies.bin)
+- bodies.bin: zlib-compressed bodies, appended back to back
+"""
+import asyncio
+import json
+import random
+import zlib
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterator, List, Optional, TextIO
+
+from batdongsan.domain.exceptions import FailureKind
+from batdongsan.domain.interfaces import IHttpClient, FetchResult, FetchTimings, RequestGate
+from batdongsan.infrastructure.storage.canonical import url_fingerprint
+
+
+class HttpArchive:
+    """
+    Append-only archive of fetch results.
+    
+    Responses for the same normalized URL are kept in the order they
+    were recorded, so retries replay as the same sequence of outcomes.
+    
+    Writes are flushed every `flush_every` entries, bodies before the
+    index, so a crashed recording keeps everything up to the last flush.
+    An index line cut short by the crash is skipped when loading.
+    """
+    
+    INDEX_FILE = "index.jsonl"
+    BODIES_FILE = "bodies.bin"
+    
+    def __init__(self, path: str, flush_every: int = 32):
+        """
+        Args:
+            path: Archive directory (created on first write)
+            flush_every: Entries appended between flushes to disk
+        """
+        self.path = Path(path)
+        self.flush_every = max(1, flush_every)
+        self._index_file: Optional[TextIO] = None
+        self._bodies_file: Optional[BinaryIO] = None
+        self._offset = 0
+        self._unflushed = 0
+        self.skipped = 0    # Unreadable index lines met by entries()
+    
+    def append(self, result: FetchResult) -> None:
+        """Write one fetch result to the archive"""
+        if self._index_file is None or self._bodies_file is None:
+            self.path.mkdir(parents=True, exist_ok=True)
+            index_path = self.path / self.INDEX_FILE
+            torn = self._ends_mid_line(index_path)
+            self._index_file = open(index_path, "a", encoding="utf-8")
+            if torn:
+                # Recording again after a crash: end the truncated line first
+                self._index_file.write("\n")
+            self._bodies_file = open(self.path / self.BODIES_FILE, "ab")
+            self._offset = self._bodies_file.tell()
+            
+        body = zlib.compress(result.content) if result.content else b""
+        self._bodies_file.write(body)
+        entry = {
+            "key": url_fingerprint(result.url),
+            "url": result.url,
+            "status": result.status,
+            "headers": result.headers,
+            "encoding": result.encoding,
+            "final_url": result.final_url,
+            "timings": [
+                result.timings.dns, result.timings.connect, result.timings.tls,
+                result.timings.ttfb, result.timings.total,
+            ],
+            "error": result.error.value if result.error else None,
+            "error_message": result.error_message,
+            "retry_after": result.retry_after,
+            "offset": self._offset,
+            "length": len(body),
+        }
+        self._offset += len(body)
+        self._index_file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._unflushed += 1
+        if self._unflushed >= self.flush_every:
+            self.flush()
+    
+    @staticmethod
+    def _ends_mid_line(index_path: Path) -> bool:
+        """Whether an existing index stops partway through a line"""
+        if not index_path.exists() or not index_path.stat().st_size:
+            return False
+        with open(index_path, "rb") as f:
+            f.seek(-1, 2)
+            return f.read(1) != b"\n"
+    
+    def flush(self) -> None:
+        """Flush pending writes to disk (bodies first, so indexed bodies always exist)"""
+        if self._index_file is not None and self._bodies_file is not None:
+            self._bodies_file.flush()
+            self._index_file.flush()
+        self._unflushed = 0
+    
+    def entries(self) -> Iterator[dict]:
+        """Iterate over index entries in recording order, skipping torn lines"""
+        with open(self.path / self.INDEX_FILE, encoding="utf-8", errors="replace") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    # Cut short by a crash while recording
+                    self.skipped += 1
+                    print(f"[!] Archive {self.path}: skipping truncated index line")
+    
+    def close(self) -> None:
+        """Close the archive files"""
+        if self._index_file is not None and self._bodies_file is not None:
+            self._index_file.close()
+            self._bodies_file.close()
+            self._index_file = None
+            self._bodies_file = None
+
+
+class RecordingHttpClient(IHttpClient):
+    """
+    HTTP client decorator writing every fetch to an HttpArchive.
+    
+    Failures are recorded too, so a replay reproduces the blocks and
+    timeouts the real crawl saw. Results served from a cache are not
+    recorded, as they never reached the network.
+    """
+    
+    def __init__(self, inner: IHttpClient, path: str):
+        """
+        Args:
+            inner: Client performing the actual fetches
+            path: Archive directory
+        """
+        self._inner = inner
+        self._archive = HttpArchive(path)
+        self.recorded = 0
+    
+    async def fetch(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> FetchResult:
+        """Fetch URL through the wrapped client and record the result"""
+        result = await self._inner.fetch(url, headers)
+        if not result.from_cache:
+            self._archive.append(result)
+            self.recorded += 1
+        return result
+    
+    async def warmup(self, urls: List[str], gate: Optional[RequestGate] = None) -> None:
+        """Warm up the wrapped client"""
+        await self._inner.warmup(urls, gate)
+    
+    def is_fresh(self, url: str) -> bool:
+        """Ask the wrapped client"""
+        return self._inner.is_fresh(url)
+    
+    def stats(self) -> Dict[str, int]:
+        """Recording counters merged with the wrapped client's"""
+        return {**self._inner.stats(), "recorded": self.recorded}
+    
+    async def close(self) -> None:
+        """Close the wrapped client and the archive"""
+        await self._inner.close()
+        self._archive.close()
+
+
+class ReplayHttpClient(IHttpClient):
+    """
+    HTTP client serving responses from an HttpArchive.
+    
+    Each URL replays its recorded responses in order; once they run out
+    the last one is repeated. Unknown URLs fail as PERMANENT.
+    
+    Latency and faults can be layered on top to exercise the spider:
+    - latency: fixed seconds added to each response
+    - jitter: uniform random seconds added on top (0..jitter)
+    - recorded_latency: also sleep for the total time originally measured
+    - error_rate: probability of an injected TRANSIENT failure
+    - block_rate: probability of an injected 429 BLOCK
+    """
+    
+    def __init__(
+        self,
+        path: str,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        recorded_latency: bool = False,
+        error_rate: float = 0.0,
+        block_rate: float = 0.0,
+        seed: Optional[int] = None,
+    ):
+        """
+        Load an archive index.
+        
+        Args:
+            path: Archive directory written by RecordingHttpClient
+            latency: Fixed simulated latency per response (s)
+            jitter: Maximum random latency added on top (s)
+            recorded_latency: Replay the originally measured total time
+            error_rate: Share of fetches failing with an injected TRANSIENT error
+            block_rate: Share of fetches answered with an injected 429
+            seed: Random seed, for reproducible fault injection
+        """
+        archive = HttpArchive(path)
+        self._entries: Dict[str, List[dict]] = {}
+        for entry in archive.entries():
+            # Re-keyed from the URL, so archives survive canonicalization changes
+            self._entries.setdefault(url_fingerprint(entry["url"]), []).append(entry)
+        self._served: Dict[str, int] = {}
+        self._bodies = open(archive.path / HttpArchive.BODIES_FILE, "rb")
+        
+        self.latency = latency
+        self.jitter = jitter
+        self.recorded_latency = recorded_latency
+        self.error_rate = error_rate
+        self.block_rate = block_rate
+        self._rng = random.Random(seed)
+        
+        self.replayed = 0
+        self.missing = 0
+        self.injected_errors = 0
+    
+    @property
+    def urls(self) -> List[str]:
+        """URLs present in the archive, in first-recorded order"""
+        return [entries[0]["url"] for entries in self._entries.values()]
+    
+    async def fetch(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> FetchResult:
+        """
+        Serve URL from the archive.
+        
+        Args:
+            url: URL to fetch
+            headers: Ignored; requests are matched on the URL only
+            
+        Returns:
+            The recorded FetchResult, or an injected/missing failure
+        """
+        key = url_fingerprint(url)
+        entries = self._entries.get(key)
+        
+        delay = self.latency + (self._rng.uniform(0, self.jitter) if self.jitter else 0.0)
+        if entries and self.recorded_latency:
+            delay += entries[0]["timings"][4]
+        if delay > 0:
+            await asyncio.sleep(delay)
+            
+        roll = self._rng.random() if (self.error_rate or self.block_rate) else 1.0
+        if roll < self.block_rate:
+            self.injected_errors += 1
+            return FetchResult(
+                url=url, status=429, error=FailureKind.BLOCK,
+                error_message="HTTP 429 (injected)",
+            )
+        if roll < self.block_rate + self.error_rate:
+            self.injected_errors += 1
+            return FetchResult(
+                url=url, error=FailureKind.TRANSIENT,
+                error_message="Timeout (injected)",
+            )
+            
+        if not entries:
+            self.missing += 1
+            return FetchResult(
+                url=url, error=FailureKind.PERMANENT,
+                error_message="Not in replay archive",
+            )
+            
+        served = self._served.get(key, 0)
+        self._served[key] = served + 1
+        self.replayed += 1
+        return self._load(url, entries[min(served, len(entries) - 1)])
+    
+    def _load(self, url: str, entry: dict) -> FetchResult:
+        """Rebuild a FetchResult from an index entry"""
+        content = b""
+        if entry["length"]:
+            self._bodies.seek(entry["offset"])
+            content = zlib.decompress(self._bodies.read(entry["length"]))
+        return FetchResult(
+            url=url,
+            status=entry["status"],
+            headers=entry["headers"],
+            content=content,
+            encoding=entry["encoding"],
+            final_url=entry["final_url"],
+            timings=FetchTimings(*entry["timings"]),
+            error=FailureKind(entry["error"]) if entry["error"] else None,
+            error_message=entry["error_message"],
+            retry_after=entry["retry_after"],
+        )
+    
+    def stats(self) -> Dict[str, int]:
+        """Replay counters"""
+        return {
+            "replayed": self.replayed,
+            "replay_missing": self.missing,
+            "injected_errors": self.injected_errors,
+        }
+    
+    async def close(self) -> None:
+        """Close the archive"""
+        self._bodies.close()
@@ -0,0 +1,171 @@
+"""
+Infrastructure Layer - curl-cffi Session Pool
+
+Spreads requests over several AsyncSessions, optionally with different
+browser impersonation profiles, and replaces sessions that start
+drawing challenges.
+"""
+import asyncio
+import zlib
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Set, Tuple
+from urllib.parse import urlparse
+
+from curl_cffi.requests import AsyncSession
+
+
+@dataclass(eq=False)
+class PooledSession:
+    """A session with its load and health bookkeeping"""
+    session: AsyncSession
+    impersonate: str
+    in_flight: int = 0
+    requests: int = 0
+    blocks: int = 0
+    health: float = 1.0     # EWMA of outcomes: 1 = always fine, 0 = always blocked
+    evicted: bool = False
+    
+    def record(self, blocked: bool, smoothing: float) -> None:
+        """Fold one outcome into the health score"""
+        self.requests += 1
+        if blocked:
+            self.blocks += 1
+        self.health += smoothing * ((0.0 if blocked else 1.0) - self.health)
+
+
+class SessionPool:
+    """
+    Fixed-size pool of curl-cffi sessions.
+    
+    Assignment strategies:
+    - "least_loaded": the healthy session with fewest requests in flight
+    - "sticky": each host always maps to the same slot (keeps cookies together)
+    
+    Slots cycle through `profiles`, so a pool of 4 with two profiles runs
+    two sessions of each fingerprint. A session whose health drops below
+    `min_health` (after `min_samples` requests) is evicted: its slot gets
+    a fresh session and the old one is closed once its requests finish.
+    """
+    
+    STRATEGIES = ("least_loaded", "sticky")
+    
+    def __init__(
+        self,
+        size: int,
+        profiles: List[str],
+        strategy: str = "least_loaded",
+        min_health: float = 0.5,
+        min_samples: int = 5,
+        smoothing: float = 0.2,
+        session_factory: Optional[Callable[[str], AsyncSession]] = None,
+    ):
+        """
+        Initialize the pool.
+        
+        Args:
+            size: Number of sessions
+            profiles: Impersonation profiles to rotate through (chrome120, safari17_0, ...)
+            strategy: "least_loaded" or "sticky"
+            min_health: Health score below which a session is evicted
+            min_samples: Requests a session must serve before it can be evicted
+            smoothing: EWMA weight of each outcome in the health score
+            session_factory: Creates a session for a profile (defaults to AsyncSession)
+        """
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"Unknown session assignment strategy: {strategy}")
+        if not profiles:
+            raise ValueError("At least one impersonation profile is required")
+            
+        self.size = max(1, size)
+        self.profiles = profiles
+        self.strategy = strategy
+        self.min_health = min_health
+        self.min_samples = min_samples
+        self.smoothing = smoothing
+        self._session_factory = session_factory or (lambda p: AsyncSession(impersonate=p))
+        self._slots: List[Optional[PooledSession]] = [None] * self.size
+        self._retiring: Set[PooledSession] = set()
+        self.evictions = 0
+    
+    def _profile_for(self, slot: int) -> str:
+        return self.profiles[slot % len(self.profiles)]
+    
+    def _get_slot(self, slot: int) -> PooledSession:
+        """Return the session in a slot, creating it on first use"""
+        pooled = self._slots[slot]
+        if pooled is None:
+            profile = self._profile_for(slot)
+            pooled = PooledSession(session=self._session_factory(profile), impersonate=profile)
+            self._slots[slot] = pooled
+        return pooled
+    
+    @staticmethod
+    def _load(pooled: Optional[PooledSession]) -> Tuple[int, float]:
+        """Sort key for least_loaded: fewest requests in flight, then healthiest"""
+        if pooled is None:
+            return 0, -1.0
+        return pooled.in_flight, -pooled.health
+    
+    def acquire(self, url: str) -> PooledSession:
+        """
+        Pick a session for a request and mark it busy.
+        
+        Args:
+            url: URL about to be fetched (used by the sticky strategy)
+        """
+        if self.strategy == "sticky":
+            host = urlparse(url).netloc.lower()
+            slot = zlib.crc32(host.encode()) % self.size
+        else:
+            slot = min(range(self.size), key=lambda i: self._load(self._slots[i]))
+        pooled = self._get_slot(slot)
+        pooled.in_flight += 1
+        return pooled
+    
+    async def release(self, pooled: PooledSession, blocked: Optional[bool]) -> None:
+        """
+        Return a session after a request.
+        
+        Args:
+            pooled: Session returned by acquire()
+            blocked: True if challenged/throttled, False if fine,
+                None if the outcome says nothing about the session
+        """
+        pooled.in_flight -= 1
+        if blocked is not None and not pooled.evicted:
+            pooled.record(blocked, self.smoothing)
+            if pooled.requests >= self.min_samples and pooled.health < self.min_health:
+                self._evict(pooled)
+                
+        if pooled.evicted and pooled.in_flight == 0 and pooled in self._retiring:
+            self._retiring.discard(pooled)
+            await pooled.session.close()
+    
+    def _evict(self, pooled: PooledSession) -> None:
+        """Free the slot for a fresh session; close the old one when idle"""
+        pooled.evicted = True
+        self.evictions += 1
+        slot = self._slots.index(pooled)
+        self._slots[slot] = None
+        self._retiring.add(pooled)
+        print(f"[!] Evicting {pooled.impersonate} session "
+              f"(health {pooled.health:.2f}, {pooled.blocks}/{pooled.requests} blocked)")
+    
+    def sessions(self) -> List[PooledSession]:
+        """Every slot's session, creating missing ones"""
+        return [self._get_slot(slot) for slot in range(self.size)]
+    
+    def active(self) -> List[PooledSession]:
+        """Sessions created so far"""
+        return [s for s in self._slots if s is not None]
+    
+    @property
+    def active_sessions(self) -> int:
+        return sum(1 for s in self._slots if s is not None)
+    
+    async def close(self) -> None:
+        """Close every session"""
+        sessions = [s for s in self._slots if s is not None] + list(self._retiring)
+        self._slots = [None] * self.size
+        self._retiring.clear()
+        await asyncio.gather(*(s.session.close() for s in sessions), return_exceptions=True)
@@ -1,4 +1,15 @@
 """Parsers package"""
 from .batdongsan_parser import BatDongSanParser
+from .lxml_parser import LxmlBatDongSanParser
+from .schema import ExtractionPlan, Field, SiteSchema, compile_schema
+from .batdongsan_schema import BATDONGSAN
 
-__all__ = ["BatDongSanParser"]
+__all__ = [
+    "BatDongSanParser",
+    "LxmlBatDongSanParser",
+    "ExtractionPlan",
+    "Field",
+    "SiteSchema",
+    "compile_schema",
+    "BATDONGSAN",
+]
@@ -13,10 +13,15 @@ from batdongsan.domain.entities import (
     PropertyListing, Location, PropertySpecs, ContactInfo, Price,
     ListingType, PropertyType
 )
-from batdongsan.domain.interfaces import IParser
+from batdongsan.domain.interfaces import IParser, Markup
 from batdongsan.infrastructure.config import settings
 
 
+# Pager links (`re__pagination-number`, `re__pagination-icon` for next/last)
+PAGER_LINK = re.compile(rb'<a\b[^>]*\bclass="re__pagination-[^"]*"[^>]*>')
+PAGER_NUMBER = re.compile(rb'(?:\bpid="|/p)(\d+)\b')
+
+
 class BatDongSanParser(IParser):
     """
     HTML parser for batdongsan.com.vn
@@ -29,20 +34,22 @@ class BatDongSanParser(IParser):
     
     def parse_listing_page(
         self,
-        html: str,
-        metadata: Dict[str, Any] = None
+        html: Markup,
+        metadata: Dict[str, Any] = None,
+        encoding: Optional[str] = None,
     ) -> List[PropertyListing]:
         """
         Parse a listing page and extract property cards.
         
         Args:
-            html: Raw HTML content
+            html: Raw HTML content (bytes or str)
             metadata: Additional context (listing_type, property_type)
+            encoding: Charset of byte content, if known
             
         Returns:
             List of PropertyListing entities
         """
-        soup = BeautifulSoup(html, 'lxml')
+        soup = self._make_soup(html, encoding)
         listings = []
         metadata = metadata or {}
         
@@ -65,18 +72,24 @@ class BatDongSanParser(IParser):
                 
         return listings
     
-    def parse_detail_page(self, html: str, url: str) -> Optional[PropertyListing]:
+    def parse_detail_page(
+        self,
+        html: Markup,
+        url: str,
+        encoding: Optional[str] = None,
+    ) -> Optional[PropertyListing]:
         """
         Parse a detail page for full property information.
         
         Args:
-            html: Raw HTML content
+            html: Raw HTML content (bytes or str)
             url: Page URL
+            encoding: Charset of byte content, if known
             
         Returns:
             PropertyListing with full details
         """
-        soup = BeautifulSoup(html, 'lxml')
+        soup = self._make_soup(html, encoding)
         
         try:
             # Title
@@ -131,17 +144,18 @@ class BatDongSanParser(IParser):
             print(f"[!] Parser Error: {e}")
             return None
     
-    def extract_detail_urls(self, html: str) -> List[str]:
+    def extract_detail_urls(self, html: Markup, encoding: Optional[str] = None) -> List[str]:
         """
         Extract detail page URLs from a listing page.
         
         Args:
-            html: Raw HTML content
+            html: Raw HTML content (bytes or str)
+            encoding: Charset of byte content, if known
             
         Returns:
             List of detail page URLs
         """
-        soup = BeautifulSoup(html, 'lxml')
+        soup = self._make_soup(html, encoding)
         urls = []
         
         # Find all links to detail pages
@@ -158,6 +172,41 @@ class BatDongSanParser(IParser):
                 
         return urls
     
+    def parse_last_page(self, html: Markup, encoding: Optional[str] = None) -> Optional[int]:
+        """
+        Highest page number linked from the pager.
+        
+        Scans the raw markup with a regex rather than building another
+        tree: pager attributes are ASCII in every charset the site uses.
+        
+        Args:
+            html: Raw HTML content (bytes or str)
+            encoding: Charset of byte content, if known
+            
+        Returns:
+            Page number, or None if the page has no pager
+        """
+        if isinstance(html, str):
+            html = html.encode('utf-8')
+        numbers = [
+            int(number)
+            for link in PAGER_LINK.findall(html)
+            for number in PAGER_NUMBER.findall(link)
+        ]
+        return max(numbers) if numbers else None
+    
+    @staticmethod
+    def _make_soup(html: Markup, encoding: Optional[str] = None) -> BeautifulSoup:
+        """
+        Build the document tree.
+        
+        Bytes are fed straight to lxml (with the server charset as the
+        first guess), avoiding a decode to str and re-encode for libxml2.
+        """
+        if isinstance(html, bytes):
+            return BeautifulSoup(html, 'lxml', from_encoding=encoding)
+        return BeautifulSoup(html, 'lxml')
+    
     def _parse_card(
         self,
         card,
@@ -235,12 +284,14 @@ class BatDongSanParser(IParser):
             is_verified=is_verified,
         )
     
-    def _extract_id(self, url: str) -> str:
+    @staticmethod
+    def _extract_id(url: str) -> str:
         """Extract listing ID from URL"""
         match = re.search(r'-pr(\d+)', url)
         return match.group(1) if match else "unknown"
     
-    def _parse_price(self, price_text: str) -> Price:
+    @staticmethod
+    def _parse_price(price_text: str) -> Price:
         """Parse price string to Price value object"""
         price_lower = price_text.lower().strip()
         
@@ -265,7 +316,8 @@ class BatDongSanParser(IParser):
                     
         return Price(raw=price_text)
     
-    def _parse_area(self, area_text: str) -> Optional[float]:
+    @staticmethod
+    def _parse_area(area_text: str) -> Optional[float]:
         """Parse area string to float"""
         match = re.search(r'([\d.,]+)\s*m²?', area_text)
         if match:
@@ -275,7 +327,8 @@ class BatDongSanParser(IParser):
                 pass
         return None
     
-    def _parse_location(self, location_text: str) -> Location:
+    @staticmethod
+    def _parse_location(location_text: str) -> Location:
         """Parse location string to Location entity"""
         location = Location(address=location_text)
         parts = [p.strip() for p in location_text.replace('·', ',').split(',')]
@@ -0,0 +1,91 @@
+"""
+Infrastructure Layer - batdongsan.com.vn Extraction Schema
+
+The selectors BatDongSanParser walks by hand, as configuration for the
+schema-driven LxmlBatDongSanParser. Each field lists its selectors in
+order of preference, exactly as the `select_one(a) or select_one(b)`
+chains they replace.
+"""
+from typing import Optional
+from urllib.parse import urljoin
+
+from .batdongsan_parser import BatDongSanParser
+from .schema import Field, SiteSchema
+
+
+def absolute_url(href: str) -> str:
+    """Resolve a relative link against the site"""
+    return href if href.startswith('http') else urljoin(BatDongSanParser.BASE_URL, href)
+
+
+def truncate(length: int):
+    """Post-processor keeping the first `length` characters"""
+    return lambda text: text[:length]
+
+
+def or_none(value: str) -> Optional[str]:
+    """Empty attribute values count as missing"""
+    return value or None
+
+
+# The card's main link; also the title of last resort
+CARD_LINK = ["a.js__product-link-for-product-id", 'a[href*="-pr"]', "a[title]"]
+
+# Gallery images: first one is the thumbnail, and they are counted
+DETAIL_IMAGES = [".re__media-thumb-item img"]
+
+
+BATDONGSAN = SiteSchema(
+    cards={
+        "cards": Field(
+            [".js__card", '[class*="ProductItem"]', ".product-item", 'article[class*="card"]'],
+            extract="node", many=True, default=(),
+        ),
+    },
+    card={
+        "url": Field(CARD_LINK, extract="@href", post=absolute_url),
+        "title": Field(
+            [".js__card-title", '[class*="title"]', *CARD_LINK],
+            extract=("@title", "text"), post=truncate(200),
+        ),
+        "price": Field(
+            [".re__card-config-price", '[class*="price"]'],
+            post=BatDongSanParser._parse_price, default="Thỏa thuận",
+        ),
+        "area": Field(
+            [".re__card-config-area", '[class*="area"]'], post=BatDongSanParser._parse_area,
+        ),
+        "location": Field(
+            [".re__card-location", '[class*="location"]'],
+            post=BatDongSanParser._parse_location, default="",
+        ),
+        "thumbnail": Field(["img"], extract=("@data-src", "@src"), post=or_none),
+        "is_vip": Field(['[class*="vip"]'], extract="exists", default=False),
+        "is_verified": Field(['[class*="verified"]'], extract="exists", default=False),
+    },
+    detail_links={
+        "urls": Field(['a[href*="-pr"]'], extract="@href", many=True, default=()),
+    },
+    detail_page={
+        "title": Field(["h1.re__pr-title", "h1"], default="Unknown"),
+        "price": Field(
+            [".re__pr-short-info-item--price", '[class*="price"]'],
+            post=BatDongSanParser._parse_price, default="Thỏa thuận",
+        ),
+        "specs": Field(
+            [".re__pr-specs-content-item"], many=True, default=(),
+            schema={
+                "label": Field([".re__pr-specs-content-item-title"], post=str.lower),
+                "value": Field([".re__pr-specs-content-item-value"]),
+            },
+        ),
+        "location": Field([".re__pr-short-description"], post=BatDongSanParser._parse_location),
+        "description": Field([".re__detail-content"], post=truncate(500)),
+        "contact_name": Field([".re__contact-name"]),
+        "contact_phone": Field(
+            ['a[href^="tel:"]'], extract="@href", post=lambda href: href.replace('tel:', ''),
+        ),
+        "thumbnail": Field(DETAIL_IMAGES, extract=("@data-src", "@src"), post=or_none),
+        "image_count": Field(DETAIL_IMAGES, extract="count", default=0),
+    },
+)
@@ -0,0 +1,231 @@
+"""
+Infrastructure Layer - BatDongSan Parser (lxml backend)
+
+Same extraction as BatDongSanParser, driven by a declarative site schema
+(see batdongsan_schema.py) compiled into extraction plans that run on
+the libxml2 tree, instead of building a BeautifulSoup tree.
+"""
+import re
+from typing import Any, Dict, List, Optional
+
+from lxml import etree
+
+from batdongsan.domain.entities import (
+    PropertyListing, Location, PropertySpecs, ContactInfo, ListingType, PropertyType
+)
+from batdongsan.domain.interfaces import Markup
+from .batdongsan_parser import BatDongSanParser
+from .batdongsan_schema import BATDONGSAN, absolute_url
+from .schema import SiteSchema, compile_schema
+
+
+# `<meta charset=...>` / `<meta http-equiv ... content="...; charset=...">`
+META_CHARSET = re.compile(rb'<meta[^>]+charset=["\']?([\w-]+)', re.IGNORECASE)
+
+
+class LxmlBatDongSanParser(BatDongSanParser):
+    """
+    HTML parser for batdongsan.com.vn on lxml.etree.
+    
+    Produces the same PropertyListing output as BatDongSanParser (see
+    benchmarks/check_parser_parity.py) at a fraction of the CPU per
+    page: no BeautifulSoup tree is built, and the site schema is
+    compiled once, when the parser is created, into plans whose XPath
+    queries are shared between fields and reused for every page.
+    """
+    
+    def __init__(self, schema: SiteSchema = BATDONGSAN):
+        """
+        Initialize the parser.
+        
+        Args:
+            schema: Selectors and post-processors of the site
+            
+        Raises:
+            ValueError: If the schema uses unsupported selectors
+        """
+        self._cards = compile_schema(schema.cards)
+        self._card = compile_schema(schema.card)
+        self._detail_links = compile_schema(schema.detail_links)
+        self._detail_page = compile_schema(schema.detail_page)
+        # One HTMLParser per charset; parsers are reusable between documents
+        self._parsers: Dict[Optional[str], etree.HTMLParser] = {}
+    
+    def parse_listing_page(
+        self,
+        html: Markup,
+        metadata: Optional[Dict[str, Any]] = None,
+        encoding: Optional[str] = None,
+    ) -> List[PropertyListing]:
+        """
+        Parse a listing page and extract property cards.
+        
+        Args:
+            html: Raw HTML content (bytes or str)
+            metadata: Additional context (listing_type, property_type)
+            encoding: Charset of byte content, if known
+            
+        Returns:
+            List of PropertyListing entities
+        """
+        root = self._make_tree(html, encoding)
+        metadata = metadata or {}
+        
+        listings = []
+        for card in self._cards.extract(root)["cards"]:
+            try:
+                listing = self._parse_card(card, metadata)
+                if listing:
+                    listings.append(listing)
+            except Exception:
+                continue
+                
+        return listings
+    
+    def parse_detail_page(
+        self,
+        html: Markup,
+        url: str,
+        encoding: Optional[str] = None,
+    ) -> Optional[PropertyListing]:
+        """
+        Parse a detail page for full property information.
+        
+        Args:
+            html: Raw HTML content (bytes or str)
+            url: Page URL
+            encoding: Charset of byte content, if known
+            
+        Returns:
+            PropertyListing with full details
+        """
+        root = self._make_tree(html, encoding)
+        
+        try:
+            fields = self._detail_page.extract(root)
+            return PropertyListing(
+                id=self._extract_id(url),
+                title=fields["title"],
+                url=url,
+                price=fields["price"],
+                location=fields["location"] or Location(),
+                specs=self._specs_from_pairs(fields["specs"]),
+                contact=ContactInfo(name=fields["contact_name"], phone=fields["contact_phone"]),
+                description=fields["description"],
+                thumbnail=fields["thumbnail"],
+                image_count=fields["image_count"],
+            )
+            
+        except Exception as e:
+            print(f"[!] Parser Error: {e}")
+            return None
+    
+    def extract_detail_urls(self, html: Markup, encoding: Optional[str] = None) -> List[str]:
+        """
+        Extract detail page URLs from a listing page.
+        
+        Args:
+            html: Raw HTML content (bytes or str)
+            encoding: Charset of byte content, if known
+            
+        Returns:
+            List of detail page URLs
+        """
+        root = self._make_tree(html, encoding)
+        urls = []
+        seen = set()
+        
+        for href in self._detail_links.extract(root)["urls"]:
+            if href and href not in seen and re.search(r'-pr\d+', href):
+                seen.add(href)
+                urls.append(absolute_url(href))
+                
+        return urls
+    
+    def _make_tree(self, html: Markup, encoding: Optional[str] = None):
+        """
+        Parse the document with libxml2.
+        
+        Charset resolution follows BeautifulSoup's: the server charset,
+        else the one declared in the markup, else UTF-8.
+        
+        Returns:
+            Root element (an empty <html> for an empty document)
+        """
+        if isinstance(html, bytes) and encoding is None and not META_CHARSET.search(html[:4096]):
+            encoding = 'utf-8'
+        try:
+            parser = self._parser(encoding if isinstance(html, bytes) else None)
+        except LookupError:
+            # Unknown charset name from the server: fall back to the markup's
+            parser = self._parser(None)
+        try:
+            root = etree.fromstring(html, parser)
+        except etree.XMLSyntaxError:
+            root = None
+        return root if root is not None else etree.Element('html')
+    
+    def _parser(self, encoding: Optional[str]) -> etree.HTMLParser:
+        parser = self._parsers.get(encoding)
+        if parser is None:
+            parser = etree.HTMLParser(encoding=encoding)
+            self._parsers[encoding] = parser
+        return parser
+    
+    def _parse_card(
+        self,
+        card,
+        metadata: Dict[str, Any]
+    ) -> Optional[PropertyListing]:
+        """Build a listing from a property card element"""
+        fields = self._card.extract(card)
+        url = fields["url"]
+        if url is None:
+            return None
+            
+        property_type = None
+        if metadata.get("property_type"):
+            try:
+                property_type = PropertyType(metadata["property_type"])
+            except ValueError:
+                pass
+                
+        return PropertyListing(
+            id=self._extract_id(url),
+            title=fields["title"],
+            url=url,
+            price=fields["price"],
+            listing_type=ListingType.SALE if "/ban-" in url else ListingType.RENT,
+            property_type=property_type,
+            location=fields["location"],
+            specs=PropertySpecs(area=fields["area"]),
+            thumbnail=fields["thumbnail"],
+            is_vip=fields["is_vip"],
+            is_verified=fields["is_verified"],
+        )
+    
+    def _specs_from_pairs(self, items: List[Dict[str, Optional[str]]]) -> PropertySpecs:
+        """Interpret the label/value pairs of the specs table"""
+        specs = PropertySpecs()
+        
+        for item in items:
+            label_text, value_text = item["label"], item["value"]
+            if label_text is None or value_text is None:
+                continue
+                
+            if 'diện tích' in label_text:
+                specs.area = self._parse_area(value_text)
+            elif 'phòng ngủ' in label_text:
+                match = re.search(r'(\d+)', value_text)
+                if match:
+                    specs.bedrooms = int(match.group(1))
+            elif 'phòng tắm' in label_text or 'toilet' in label_text:
+                match = re.search(r'(\d+)', value_text)
+                if match:
+                    specs.bathrooms = int(match.group(1))
+            elif 'hướng' in label_text:
+                specs.direction = value_text
+            elif 'pháp lý' in label_text:
+                specs.legal_status = value_text
+                
+        return specs
@@ -0,0 +1,292 @@
+"""
+Infrastructure Layer - Declarative Extraction Schemas
+
+A schema maps field names to ordered CSS selectors, how to read the
+matched element and a post-processor. compile_schema() turns it into an
+ExtractionPlan once: every distinct selector becomes one precompiled
+XPath, shared by all fields that use it and evaluated at most once per
+element, and each field stops at its first selector that matches.
+"""
+import re
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from lxml import etree
+
+
+# Text as BeautifulSoup's get_text() sees it: no script/style/template
+# contents and no ruby annotations
+TEXT = etree.XPath(
+    ".//text()[not(ancestor::script or ancestor::style or ancestor::template"
+    " or ancestor::rt or ancestor::rp)]",
+    smart_strings=False,
+)
+
+
+def element_text(node) -> str:
+    """BeautifulSoup get_text(strip=True): stripped strings, empty ones dropped"""
+    return "".join(filter(None, map(str.strip, TEXT(node))))
+
+
+@dataclass(frozen=True)
+class Field:
+    """
+    How to extract one value.
+    
+    Attributes:
+        selectors: CSS selectors tried in order; the first that matches
+            anything provides the element(s)
+        extract: "text", "@attribute", "node", "exists" or "count"; a
+            sequence tries each in turn and keeps the first non-empty
+            value (e.g. ("@title", "text"))
+        post: Applied to the extracted value (and to a non-None default)
+        default: Value when no selector matches
+        many: Extract from every matched element instead of the first
+        schema: Nested schema extracted from the matched element(s)
+            (takes the place of `extract`)
+    """
+    selectors: Sequence[str]
+    extract: Union[str, Sequence[str]] = "text"
+    post: Optional[Callable[[Any], Any]] = None
+    default: Any = None
+    many: bool = False
+    schema: Optional[Dict[str, "Field"]] = None
+
+
+Schema = Dict[str, Field]
+
+
+@dataclass(frozen=True)
+class SiteSchema:
+    """
+    Everything a schema-driven parser extracts from one site.
+    
+    Attributes:
+        cards: Listing page -> "cards" (the card elements, extract="node", many=True)
+        card: Card element -> url, title, price, area, location, thumbnail,
+            is_vip, is_verified
+        detail_links: Listing page -> "urls" (hrefs of detail pages, many=True)
+        detail_page: Detail page -> title, price, location, description,
+            specs (label/value pairs), contact_name, contact_phone,
+            thumbnail, image_count
+    """
+    cards: Schema
+    card: Schema
+    detail_links: Schema
+    detail_page: Schema
+
+
+# Supported CSS: `tag`, `*`, `.class`, `[attr]`, `[attr=v]`, `[attr*=v]`,
+# `[attr^=v]`, `[attr$=v]`, compounds of these and descendant combinators
+CSS_TOKEN = re.compile(
+    r'(?P<tag>[a-zA-Z][\w-]*|\*)'
+    r'|\.(?P<cls>[\w-]+)'
+    r'|\[(?P<attr>[\w-]+)(?:(?P<op>[*^$]?=)(?P<quote>["\']?)(?P<value>.*?)(?P=quote))?\]'
+    r'|(?P<space>\s+)'
+)
+
+
+def _literal(value: str) -> str:
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    raise ValueError(f"Selector value with both quote kinds: {value!r}")
+
+
+def css_to_xpath(selector: str) -> str:
+    """
+    Translate a CSS selector (see CSS_TOKEN) to XPath over the descendants
+    of the context element, as BeautifulSoup's select() matches.
+    
+    Raises:
+        ValueError: For syntax outside the supported subset
+    """
+    steps: List[Tuple[str, List[str]]] = []
+    tag: Optional[str] = None
+    predicates: List[str] = []
+    position = 0
+    selector = selector.strip()
+    
+    def close_step():
+        nonlocal tag, predicates
+        if tag is None and not predicates:
+            raise ValueError(f"Empty compound in selector {selector!r}")
+        steps.append((tag or "*", predicates))
+        tag, predicates = None, []
+        
+    while position < len(selector):
+        match = CSS_TOKEN.match(selector, position)
+        if match is None:
+            raise ValueError(f"Unsupported selector syntax at {selector[position:]!r}")
+        position = match.end()
+        if match.group("space"):
+            close_step()
+        elif match.group("tag"):
+            if tag is not None or predicates:
+                raise ValueError(f"Misplaced tag name in selector {selector!r}")
+            tag = match.group("tag").lower()
+        elif match.group("cls"):
+            predicates.append(
+                f"contains(concat(' ', normalize-space(@class), ' '), ' {match.group('cls')} ')"
+            )
+        else:
+            attr = f"@{match.group('attr').lower()}"
+            op, value = match.group("op"), match.group("value")
+            if op is None:
+                predicates.append(attr)
+            elif op == "=":
+                predicates.append(f"{attr}={_literal(value)}")
+            elif op == "*=":
+                predicates.append(f"contains({attr}, {_literal(value)})")
+            elif op == "^=":
+                predicates.append(f"starts-with({attr}, {_literal(value)})")
+            else:
+                # XPath 1.0 has no ends-with()
+                predicates.append(
+                    f"substring({attr}, string-length({attr}) - {len(value) - 1})={_literal(value)}"
+                )
+    close_step()
+    return "." + "".join(
+        f"//{step_tag}" + "".join(f"[{predicate}]" for predicate in step_predicates)
+        for step_tag, step_predicates in steps
+    )
+
+
+def _extractor(how: str) -> Callable[[Any], Any]:
+    if how == "text":
+        return element_text
+    if how == "node":
+        return lambda node: node
+    if how == "exists":
+        return lambda node: True
+    if how.startswith("@") and len(how) > 1:
+        attribute = how[1:]
+        return lambda node: node.get(attribute, "")
+    raise ValueError(f"Unknown extraction: {how!r}")
+
+
+def _chain(extractors: List[Callable[[Any], Any]]) -> Callable[[Any], Any]:
+    """First non-empty value of several extractions"""
+    def extract(node):
+        value = None
+        for extractor in extractors:
+            value = extractor(node)
+            if value:
+                return value
+        return value
+    return extract
+
+
+@dataclass
+class _CompiledField:
+    name: str
+    queries: Tuple[int, ...]            # Indexes into ExtractionPlan.queries
+    read: Optional[Callable[[Any], Any]]    # None for "count"
+    post: Optional[Callable[[Any], Any]]
+    default: Any
+    many: bool
+
+
+class ExtractionPlan:
+    """
+    A compiled schema.
+    
+    Selectors shared between fields are compiled and evaluated once per
+    element. A selector is compiled to return only its first match
+    (`(...)[1]`, which libxml2 stops early for) unless some field needs
+    all of its matches.
+    """
+    
+    def __init__(self, schema: Schema):
+        """
+        Compile a schema.
+        
+        Args:
+            schema: Field name -> Field, extracted in this order
+            
+        Raises:
+            ValueError: For unsupported selectors or extractions
+        """
+        needs_all: Dict[str, bool] = {}
+        for spec in schema.values():
+            for selector in spec.selectors:
+                xpath = css_to_xpath(selector)
+                needs_all[xpath] = (needs_all.get(xpath, False)
+                                    or spec.many or spec.extract == "count")
+                
+        self.selector_count = sum(len(spec.selectors) for spec in schema.values())
+        self.queries: List[etree.XPath] = []
+        index_of: Dict[str, int] = {}
+        for xpath, many in needs_all.items():
+            index_of[xpath] = len(self.queries)
+            self.queries.append(
+                etree.XPath(xpath if many else f"({xpath})[1]", smart_strings=False)
+            )
+            
+        self._fields: List[_CompiledField] = []
+        for name, spec in schema.items():
+            read: Optional[Callable[[Any], Any]]
+            if spec.schema is not None:
+                read = ExtractionPlan(spec.schema).extract
+            elif spec.extract == "count":
+                read = None
+            elif isinstance(spec.extract, str):
+                read = _extractor(spec.extract)
+            else:
+                read = _chain([_extractor(how) for how in spec.extract])
+            self._fields.append(_CompiledField(
+                name=name,
+                queries=tuple(index_of[css_to_xpath(selector)] for selector in spec.selectors),
+                read=read,
+                post=spec.post,
+                default=spec.default,
+                many=spec.many,
+            ))
+    
+    def extract(self, node) -> Dict[str, Any]:
+        """
+        Extract every field from an element.
+        
+        Args:
+            node: lxml element the selectors are relative to
+            
+        Returns:
+            Field name -> value
+        """
+        matches: List[Optional[list]] = [None] * len(self.queries)
+        values: Dict[str, Any] = {}
+        for field in self._fields:
+            found = None
+            for index in field.queries:
+                result = matches[index]
+                if result is None:
+                    result = matches[index] = self.queries[index](node)
+                if result:
+                    found = result
+                    break
+                    
+            if found is None:
+                value = field.default
+                if value is not None and field.post is not None:
+                    value = field.post(value)
+            else:
+                if field.read is None:
+                    value = len(found)
+                elif field.many:
+                    value = [field.read(element) for element in found]
+                else:
+                    value = field.read(found[0])
+                if field.post is not None:
+                    value = field.post(value)
+            values[field.name] = value
+        return values
+    
+    def __repr__(self) -> str:
+        return (f"ExtractionPlan({len(self._fields)} fields, {self.selector_count} selectors "
+                f"-> {len(self.queries)} queries)")
+
+
+def compile_schema(schema: Schema) -> ExtractionPlan:
+    """Compile a schema into an ExtractionPlan (see ExtractionPlan)"""
+    return ExtractionPlan(schema)
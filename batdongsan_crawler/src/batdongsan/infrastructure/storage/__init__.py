@@ -1,6 +1,10 @@
 """Storage package"""
 from .storage import JsonStorage, JsonLinesStorage, CsvStorage, MultiStorage
-from .frontier import MemoryUrlFrontier
+from .canonical import UrlCanonicalizer, canonicalize_url, url_digest, url_fingerprint
+from .frontier import MemoryUrlFrontier, LaneScheduler
+from .seen_set import SeenSet, PySeenSet, DigestSeenSet, create_seen_set
+from .sqlite_frontier import SqliteUrlFrontier, new_run_id, run_path
+from .revisit_store import SqliteRevisitStore
 
 __all__ = [
     "JsonStorage",
@@ -8,4 +12,17 @@ __all__ = [
     "CsvStorage",
     "MultiStorage",
     "MemoryUrlFrontier",
+    "LaneScheduler",
+    "UrlCanonicalizer",
+    "canonicalize_url",
+    "url_digest",
+    "url_fingerprint",
+    "SeenSet",
+    "PySeenSet",
+    "DigestSeenSet",
+    "create_seen_set",
+    "SqliteUrlFrontier",
+    "new_run_id",
+    "run_path",
+    "SqliteRevisitStore",
 ]
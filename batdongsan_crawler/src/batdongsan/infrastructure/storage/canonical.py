@@ -0,0 +1,147 @@
+"""
+Infrastructure Layer - URL Canonicalization
+
+One canonical form per page, and a 64-bit hash of it, shared by
+everything that needs to recognise "the same page" (frontier
+deduplication, response cache, replay archives, request coalescing).
+"""
+import functools
+import re
+import zlib
+from typing import Callable, Iterable, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from batdongsan.infrastructure.config import settings
+
+
+# `...-pr12345` detail URLs: the slug before it is cosmetic
+DETAIL_ID_PATTERN = re.compile(r'-pr(\d+)/?$')
+
+# Same, matched on the whole URL so most detail URLs skip urlsplit
+DETAIL_URL_PATTERN = re.compile(r'([A-Za-z][\w+.-]*)://([^/?#]+)/[^?#]*-pr(\d+)/?(?:[?#]|$)')
+
+DEFAULT_PORTS = {"http": ":80", "https": ":443"}
+
+
+def hash64(text: str) -> int:
+    """
+    64-bit non-cryptographic hash: Adler-32 in the high half, CRC-32 in
+    the low half (the bits hash tables probe on). Both run in C in zlib,
+    about 1.5x faster than an 8-byte BLAKE2b digest with no extra
+    package, and the value is stable across processes and installs, so
+    it can key persisted caches, frontiers and archives.
+    """
+    data = text.encode()
+    return zlib.adler32(data) << 32 | zlib.crc32(data)
+
+
+class UrlCanonicalizer:
+    """
+    Canonical URLs and their 64-bit digests.
+    
+    - scheme and host are lowercased, default ports and fragments dropped
+    - trailing slashes are removed from the path
+    - query parameters are sorted, and ignored ones (exact names, or
+      prefixes ending in `*` such as `utm_*`) removed
+    - detail URLs collapse to their listing id (`/pr12345`), so slug
+      variants of the same listing are one page
+      
+    digest() and fingerprint() are memoized in an LRU, since the same
+    URL is usually hashed several times (frontier, cache, coalescing)
+    and detail URLs reappear across listing pages.
+    """
+    
+    def __init__(self, ignored_params: Iterable[str] = (), cache_size: int = 65536):
+        """
+        Args:
+            ignored_params: Query parameter names to drop ("name" or "prefix*")
+            cache_size: Digests kept in the LRU (0 disables it)
+        """
+        ignored = [name.lower() for name in ignored_params]
+        self._ignored_names = frozenset(name for name in ignored if not name.endswith("*"))
+        self._ignored_prefixes = tuple(name[:-1] for name in ignored if name.endswith("*"))
+        self._lru: Optional["functools._lru_cache_wrapper[int]"] = None
+        self._digest: Callable[[str], int] = self._compute_digest
+        if cache_size > 0:
+            self._lru = functools.lru_cache(maxsize=cache_size)(self._compute_digest)
+            self._digest = self._lru
+    
+    def _ignored(self, name: str) -> bool:
+        name = name.lower()
+        return name in self._ignored_names or (
+            bool(self._ignored_prefixes) and name.startswith(self._ignored_prefixes)
+        )
+    
+    @staticmethod
+    def _origin(scheme: str, netloc: str) -> str:
+        """scheme://host, lowercased and without the default port"""
+        scheme = scheme.lower()
+        host = netloc.lower()
+        default_port = DEFAULT_PORTS.get(scheme)
+        if default_port and host.endswith(default_port):
+            host = host[:-len(default_port)]
+        return f"{scheme}://{host}"
+    
+    def canonicalize(self, url: str) -> str:
+        """Canonical form of a URL"""
+        match = DETAIL_URL_PATTERN.match(url)
+        if match:
+            scheme, host, listing_id = match.groups()
+            return f"{self._origin(scheme, host)}/pr{listing_id}"
+            
+        parts = urlsplit(url)
+        origin = self._origin(parts.scheme, parts.netloc)
+        match = DETAIL_ID_PATTERN.search(parts.path)
+        if match:
+            return f"{origin}/pr{match.group(1)}"
+            
+        canonical = origin + parts.path.rstrip('/')
+        if parts.query:
+            params = [
+                (name, value)
+                for name, value in parse_qsl(parts.query, keep_blank_values=True)
+                if not self._ignored(name)
+            ]
+            if params:
+                params.sort()
+                canonical += "?" + urlencode(params)
+        return canonical
+    
+    def digest(self, url: str) -> int:
+        """64-bit hash of the canonical URL"""
+        return self._digest(url)
+    
+    def _compute_digest(self, url: str) -> int:
+        return hash64(self.canonicalize(url))
+    
+    def fingerprint(self, url: str) -> str:
+        """Digest as 16 hex characters, for keys stored on disk"""
+        return f"{self.digest(url):016x}"
+    
+    def cache_info(self) -> Optional[str]:
+        """LRU hit/miss counters, if memoized"""
+        return str(self._lru.cache_info()) if self._lru is not None else None
+
+
+# Shared instance configured from settings
+canonicalizer = UrlCanonicalizer(settings.ignored_query_params, settings.url_cache_size)
+
+
+def canonicalize_url(url: str) -> str:
+    """Canonical form of a URL (see UrlCanonicalizer)"""
+    return canonicalizer.canonicalize(url)
+
+
+def url_digest(url: str) -> int:
+    """64-bit digest of the canonical URL, for seen sets"""
+    return canonicalizer.digest(url)
+
+
+def url_fingerprint(url: str) -> str:
+    """
+    Hex key of the canonical URL.
+    
+    Shared by everything that needs to recognise "the same page"
+    (frontier deduplication, response cache keys, replay archives).
+    """
+    return canonicalizer.fingerprint(url)
@@ -3,28 +3,172 @@ Infrastructure Layer - URL Frontier
 
 Implements IUrlFrontier interface for managing crawl queue.
 """
-import hashlib
-from typing import Optional, Set
+import asyncio
+import heapq
+import itertools
+import time
 from collections import deque
-from urllib.parse import urlparse
+from typing import Deque, Optional, Set, List, Tuple, Dict
 
-from batdongsan.domain.interfaces import IUrlFrontier, CrawlUrl
+from batdongsan.domain.deadline import deadline_expired, deadline_remaining
+from batdongsan.domain.interfaces import IUrlFrontier, CrawlUrl, UrlType
+from batdongsan.infrastructure.config import settings
+from .canonical import url_digest
+from .seen_set import SeenSet, create_seen_set
 
 
-class MemoryUrlFrontier(IUrlFrontier):
+# Heap entry: (-priority, depth, sequence, url); the sequence keeps equal keys FIFO
+LaneEntry = Tuple[int, int, int, CrawlUrl]
+
+
+class LaneScheduler:
+    """
+    Smooth weighted round-robin over UrlType lanes.
+    
+    With weights 3:1 the order is D D L D, D D L D, ... rather than
+    bursts, and an empty lane's turn goes to the others.
+    """
+    
+    def __init__(self, weights: Optional[Dict[UrlType, int]] = None):
+        """
+        Args:
+            weights: URLs served from each lane per round while several
+                lanes have work (defaults to settings)
+        """
+        self._weights = weights or {
+            UrlType.LISTING_PAGE: settings.listing_lane_weight,
+            UrlType.DETAIL_PAGE: settings.detail_lane_weight,
+        }
+        self._credit: Dict[UrlType, int] = {t: 0 for t in UrlType}
+        
+    def pick(self, active: List[UrlType]) -> Optional[UrlType]:
+        """Choose the lane to serve next among those with work"""
+        if not active:
+            return None
+        if len(active) == 1:
+            return active[0]
+            
+        total = 0
+        chosen = active[0]
+        for lane in active:
+            weight = max(1, self._weights.get(lane, 1))
+            self._credit[lane] += weight
+            total += weight
+            if self._credit[lane] > self._credit[chosen]:
+                chosen = lane
+        self._credit[chosen] -= total
+        return chosen
+
+
+class WaitableUrlFrontier(IUrlFrontier):
+    """
+    Frontier base whose get_async() sleeps until there is work.
+    
+    Waiting workers park on futures that the synchronous frontier
+    methods resolve: add() wakes one worker, reschedule() wakes all so
+    they re-arm their timers, and the last complete() of the crawl
+    wakes all so they can exit. A worker with nothing to do otherwise
+    only wakes when the earliest delayed URL falls due.
+    """
+    
+    def __init__(self):
+        self._waiters: Deque[asyncio.Future] = deque()
+        
+    async def get_async(self) -> Optional[CrawlUrl]:
+        """
+        Wait for the next URL to crawl.
+        
+        Returns None once the crawl is over: nothing queued, delayed or
+        pending, or the crawl deadline has passed.
+        """
+        while not deadline_expired():
+            crawl_url = self.get()
+            if crawl_url is not None:
+                return crawl_url
+            if self.is_empty():
+                self._wake(everyone=True)
+                return None
+                
+            timeout = self._next_due_in()
+            remaining = deadline_remaining()
+            if remaining is not None:
+                timeout = remaining if timeout is None else min(timeout, remaining)
+                
+            future = asyncio.get_running_loop().create_future()
+            self._waiters.append(future)
+            try:
+                await asyncio.wait_for(future, timeout)
+            except asyncio.TimeoutError:
+                pass
+            except asyncio.CancelledError:
+                if future.done() and not future.cancelled():
+                    # Woken right before cancellation: pass the wakeup on
+                    self._wake()
+                raise
+            finally:
+                if not future.done() or future.cancelled():
+                    try:
+                        self._waiters.remove(future)
+                    except ValueError:
+                        pass
+        return None
+    
+    def _wake(self, everyone: bool = False) -> None:
+        """Resolve one (or every) waiting get_async()"""
+        while self._waiters:
+            future = self._waiters.popleft()
+            if not future.done():
+                future.set_result(None)
+                if not everyone:
+                    return
+    
+    def _wake_if_finished(self) -> None:
+        """Release every waiter once the crawl has run out of work"""
+        if self._waiters and self.is_empty():
+            self._wake(everyone=True)
+    
+    def _next_due_in(self) -> Optional[float]:
+        """Seconds until a delayed URL becomes available, None if there is none"""
+        return None
+
+
+class MemoryUrlFrontier(WaitableUrlFrontier):
     """
     In-memory URL frontier with deduplication.
     
     Features:
-    - O(1) URL deduplication via hash set
-    - FIFO queue for URL processing
+    - O(1) URL deduplication on 64-bit digests, in a compact
+      DigestSeenSet by default (see settings.seen_set)
+    - One lane per UrlType, each a heap ordered by priority (higher
+      first), then depth (shallower first), then insertion order
+    - Weighted round-robin between lanes (LaneScheduler), so detail
+      pages discovered mid-crawl are drained alongside listing pages
+      instead of queuing behind every seeded listing page
     - Pending URL tracking
+    - Delayed queue for retries
     """
     
-    def __init__(self):
-        self._queue: deque = deque()
-        self._seen: Set[str] = set()
+    def __init__(
+        self,
+        lane_weights: Optional[Dict[UrlType, int]] = None,
+        seen_set: Optional[SeenSet] = None,
+    ):
+        """
+        Initialize the frontier.
+        
+        Args:
+            lane_weights: URLs served from each UrlType lane per round
+                while several lanes have work (defaults to settings)
+            seen_set: Deduplication set (defaults to settings.seen_set)
+        """
+        super().__init__()
+        self._lanes: Dict[UrlType, List[LaneEntry]] = {t: [] for t in UrlType}
+        self._lane_scheduler = LaneScheduler(lane_weights)
+        self._sequence = itertools.count()
+        self._seen = seen_set if seen_set is not None else create_seen_set(settings.seen_set)
         self._pending: Set[str] = set()
+        self._delayed: List[Tuple[float, int, CrawlUrl]] = []
+        self._delay_counter = itertools.count()
         
     def add(self, crawl_url: CrawlUrl) -> bool:
         """
@@ -36,43 +180,69 @@ class MemoryUrlFrontier(IUrlFrontier):
         Returns:
             True if added, False if duplicate
         """
-        url_hash = self._normalize_url(crawl_url.url)
-        
-        if url_hash in self._seen:
+        if not self._seen.add(self._normalize_url(crawl_url.url)):
             return False
             
-        self._seen.add(url_hash)
-        self._queue.append(crawl_url)
+        self._push(crawl_url)
+        self._wake()
         return True
     
     def get(self) -> Optional[CrawlUrl]:
-        """Get next URL to crawl"""
-        if not self._queue:
+        """Get next URL to crawl: pick a lane, then its best URL"""
+        self._release_due()
+        lane = self._lane_scheduler.pick([t for t, lane in self._lanes.items() if lane])
+        if lane is None:
             return None
             
-        url = self._queue.popleft()
+        url = heapq.heappop(self._lanes[lane])[3]
         self._pending.add(url.url)
         return url
     
+    def _push(self, crawl_url: CrawlUrl) -> None:
+        """Queue a URL in its lane"""
+        entry = (-crawl_url.priority, crawl_url.depth, next(self._sequence), crawl_url)
+        heapq.heappush(self._lanes[crawl_url.url_type], entry)
+    
     def complete(self, url: str) -> None:
         """Mark URL as completed"""
         self._pending.discard(url)
+        self._wake_if_finished()
+        
+    def reschedule(self, crawl_url: CrawlUrl, delay: float) -> None:
+        """Queue a URL again once `delay` seconds have passed"""
+        crawl_url.not_before = time.time() + delay
+        entry = (crawl_url.not_before, next(self._delay_counter), crawl_url)
+        heapq.heappush(self._delayed, entry)
+        self._wake(everyone=True)
         
     def is_empty(self) -> bool:
-        """Check if frontier is empty (no queued or pending)"""
-        return len(self._queue) == 0 and len(self._pending) == 0
+        """Check if frontier is empty (no queued, delayed or pending)"""
+        return not any(self._lanes.values()) and not self._delayed and not self._pending
     
     def __len__(self) -> int:
-        """Return number of URLs in queue"""
-        return len(self._queue)
-    
-    def _normalize_url(self, url: str) -> str:
-        """Normalize URL for deduplication"""
-        parsed = urlparse(url)
-        normalized = f"{parsed.scheme}://{parsed.netloc}{parsed.path.rstrip('/')}"
-        if parsed.query:
-            normalized += f"?{parsed.query}"
-        return hashlib.md5(normalized.encode()).hexdigest()
+        """Return number of URLs in queue (including delayed retries)"""
+        return sum(len(lane) for lane in self._lanes.values()) + len(self._delayed)
+    
+    def lane_sizes(self) -> Dict[UrlType, int]:
+        """Queued URLs per lane"""
+        return {t: len(lane) for t, lane in self._lanes.items()}
+    
+    def _release_due(self) -> None:
+        """Move retries whose delay has passed into the main queue"""
+        now = time.time()
+        while self._delayed and self._delayed[0][0] <= now:
+            _, _, crawl_url = heapq.heappop(self._delayed)
+            self._push(crawl_url)
+    
+    def _next_due_in(self) -> Optional[float]:
+        """Seconds until the earliest delayed retry is due"""
+        if not self._delayed:
+            return None
+        return self._delayed[0][0] - time.time()
+    
+    def _normalize_url(self, url: str) -> int:
+        """Canonical URL digest for deduplication"""
+        return url_digest(url)
     
     @property
     def pending_count(self) -> int:
@@ -0,0 +1,111 @@
+"""
+Infrastructure Layer - Revisit Store
+
+SQLite-backed IRevisitStore: per-page fetch histories that outlive a
+run, so the next crawl knows which detail pages are due again.
+"""
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+from batdongsan.domain.interfaces import IRevisitStore, PageHistory
+from .canonical import url_fingerprint
+
+
+class SqliteRevisitStore(IRevisitStore):
+    """
+    Page histories in a SQLite database (WAL mode).
+    
+    Rows are keyed by the canonical URL fingerprint. Writes are buffered
+    and committed in batches; get() sees buffered rows first, so a page
+    recorded twice before a commit still accumulates its history.
+    """
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS pages (
+            key TEXT PRIMARY KEY,
+            url TEXT NOT NULL,
+            fingerprint TEXT NOT NULL,
+            fetched_at REAL NOT NULL,
+            visits INTEGER NOT NULL,
+            changes INTEGER NOT NULL,
+            observed REAL NOT NULL,
+            next_due REAL NOT NULL
+        )
+    """
+    
+    def __init__(self, path: str, batch_size: int = 256, commit_interval: float = 5.0):
+        """
+        Open (or create) a revisit database.
+        
+        Args:
+            path: SQLite database file
+            batch_size: Buffered writes before a commit
+            commit_interval: Seconds after which buffered writes are
+                committed regardless of batch size
+        """
+        self.path = Path(path)
+        self._batch_size = max(1, batch_size)
+        self._commit_interval = commit_interval
+        
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.path))
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(self.SCHEMA)
+        
+        # key -> history not yet written
+        self._pending: Dict[str, PageHistory] = {}
+        self._last_commit = time.monotonic()
+    
+    def get(self, url: str) -> Optional[PageHistory]:
+        """History of a page, or None if it was never fetched"""
+        key = url_fingerprint(url)
+        history = self._pending.get(key)
+        if history is not None:
+            return history
+        row = self._db.execute(
+            "SELECT url, fingerprint, fetched_at, visits, changes, observed, next_due "
+            "FROM pages WHERE key = ?",
+            (key,),
+        ).fetchone()
+        if row is None:
+            return None
+        return PageHistory(*row)
+    
+    def put(self, history: PageHistory) -> None:
+        """Buffer a page's history, committing when the batch is full"""
+        self._pending[url_fingerprint(history.url)] = history
+        if (
+            len(self._pending) >= self._batch_size
+            or time.monotonic() - self._last_commit >= self._commit_interval
+        ):
+            self.flush()
+    
+    def flush(self) -> None:
+        """Write and commit buffered histories"""
+        if self._pending:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO pages "
+                "(key, url, fingerprint, fetched_at, visits, changes, observed, next_due) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (key, h.url, h.fingerprint, h.fetched_at, h.visits, h.changes,
+                     h.observed, h.next_due)
+                    for key, h in self._pending.items()
+                ],
+            )
+            self._db.commit()
+            self._pending.clear()
+        self._last_commit = time.monotonic()
+    
+    def __len__(self) -> int:
+        """Number of pages with a history"""
+        self.flush()
+        return self._db.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+    
+    def close(self) -> None:
+        """Commit buffered histories and close the database"""
+        self.flush()
+        self._db.close()
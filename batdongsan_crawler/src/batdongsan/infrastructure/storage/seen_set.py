@@ -0,0 +1,157 @@
+"""
+Infrastructure Layer - Seen Sets
+
+Compact membership structures for URL deduplication, keyed by 64-bit
+URL digests (see url_digest) instead of hex strings.
+"""
+import math
+import sys
+from abc import ABC, abstractmethod
+from array import array
+from typing import Set
+
+
+class SeenSet(ABC):
+    """Set of 64-bit digests that only grows"""
+    
+    @abstractmethod
+    def add(self, digest: int) -> bool:
+        """
+        Record a digest.
+        
+        Returns:
+            True if it was new, False if already present
+        """
+        pass
+    
+    @abstractmethod
+    def __contains__(self, digest: int) -> bool:
+        pass
+    
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+    
+    @property
+    @abstractmethod
+    def nbytes(self) -> int:
+        """Approximate memory held"""
+        pass
+
+
+class PySeenSet(SeenSet):
+    """Plain Python set of ints: fastest, about 60-90 bytes per entry"""
+    
+    def __init__(self):
+        self._items: Set[int] = set()
+    
+    def add(self, digest: int) -> bool:
+        if digest in self._items:
+            return False
+        self._items.add(digest)
+        return True
+    
+    def __contains__(self, digest: int) -> bool:
+        return digest in self._items
+    
+    def __len__(self) -> int:
+        return len(self._items)
+    
+    @property
+    def nbytes(self) -> int:
+        # Table plus one int object per entry (digests are all >= 2**30)
+        return sys.getsizeof(self._items) + len(self._items) * sys.getsizeof(2 ** 63)
+
+
+class DigestSeenSet(SeenSet):
+    """
+    Open-addressing hash table of 64-bit digests in one array('Q').
+    
+    Linear probing on the low bits of the digest (already uniformly
+    distributed, so no further hashing), slot value 0 meaning empty.
+    The table doubles when more than `max_load` full, so it holds
+    8 / load bytes per entry: 13-27 bytes instead of a set's 60-90.
+    Exact for distinct digests; two URLs colliding in 64 bits (about
+    3e-6 odds across 10M URLs) would be taken as one.
+    """
+    
+    def __init__(self, capacity: int = 1 << 16, max_load: float = 0.6):
+        """
+        Args:
+            capacity: Entries expected before the first resize
+            max_load: Fill ratio that triggers doubling
+        """
+        self._max_load = max_load
+        self._count = 0
+        self._allocate(1 << max(4, math.ceil(math.log2(capacity / max_load))))
+    
+    def _allocate(self, size: int) -> None:
+        self._slots = array('Q', bytes(8 * size))
+        self._mask = size - 1
+        self._limit = int(size * self._max_load)
+    
+    def add(self, digest: int) -> bool:
+        digest = digest or 1
+        slots = self._slots
+        mask = self._mask
+        i = digest & mask
+        while True:
+            value = slots[i]
+            if value == 0:
+                break
+            if value == digest:
+                return False
+            i = (i + 1) & mask
+            
+        slots[i] = digest
+        self._count += 1
+        if self._count > self._limit:
+            self._grow()
+        return True
+    
+    def __contains__(self, digest: int) -> bool:
+        digest = digest or 1
+        slots = self._slots
+        mask = self._mask
+        i = digest & mask
+        while True:
+            value = slots[i]
+            if value == digest:
+                return True
+            if value == 0:
+                return False
+            i = (i + 1) & mask
+    
+    def _grow(self) -> None:
+        """Double the table and reinsert every digest"""
+        old = self._slots
+        self._allocate(len(old) * 2)
+        slots = self._slots
+        mask = self._mask
+        for digest in old:
+            if digest:
+                i = digest & mask
+                while slots[i]:
+                    i = (i + 1) & mask
+                slots[i] = digest
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    @property
+    def nbytes(self) -> int:
+        return self._slots.itemsize * len(self._slots)
+
+
+SEEN_SETS = {
+    "set": PySeenSet,
+    "digest": DigestSeenSet,
+}
+
+
+def create_seen_set(kind: str) -> SeenSet:
+    """Build the exact seen set named in settings ("set" or "digest")"""
+    try:
+        return SEEN_SETS[kind]()
+    except KeyError:
+        raise ValueError(f"Unknown seen set: {kind}") from None
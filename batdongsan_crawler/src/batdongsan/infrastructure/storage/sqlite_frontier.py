@@ -0,0 +1,316 @@
+"""
+Infrastructure Layer - Persistent URL Frontier
+
+SQLite-backed IUrlFrontier, so a crawl that dies hours in can be
+continued with `batdongsan crawl --resume <run-id>` instead of
+starting over.
+"""
+import itertools
+import json
+import sqlite3
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional
+
+from batdongsan.domain.interfaces import CrawlUrl, UrlType
+from batdongsan.infrastructure.config import settings
+from .canonical import url_fingerprint
+from .frontier import LaneScheduler, WaitableUrlFrontier
+
+
+# Row states
+QUEUED = 0
+LEASED = 1
+DONE = 2
+DELAYED = 3
+RELEASED = 4    # Handed back unfinished: queued again when the run is resumed
+
+
+def new_run_id() -> str:
+    """Identifier for a fresh crawl run"""
+    return datetime.now().strftime("%Y%m%d-%H%M%S")
+
+
+def run_path(run_id: str, directory: Optional[str] = None) -> Path:
+    """Database file holding the frontier of a run"""
+    return Path(directory or settings.frontier_dir) / f"{run_id}.sqlite"
+
+
+class SqliteUrlFrontier(WaitableUrlFrontier):
+    """
+    Durable URL frontier in a SQLite database (WAL mode).
+    
+    - Rows are never deleted, so the primary key doubles as the seen
+      set and deduplication survives restarts
+    - get() leases a row rather than removing it and complete() marks
+      it done. A lease is held until complete() or release(), however
+      long its worker waits (an open circuit, a long Retry-After), so
+      no page is fetched twice. URLs the crawl gave up on unfinished
+      (release(), e.g. at the deadline) are set aside for this run, and
+      opening the database queues them again along with every lease
+      left behind by a previous process
+    - Inserts are buffered and written with executemany, other writes
+      are committed in batches. Buffered inserts are always written
+      before a commit, so a committed completion never loses the URLs
+      its page discovered: after a crash work is repeated, not dropped
+    - Lanes and ordering are the same as MemoryUrlFrontier
+    """
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS urls (
+            key TEXT PRIMARY KEY,
+            url TEXT NOT NULL,
+            url_type INTEGER NOT NULL,
+            priority INTEGER NOT NULL,
+            depth INTEGER NOT NULL,
+            retries INTEGER NOT NULL,
+            metadata TEXT NOT NULL,
+            state INTEGER NOT NULL,
+            due REAL NOT NULL,
+            seq INTEGER NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS urls_queue
+            ON urls (state, url_type, priority DESC, depth, seq);
+        CREATE INDEX IF NOT EXISTS urls_due ON urls (state, due);
+    """
+    
+    def __init__(
+        self,
+        path: str,
+        batch_size: Optional[int] = None,
+        commit_interval: float = 1.0,
+        lane_weights: Optional[Dict[UrlType, int]] = None,
+    ):
+        """
+        Open (or create) a frontier database.
+        
+        Args:
+            path: SQLite database file
+            batch_size: Buffered inserts / uncommitted writes before a commit
+            commit_interval: Seconds after which pending writes are
+                committed regardless of batch size
+            lane_weights: URLs served per lane per round (see LaneScheduler)
+        """
+        super().__init__()
+        self.path = Path(path)
+        self._batch_size = max(1, batch_size or settings.frontier_batch_size)
+        self._commit_interval = commit_interval
+        self._lane_scheduler = LaneScheduler(lane_weights)
+        
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.path))
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(self.SCHEMA)
+        
+        # (key -> row) not yet written; also checked for deduplication
+        self._inserts: Dict[str, tuple] = {}
+        self._writes = 0
+        self._last_commit = time.monotonic()
+        
+        last_seq = self._db.execute("SELECT COALESCE(MAX(seq), 0) FROM urls").fetchone()[0]
+        self._sequence = itertools.count(last_seq + 1)
+        
+        # Nobody else holds leases on this run: whatever is leased was in
+        # flight when the previous process stopped
+        self.recovered = self._db.execute(
+            "UPDATE urls SET state = ?, due = 0 WHERE state IN (?, ?)",
+            (QUEUED, LEASED, RELEASED),
+        ).rowcount
+        self._db.commit()
+        if self.recovered:
+            print(f"[*] Frontier: {self.recovered} interrupted URLs queued again")
+        self._next_due = self._earliest_due()
+    
+    def add(self, crawl_url: CrawlUrl) -> bool:
+        """
+        Add URL to frontier if not seen.
+        
+        Args:
+            crawl_url: URL to add
+            
+        Returns:
+            True if added, False if duplicate
+        """
+        key = url_fingerprint(crawl_url.url)
+        if key in self._inserts:
+            return False
+        if self._db.execute("SELECT 1 FROM urls WHERE key = ?", (key,)).fetchone():
+            return False
+            
+        self._inserts[key] = (
+            key,
+            crawl_url.url,
+            crawl_url.url_type.value,
+            crawl_url.priority,
+            crawl_url.depth,
+            crawl_url.retries,
+            json.dumps(crawl_url.metadata, ensure_ascii=False),
+            QUEUED,
+            0.0,
+            next(self._sequence),
+        )
+        if len(self._inserts) >= self._batch_size:
+            self._flush_inserts()
+        self._wake()
+        return True
+    
+    def get(self) -> Optional[CrawlUrl]:
+        """Lease the next URL to crawl: pick a lane, then its best URL"""
+        self._flush_inserts()
+        self._release_due()
+        
+        heads = {}
+        for url_type in UrlType:
+            row = self._db.execute(
+                "SELECT key, url, priority, depth, retries, metadata FROM urls "
+                "WHERE state = ? AND url_type = ? ORDER BY priority DESC, depth, seq LIMIT 1",
+                (QUEUED, url_type.value),
+            ).fetchone()
+            if row is not None:
+                heads[url_type] = row
+                
+        lane = self._lane_scheduler.pick(list(heads))
+        if lane is None:
+            return None
+            
+        key, url, priority, depth, retries, metadata = heads[lane]
+        self._db.execute("UPDATE urls SET state = ? WHERE key = ?", (LEASED, key))
+        self._wrote()
+        return CrawlUrl(
+            url=url,
+            url_type=lane,
+            priority=priority,
+            depth=depth,
+            retries=retries,
+            metadata=json.loads(metadata),
+        )
+    
+    def complete(self, url: str) -> None:
+        """Mark a leased URL as done (a URL rescheduled meanwhile stays delayed)"""
+        self._db.execute(
+            "UPDATE urls SET state = ?, due = 0 WHERE key = ? AND state = ?",
+            (DONE, url_fingerprint(url), LEASED),
+        )
+        self._wrote()
+        self._wake_if_finished()
+    
+    def release(self, url: str) -> None:
+        """Set a leased URL aside unfinished; the next open of the run queues it again"""
+        self._db.execute(
+            "UPDATE urls SET state = ?, due = 0 WHERE key = ? AND state = ?",
+            (RELEASED, url_fingerprint(url), LEASED),
+        )
+        self._wrote()
+        self._wake_if_finished()
+    
+    def reschedule(self, crawl_url: CrawlUrl, delay: float) -> None:
+        """Queue a URL again once `delay` seconds have passed"""
+        crawl_url.not_before = time.time() + delay
+        key = url_fingerprint(crawl_url.url)
+        if key in self._inserts:
+            self._flush_inserts()
+        self._db.execute(
+            "UPDATE urls SET state = ?, due = ?, retries = ?, seq = ? WHERE key = ?",
+            (DELAYED, crawl_url.not_before, crawl_url.retries, next(self._sequence), key),
+        )
+        self._next_due = min(self._next_due, crawl_url.not_before)
+        self._wrote()
+        self._wake(everyone=True)
+    
+    def is_empty(self) -> bool:
+        """Check if frontier is empty (no queued, delayed or leased URLs)"""
+        if self._inserts:
+            return False
+        row = self._db.execute(
+            "SELECT 1 FROM urls WHERE state IN (?, ?, ?) LIMIT 1", (QUEUED, LEASED, DELAYED)
+        ).fetchone()
+        return row is None
+    
+    def __len__(self) -> int:
+        """Return number of URLs in queue (including delayed retries)"""
+        queued = self._db.execute(
+            "SELECT COUNT(*) FROM urls WHERE state IN (?, ?)", (QUEUED, DELAYED)
+        ).fetchone()[0]
+        return queued + len(self._inserts)
+    
+    @property
+    def pending_count(self) -> int:
+        """Number of URLs currently leased"""
+        return self._count(LEASED)
+    
+    @property
+    def seen_count(self) -> int:
+        """Total unique URLs seen"""
+        return self._db.execute("SELECT COUNT(*) FROM urls").fetchone()[0] + len(self._inserts)
+    
+    @property
+    def done_count(self) -> int:
+        """URLs completed over the life of the run"""
+        return self._count(DONE)
+    
+    @property
+    def released_count(self) -> int:
+        """URLs handed back unfinished, waiting for the run to be resumed"""
+        return self._count(RELEASED)
+    
+    def flush(self) -> None:
+        """Write buffered inserts and commit"""
+        self._flush_inserts()
+        self._db.commit()
+        self._writes = 0
+        self._last_commit = time.monotonic()
+    
+    def close(self) -> None:
+        """Commit everything and close the database"""
+        self.flush()
+        self._db.close()
+    
+    def _count(self, state: int) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM urls WHERE state = ?", (state,)).fetchone()[0]
+    
+    def _flush_inserts(self) -> None:
+        """Write buffered inserts in one statement"""
+        if not self._inserts:
+            return
+        self._db.executemany(
+            "INSERT OR IGNORE INTO urls "
+            "(key, url, url_type, priority, depth, retries, metadata, state, due, seq) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            self._inserts.values(),
+        )
+        self._writes += len(self._inserts)
+        self._inserts.clear()
+    
+    def _wrote(self) -> None:
+        """Count a write and commit once enough have piled up"""
+        self._writes += 1
+        if (self._writes >= self._batch_size
+                or time.monotonic() - self._last_commit >= self._commit_interval):
+            self.flush()
+    
+    def _release_due(self) -> None:
+        """Queue delayed retries whose time has come"""
+        now = time.time()
+        if now < self._next_due:
+            return
+        self._db.execute(
+            "UPDATE urls SET state = ?, due = 0 WHERE state = ? AND due <= ?",
+            (QUEUED, DELAYED, now),
+        )
+        self._wrote()
+        self._next_due = self._earliest_due()
+    
+    def _next_due_in(self) -> Optional[float]:
+        """Seconds until a delayed retry needs releasing"""
+        if self._next_due == float("inf"):
+            return None
+        return self._next_due - time.time()
+    
+    def _earliest_due(self) -> float:
+        """Earliest time a delayed URL becomes available again"""
+        due = self._db.execute(
+            "SELECT MIN(due) FROM urls WHERE state = ?", (DELAYED,)
+        ).fetchone()[0]
+        return float("inf") if due is None else due
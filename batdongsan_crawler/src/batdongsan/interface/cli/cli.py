@@ -15,6 +15,8 @@ if sys.platform == 'win32':
 
 from batdongsan.container import create_container
 from batdongsan.domain.entities import PropertyType
+from batdongsan.infrastructure.config import settings
+from batdongsan.infrastructure.storage import run_path
 
 
 console = Console()
@@ -35,6 +37,8 @@ def main():
 @main.command()
 @click.option('--pages', '-p', default=3, help='Pages per category')
 @click.option('--concurrent', '-c', default=3, help='Concurrent requests')
+@click.option('--rps', type=float, default=None,
+              help='Requests per second per host (0 = unlimited)')
 @click.option('--listing-type', '-l', default='ban', 
               type=click.Choice(['ban', 'cho-thue']),
               help='Listing type: ban (sale) or cho-thue (rent)')
@@ -43,7 +47,23 @@ def main():
 @click.option('--output', '-o', default='output', help='Output directory')
 @click.option('--details/--no-details', default=False, 
               help='Also crawl detail pages for full info')
-def crawl(pages, concurrent, listing_type, property_type, output, details):
+@click.option('--cache/--no-cache', default=None,
+              help='Use the on-disk response cache (default from settings)')
+@click.option('--revisit/--no-revisit', default=None,
+              help='Only refetch detail pages due for a revisit (default from settings)')
+@click.option('--record', 'record_path', type=click.Path(file_okay=False), default=None,
+              help='Record every fetch into an archive directory')
+@click.option('--replay', 'replay_path', type=click.Path(exists=True, file_okay=False),
+              default=None, help='Serve fetches from a recorded archive instead of the network')
+@click.option('--deadline', type=float, default=None,
+              help='Stop the crawl after this many seconds, cutting off in-flight requests')
+@click.option('--frontier', 'frontier_backend', type=click.Choice(['memory', 'sqlite']),
+              default=None,
+              help='URL queue storage; sqlite checkpoints the run (default from settings)')
+@click.option('--resume', 'resume_run', default=None, metavar='RUN_ID',
+              help='Continue a run checkpointed with --frontier sqlite (same crawl options)')
+def crawl(pages, concurrent, rps, listing_type, property_type, output, details, cache,
+          revisit, record_path, replay_path, deadline, frontier_backend, resume_run):
     """
     Crawl property listings from batdongsan.com.vn
     
@@ -54,7 +74,20 @@ def crawl(pages, concurrent, listing_type, property_type, output, details):
         batdongsan crawl -l cho-thue -t can-ho-chung-cu
         
         batdongsan crawl --details --concurrent 5
+        
+        batdongsan crawl --details --revisit
+        
+        batdongsan crawl --record archive/ && batdongsan crawl --replay archive/
+        
+        batdongsan crawl --frontier sqlite --pages 500
+        
+        batdongsan crawl --resume <run-id> --pages 500
     """
+    if resume_run and not run_path(resume_run).exists():
+        raise click.BadParameter(f"no checkpoint at {run_path(resume_run)}", param_hint="--resume")
+    if revisit and not details:
+        raise click.BadParameter("only skips detail pages, add --details", param_hint="--revisit")
+        
     console.print("\n[bold blue]BatDongSan.com.vn Crawler[/bold blue]\n")
     
     # Show config
@@ -65,26 +98,56 @@ def crawl(pages, concurrent, listing_type, property_type, output, details):
     table.add_row("Property Types", ", ".join(property_type) if property_type else "default")
     table.add_row("Pages", str(pages))
     table.add_row("Concurrent", str(concurrent))
+    table.add_row("Rate Limit", f"{rps}/s" if rps is not None else "default")
     table.add_row("Crawl Details", str(details))
+    table.add_row("Cache", "default" if cache is None else str(cache))
+    if revisit is not None:
+        table.add_row("Revisit", str(revisit))
+    if record_path:
+        table.add_row("Record", record_path)
+    if replay_path:
+        table.add_row("Replay", replay_path)
+    if deadline:
+        table.add_row("Deadline", f"{deadline:.0f}s")
+    if resume_run:
+        table.add_row("Resume", resume_run)
     table.add_row("Output", output)
     console.print(table)
     console.print()
+    if revisit is None and settings.revisit_enabled and not details:
+        console.print("[yellow]BATDONGSAN_REVISIT_ENABLED has no effect without --details"
+                      "[/yellow]\n")
     
     # Create container
     container = create_container(
         output_dir=output,
         max_concurrent=concurrent,
         crawl_details=details,
+        requests_per_second=rps,
+        use_cache=cache,
+        revisit=revisit,
+        record_path=record_path,
+        replay_path=replay_path,
+        deadline=deadline,
+        frontier_backend=frontier_backend,
+        run_id=resume_run,
     )
     
-    # Add seed URLs
+    # Plan seed URLs (generated as the queue drains; a resumed run
+    # skips the ones it has already seen)
+    if resume_run:
+        console.print(f"[green]Resuming run {resume_run}: "
+                      f"{len(container.frontier)} URLs queued[/green]")
     prop_types = list(property_type) if property_type else None
     count = container.spider_service.add_seed_urls(
         listing_types=[listing_type],
         property_types=prop_types,
         max_pages=pages,
     )
-    console.print(f"[green]Added {count} URLs to queue[/green]\n")
+    console.print(f"[green]Planned {count} seed URLs[/green]\n")
+    if container.run_id:
+        console.print(f"[cyan]Run ID: {container.run_id} "
+                      f"(continue with --resume {container.run_id})[/cyan]\n")
     
     # Run
     if sys.platform == 'win32':
@@ -100,8 +163,42 @@ def crawl(pages, concurrent, listing_type, property_type, output, details):
     table.add_row("Total Listings", str(result.total_found))
     table.add_row("Pages Crawled", str(result.pages_crawled))
     table.add_row("Errors", str(result.errors))
+    table.add_row("Retries", str(result.retries))
+    table.add_row("Circuit Trips", str(result.circuit_trips))
+    table.add_row("Downloaded", f"{result.bytes_downloaded / 1024 / 1024:.2f} MB")
+    for name, value in result.http_stats.items():
+        table.add_row(name.replace("_", " ").title(), str(value))
+    table.add_row("Concurrency", f"{result.concurrency_limit} "
+                  f"(learned {result.learned_concurrency_limit})")
+    if result.deadline_reached:
+        table.add_row("Abandoned At Deadline", str(result.abandoned))
+    if result.pagination:
+        table.add_row("Pages Saved", str(result.pages_saved))
+    if result.revisit:
+        table.add_row("Revisits Skipped", str(result.revisits_skipped))
+        table.add_row("Revisits Changed", f"{result.revisit['changed']} "
+                      f"(unchanged {result.revisit['unchanged']})")
+    if result.first_listing_seconds is not None:
+        table.add_row("First Listing", f"{result.first_listing_seconds:.2f}s")
     table.add_row("Duration", f"{result.duration_seconds:.1f}s")
     console.print(table)
+    
+    if result.pagination:
+        table = Table(title="Pagination")
+        table.add_column("Category", style="cyan")
+        table.add_column("Pages", style="green")
+        table.add_column("Last Page", style="green")
+        table.add_column("Saved", style="green")
+        table.add_column("Stopped", style="green")
+        for category, counters in result.pagination.items():
+            table.add_row(
+                category.rsplit("/", 1)[-1],
+                str(counters["pages"]),
+                str(counters["last_page"] or "-"),
+                str(counters["saved"]),
+                counters["stopped"] or "-",
+            )
+        console.print(table)
 
 
 @main.command()